@@ -10,17 +10,16 @@ Run:
 
     # With different style
     python examples/01_basic_music.py blues
+
+    # Every preset style in one run
+    python examples/01_basic_music.py all
 """
 
 import asyncio
 import sys
-from pathlib import Path
-
-# Add parent to path for local development
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from ai_content.core.registry import ProviderRegistry
-from ai_content.presets.music import get_preset as get_music_preset
+from ai_content.presets.music import MUSIC_PRESETS
 
 # Import providers to register them
 import ai_content.providers  # noqa: F401
@@ -32,12 +31,10 @@ async def generate_music(style: str = "jazz"):
     print(f"🎵 Generating {style} music...")
 
     # Get the preset
-    preset = get_music_preset(style)
+    preset = MUSIC_PRESETS.get(style)
     if not preset:
         print(f"❌ Unknown style: {style}")
-        print(
-            f"   Available: jazz, blues, ethiopian-jazz, cinematic, electronic, ambient, lofi, rnb"
-        )
+        print(f"   Available: {', '.join(MUSIC_PRESETS)}")
         return
 
     print(f"   Preset: {preset.name}")
@@ -60,6 +57,14 @@ async def generate_music(style: str = "jazz"):
         print(f"❌ Failed: {result.error}")
 
 
+async def generate_many(styles: list[str]):
+    """Generate several styles concurrently in one process."""
+    await asyncio.gather(*(generate_music(style) for style in styles))
+
+
 if __name__ == "__main__":
     style = sys.argv[1] if len(sys.argv) > 1 else "jazz"
-    asyncio.run(generate_music(style))
+    if style == "all":
+        asyncio.run(generate_many(list(MUSIC_PRESETS)))
+    else:
+        asyncio.run(generate_music(style))
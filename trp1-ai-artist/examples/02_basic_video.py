@@ -13,12 +13,9 @@ Run:
 
 import asyncio
 import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from ai_content.core.registry import ProviderRegistry
-from ai_content.presets.video import get_preset as get_video_preset
+from ai_content.presets.video import VIDEO_PRESETS
 import ai_content.providers  # noqa: F401
 
 
@@ -28,10 +25,10 @@ async def generate_video(style: str = "nature"):
     print(f"🎬 Generating {style} video...")
 
     # Get the preset
-    preset = get_video_preset(style)
+    preset = VIDEO_PRESETS.get(style)
     if not preset:
         print(f"❌ Unknown style: {style}")
-        print(f"   Available: nature, urban, space, abstract, fantasy, aerial, underwater")
+        print(f"   Available: {', '.join(VIDEO_PRESETS)}")
         return
 
     print(f"   Prompt: {preset.prompt[:60]}...")
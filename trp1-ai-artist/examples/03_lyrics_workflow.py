@@ -20,14 +20,15 @@ import asyncio
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from ai_content.utils.lyrics_parser import parse_lyrics_with_structure
 from ai_content.pipelines.music import MusicPipeline
 
 # Import providers
 import ai_content.providers  # noqa: F401
 
+BANNER = "=" * 50
+SUBSEP = "-" * 40
+
 
 # Sample lyrics for demonstration
 SAMPLE_LYRICS = """
@@ -57,12 +58,13 @@ async def lyrics_workflow(lyrics_file: str | None = None):
     """Generate music with lyrics."""
 
     print("🎵 Lyrics-First Workflow Demo")
-    print("=" * 50)
+    print(BANNER)
 
     # Load lyrics
     if lyrics_file and Path(lyrics_file).exists():
         print(f"📄 Loading lyrics from: {lyrics_file}")
-        lyrics = Path(lyrics_file).read_text()
+        with open(lyrics_file, buffering=4096, encoding="utf-8") as f:
+            lyrics = f.read()
     else:
         print("📄 Using sample lyrics")
         lyrics = SAMPLE_LYRICS
@@ -76,13 +78,11 @@ async def lyrics_workflow(lyrics_file: str | None = None):
     print(f"   Style Header: {structured.style_header}")
 
     print("\n📝 Structured Lyrics Preview:")
-    print("-" * 40)
+    print(SUBSEP)
     # Show first few lines
     preview_lines = structured.structured.split("\n")[:15]
-    for line in preview_lines:
-        print(f"   {line}")
-    print("   ...")
-    print("-" * 40)
+    sys.stdout.write("".join(f"   {line}\n" for line in preview_lines) + "   ...\n")
+    print(SUBSEP)
 
     # Generate music with MusicPipeline
     print("\n🎤 Generating music with vocals...")
@@ -17,18 +17,18 @@ import asyncio
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from ai_content.core.registry import ProviderRegistry
 from ai_content.pipelines.video import VideoPipeline
 import ai_content.providers  # noqa: F401
 
+BANNER = "=" * 50
+
 
 async def image_to_video(image_path: str | None = None):
     """Animate an image into video."""
 
     print("🎬 Image-to-Video Workflow")
-    print("=" * 50)
+    print(BANNER)
 
     pipeline = VideoPipeline()
 
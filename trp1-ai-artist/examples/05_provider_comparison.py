@@ -13,73 +13,83 @@ Run:
 
 import asyncio
 import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import time
 
 from ai_content.pipelines.music import MusicPipeline
 from ai_content.pipelines.video import VideoPipeline
 import ai_content.providers  # noqa: F401
 
+BANNER = "=" * 60
+SUBSEP = "-" * 40
+
 
 async def compare_music_providers():
     """Compare music generation across providers."""
 
     print("🔬 Music Provider Comparison")
-    print("=" * 60)
+    print(BANNER)
     print("   Style: jazz")
     print("   Providers: lyria, minimax")
-    print("=" * 60)
+    print(BANNER)
 
     pipeline = MusicPipeline()
+    started = time.perf_counter()
+    # compare_providers runs the providers concurrently
     result = await pipeline.compare_providers(
         style="jazz",
         providers=["lyria", "minimax"],
         duration=20,  # Shorter for faster comparison
     )
+    elapsed = time.perf_counter() - started
 
     print("\n📊 Results:")
-    print("-" * 40)
+    print(SUBSEP)
 
+    lines = []
     for key, output in result.outputs.items():
         provider = key.replace("music_", "")
         status = "✅" if output.success else "❌"
         path = output.file_path if output.success else output.error[:50]
-        print(f"   {status} {provider}: {path}")
+        lines.append(f"   {status} {provider}: {path}\n")
+    sys.stdout.write("".join(lines))
 
-    print("-" * 40)
-    print(f"\n   Duration: {result.duration_seconds:.1f}s")
+    print(SUBSEP)
+    print(f"\n   Duration: {elapsed:.1f}s")
 
 
 async def compare_video_providers():
     """Compare video generation across providers."""
 
     print("🔬 Video Provider Comparison")
-    print("=" * 60)
+    print(BANNER)
     print("   Style: space")
     print("   Providers: veo, kling")
     print("   Note: Kling takes 5-14 minutes")
-    print("=" * 60)
+    print(BANNER)
 
     pipeline = VideoPipeline()
+    started = time.perf_counter()
     result = await pipeline.compare_providers(
         style="space",
-        providers=["veo"],  # Remove kling for faster demo
+        providers=["veo"],  # Add kling for a higher quality comparison
     )
+    elapsed = time.perf_counter() - started
 
     print("\n📊 Results:")
-    print("-" * 40)
+    print(SUBSEP)
 
+    lines = []
     for key, output in result.outputs.items():
         provider = key.replace("video_", "")
         status = "✅" if output.success else "❌"
         path = (
             output.file_path if output.success else output.error[:50] if output.error else "Unknown"
         )
-        print(f"   {status} {provider}: {path}")
+        lines.append(f"   {status} {provider}: {path}\n")
+    sys.stdout.write("".join(lines))
 
-    print("-" * 40)
-    print(f"\n   Duration: {result.duration_seconds:.1f}s")
+    print(SUBSEP)
+    print(f"\n   Duration: {elapsed:.1f}s")
 
 
 async def main(mode: str = "music"):
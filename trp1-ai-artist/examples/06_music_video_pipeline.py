@@ -14,17 +14,37 @@ Run:
 
     # Different styles
     python examples/06_music_video_pipeline.py cinematic space
+
+    # Several music videos at once (music:video pairs)
+    python examples/06_music_video_pipeline.py jazz:urban cinematic:space
 """
 
 import asyncio
+import os
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from ai_content.pipelines.full import FullContentPipeline
 import ai_content.providers  # noqa: F401
 
+BANNER = "=" * 60
+SUBSEP = "-" * 40
+
+
+def file_sizes(paths) -> dict[Path, int]:
+    """Map file paths to sizes with one scandir per parent directory."""
+    wanted: dict[Path, set[str]] = {}
+    for path in paths:
+        wanted.setdefault(path.parent, set()).add(path.name)
+
+    sizes = {}
+    for parent, names in wanted.items():
+        with os.scandir(parent) as entries:
+            for entry in entries:
+                if entry.name in names:
+                    sizes[parent / entry.name] = entry.stat().st_size
+    return sizes
+
 
 async def create_music_video(
     music_style: str = "jazz",
@@ -33,10 +53,10 @@ async def create_music_video(
     """Generate a complete music video."""
 
     print("🎬 Full Music Video Pipeline")
-    print("=" * 60)
+    print(BANNER)
     print(f"   Music Style: {music_style}")
     print(f"   Video Style: {video_style}")
-    print("=" * 60)
+    print(BANNER)
 
     pipeline = FullContentPipeline()
 
@@ -49,17 +69,25 @@ async def create_music_video(
     )
 
     print("\n📊 Pipeline Results:")
-    print("-" * 40)
+    print(SUBSEP)
+
+    sizes = file_sizes(
+        output.file_path
+        for output in result.outputs.values()
+        if output.success and output.file_path
+    )
 
+    lines = []
     for key, output in result.outputs.items():
         status = "✅" if output.success else "❌"
         if output.success and output.file_path:
-            size_mb = output.file_path.stat().st_size / (1024 * 1024)
-            print(f"   {status} {key}: {output.file_path.name} ({size_mb:.1f} MB)")
+            size_mb = sizes.get(output.file_path, 0) / (1024 * 1024)
+            lines.append(f"   {status} {key}: {output.file_path.name} ({size_mb:.1f} MB)\n")
         elif output.error:
-            print(f"   {status} {key}: {output.error[:60]}")
+            lines.append(f"   {status} {key}: {output.error[:60]}\n")
+    sys.stdout.write("".join(lines))
 
-    print("-" * 40)
+    print(SUBSEP)
     print(f"   Total Duration: {result.duration_seconds:.1f}s")
     print(f"   Output Files: {len(result.output_files)}")
 
@@ -69,7 +97,19 @@ async def create_music_video(
             print(f"   → {path}")
 
 
+async def create_music_videos(pairs: list[tuple[str, str]]):
+    """Generate several music videos concurrently."""
+    async with asyncio.TaskGroup() as tg:
+        for music_style, video_style in pairs:
+            tg.create_task(create_music_video(music_style, video_style))
+
+
 if __name__ == "__main__":
-    music = sys.argv[1] if len(sys.argv) > 1 else "jazz"
-    video = sys.argv[2] if len(sys.argv) > 2 else "urban"
-    asyncio.run(create_music_video(music, video))
+    args = sys.argv[1:]
+    if args and all(":" in arg for arg in args):
+        pairs = [tuple(arg.split(":", 1)) for arg in args]
+        asyncio.run(create_music_videos(pairs))
+    else:
+        music = args[0] if len(args) > 0 else "jazz"
+        video = args[1] if len(args) > 1 else "urban"
+        asyncio.run(create_music_video(music, video))
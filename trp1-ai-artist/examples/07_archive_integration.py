@@ -13,22 +13,27 @@ Run:
 
 import asyncio
 import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from ai_content.integrations.archive import ArchiveOrgSource
 
+BANNER = "=" * 60
+SUBSEP = "-" * 40
+
 
 async def search_archive(query: str = "1930s jazz recordings"):
     """Search Archive.org for content."""
 
     print("🔍 Archive.org Integration Demo")
-    print("=" * 60)
+    print(BANNER)
     print(f"   Query: {query}")
-    print("=" * 60)
+    print(BANNER)
+
+    async with ArchiveOrgSource() as source:
+        await show_results(source, query)
 
-    source = ArchiveOrgSource()
+
+async def show_results(source: ArchiveOrgSource, query: str):
+    """Search, then fetch details for the top results."""
 
     # Search
     print("\n📚 Searching...")
@@ -47,14 +52,18 @@ async def search_archive(query: str = "1930s jazz recordings"):
         print(f"      URL: {item.archive_url}")
         print()
 
-    # Get detailed metadata for first result
-    print("-" * 40)
-    print(f"\n📦 Fetching details for: {results[0].identifier}")
+    # Get detailed metadata for the top results (fetched concurrently)
+    top = results[:3]
+    print(SUBSEP)
+    print(f"\n📦 Fetching details for: {', '.join(item.identifier for item in top)}")
+
+    details = await source.get_metadata_many([item.identifier for item in top])
 
-    metadata = await source.get_metadata(results[0].identifier)
+    for metadata in details:
+        if not metadata:
+            continue
 
-    if metadata:
-        print(f"   Title: {metadata.title}")
+        print(f"\n   Title: {metadata.title}")
         print(
             f"   Description: {metadata.description[:100]}..."
             if metadata.description
@@ -10,16 +10,15 @@ Run:
 """
 
 import asyncio
-import sys
-from pathlib import Path
+import os
 from datetime import datetime, timezone
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from ai_content.core.provider import MusicProvider
 from ai_content.core.registry import ProviderRegistry
 from ai_content.core.result import GenerationResult
 
+BANNER = "=" * 60
+
 
 # Step 1: Define your custom provider class
 @ProviderRegistry.register_music("my-custom-provider")
@@ -28,8 +27,30 @@ class MyCustomMusicProvider:
     Example custom music provider.
 
     In a real implementation, this would call an actual API.
+    Keep one HTTP client per provider instance (not per call) so
+    connections are pooled across requests, as AIMLAPIClient does.
     """
 
+    def __init__(self):
+        self._http_client = None
+
+    async def _get_client(self):
+        """Get or create the shared HTTP client."""
+        import httpx
+
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                base_url="https://api.example.com",
+                timeout=60.0,
+            )
+        return self._http_client
+
+    async def close(self):
+        """Close the HTTP client."""
+        if self._http_client and not self._http_client.is_closed:
+            await self._http_client.aclose()
+            self._http_client = None
+
     @property
     def name(self) -> str:
         return "my-custom-provider"
@@ -65,16 +86,25 @@ class MyCustomMusicProvider:
         print(f"   Prompt: {prompt[:50]}...")
         print(f"   BPM: {bpm}, Duration: {duration_seconds}s")
 
-        # Simulate API call
-        await asyncio.sleep(1)
+        # Simulate API call (set AI_CONTENT_DEMO_FAST=1 to skip the wait)
+        await asyncio.sleep(0 if os.getenv("AI_CONTENT_DEMO_FAST") else 1)
 
         # In real implementation, you would:
-        # 1. Call your API
-        # response = await self.client.post("/generate", json={...})
+        # 1. Call your API on the shared client
+        # client = await self._get_client()
+        # response = await client.post("/generate", json={...})
+        #
+        #    With the "perf" extra installed, orjson serializes straight to bytes:
+        #    payload = orjson.dumps({"prompt": prompt, "bpm": bpm})
+        #    response = await client.post(
+        #        "/generate",
+        #        content=payload,
+        #        headers={"Content-Type": "application/json"},
+        #    )
         #
         # 2. Poll for completion
         # while not complete:
-        #     status = await self.client.get(f"/status/{task_id}")
+        #     status = await client.get(f"/status/{task_id}")
         #     ...
         #
         # 3. Download result
@@ -98,11 +128,11 @@ async def demo_custom_provider():
     """Demonstrate using a custom provider."""
 
     print("🔧 Custom Provider Demo")
-    print("=" * 60)
+    print(BANNER)
 
     # List all registered providers (including our custom one)
     print("\n📋 Registered Music Providers:")
-    for name in ProviderRegistry.list_music():
+    for name in ProviderRegistry.list_music_providers():
         print(f"   • {name}")
 
     # Use our custom provider
@@ -119,7 +149,7 @@ async def demo_custom_provider():
     print(f"   Provider: {result.provider}")
     print(f"   Metadata: {result.metadata}")
 
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("💡 To add your own provider:")
     print("   1. Create a class with @ProviderRegistry.register_music('name')")
     print("   2. Implement the MusicProvider protocol")
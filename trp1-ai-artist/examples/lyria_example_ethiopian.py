@@ -12,6 +12,7 @@ Usage:
     python examples/lyria_example_ethiopian.py --style ethio-jazz # Ethio-Jazz
     python examples/lyria_example_ethiopian.py --force            # Regenerate even if cached
     python examples/lyria_example_ethiopian.py --duration 60      # 60 seconds
+    python examples/lyria_example_ethiopian.py --styles ethio-jazz,tizita-blues  # Several at once
 
 Note: Lyria generates INSTRUMENTAL music only (no vocals).
       For vocals, use MiniMax via AIMLAPI.
@@ -19,9 +20,12 @@ Note: Lyria generates INSTRUMENTAL music only (no vocals).
 
 import argparse
 import asyncio
+import hashlib
+import json
 import os
+import shutil
+import struct
 import sys
-import wave
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -30,6 +34,27 @@ from google.genai import types
 
 load_dotenv()
 
+BANNER = "=" * 55
+LIST_BANNER = "=" * 60
+SUBSEP = "-" * 40
+
+LYRIA_MODEL = "models/lyria-realtime-exp"
+
+# Generated WAVs are cached by a hash of everything that shapes the audio,
+# so changing duration or prompt weights never returns a stale file.
+CACHE_DIR = Path("exports/cache")
+CACHE_MAX_FILES = 20
+
+# Lyria's output format: 48kHz, 16-bit, stereo PCM
+SAMPLE_RATE = 48000
+CHANNELS = 2
+SAMPLE_WIDTH = 2
+
+# Receive loop batching: yield to the event loop every YIELD_EVERY
+# messages and redraw the progress line every PROGRESS_EVERY chunks
+YIELD_EVERY = 32
+PROGRESS_EVERY = 100
+
 # =============================================================================
 # STYLE PRESETS - Weighted Prompts for Different Ethiopian Fusions
 # =============================================================================
@@ -116,13 +141,40 @@ STYLE_PRESETS = {
     },
 }
 
+# Build the Lyria prompt objects and display bars once at import time
+for _preset in STYLE_PRESETS.values():
+    _preset["_weighted"] = [
+        types.WeightedPrompt(text=p["text"], weight=p["weight"]) for p in _preset["prompts"]
+    ]
+    _preset["_bars"] = [
+        f"   {p['weight']:.1f} {'█' * int(p['weight'] * 10)} {p['text']}"
+        for p in _preset["prompts"]
+    ]
+
+
+def cache_key(style_key: str, preset: dict, duration: int) -> str:
+    """Hash the generation parameters into a cache key."""
+    params = {
+        "style": style_key,
+        "duration": duration,
+        "prompts": sorted((p["text"], p["weight"]) for p in preset["prompts"]),
+        "bpm": preset["bpm"],
+        "temperature": preset["temperature"],
+        "model": LYRIA_MODEL,
+    }
+    encoded = json.dumps(params, sort_keys=True).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
 
-def check_cached(output_path: Path, force: bool = False) -> bool:
-    """Check if output already exists (caching)."""
+
+def check_cached(cache_path: Path, output_path: Path, force: bool = False) -> bool:
+    """Check the cache and copy a hit to the friendly output path."""
     if force:
         return False
-    if output_path.exists():
-        size_mb = output_path.stat().st_size / 1024 / 1024
+    if cache_path.exists():
+        cache_path.touch()  # Mark as recently used
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(cache_path, output_path)
+        size_mb = cache_path.stat().st_size / 1024 / 1024
         print(f"\n✅ Using cached file: {output_path}")
         print(f"   Size: {size_mb:.2f} MB")
         print("\n   💡 Use --force to regenerate")
@@ -130,6 +182,38 @@ def check_cached(output_path: Path, force: bool = False) -> bool:
     return False
 
 
+def wav_header(data_size: int) -> bytes:
+    """Build the 44-byte RIFF/WAVE header for Lyria's PCM format."""
+    block_align = CHANNELS * SAMPLE_WIDTH
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        CHANNELS,
+        SAMPLE_RATE,
+        SAMPLE_RATE * block_align,  # Byte rate
+        block_align,
+        SAMPLE_WIDTH * 8,  # Bits per sample
+        b"data",
+        data_size,
+    )
+
+
+def evict_cache(max_files: int = CACHE_MAX_FILES) -> None:
+    """Remove the least recently used cache entries beyond max_files."""
+    entries = sorted(
+        CACHE_DIR.glob("*.wav"),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+    for path in entries[max_files:]:
+        path.unlink(missing_ok=True)
+
+
 async def generate_music(
     style_key: str = "bachata-fusion",
     duration: int = 30,
@@ -148,26 +232,26 @@ async def generate_music(
     """
     preset = STYLE_PRESETS.get(style_key, STYLE_PRESETS["bachata-fusion"])
     output_path = Path(preset["output_file"])
+    cache_path = CACHE_DIR / f"{cache_key(style_key, preset, duration)}.wav"
 
     # Check cache
-    if check_cached(output_path, force):
+    if check_cached(cache_path, output_path, force):
         return output_path
 
     print(f"🎵 {preset['name']}")
-    print("=" * 55)
+    print(BANNER)
     print(f"   Description: {preset['description']}")
     print(f"   BPM: {preset['bpm']}")
     print(f"   Duration: {duration}s")
     print(f"   Temperature: {preset['temperature']}")
-    print("=" * 55)
+    print(BANNER)
 
     # Show weighted prompts
     print("\n🎸 Weighted Prompts:")
-    print("-" * 40)
-    for p in preset["prompts"]:
-        bar = "█" * int(p["weight"] * 10)
-        print(f"   {p['weight']:.1f} {bar} {p['text']}")
-    print("-" * 40)
+    print(SUBSEP)
+    for bar in preset["_bars"]:
+        print(bar)
+    print(SUBSEP)
 
     # Get API key
     api_key = os.getenv("GEMINI_API_KEY")
@@ -179,98 +263,126 @@ async def generate_music(
     # Lyria requires v1alpha API version
     client = genai.Client(api_key=api_key, http_options={"api_version": "v1alpha"})
 
-    audio_chunks: list[bytes] = []
+    # Save as WAV, writing each chunk as it arrives instead of holding the
+    # whole stream in memory. The header goes out with a zero data size and
+    # is rewritten once the final size is known. Audio goes to a .part file
+    # that only replaces cache_path when complete, so an interrupted run
+    # never leaves a truncated file that looks like a cache hit.
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path = cache_path.with_suffix(".part")
+    fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+    total_bytes = 0
+    chunk_count = 0
     capture_done = asyncio.Event()
 
     async def receive_audio(session):
         """Receive audio from Lyria stream in dedicated coroutine."""
+        nonlocal total_bytes, chunk_count
+        message_count = 0
         try:
             async for message in session.receive():
                 if hasattr(message, "server_content") and message.server_content:
                     if hasattr(message.server_content, "audio_chunks"):
                         for chunk in message.server_content.audio_chunks:
                             if hasattr(chunk, "data") and chunk.data:
-                                audio_chunks.append(chunk.data)
-                                if len(audio_chunks) % 20 == 0:
-                                    print(f"   📊 {len(audio_chunks)} chunks received...")
-                await asyncio.sleep(0)
-                if capture_done.is_set():
-                    break
+                                os.write(fd, chunk.data)
+                                total_bytes += len(chunk.data)
+                                chunk_count += 1
+                                if chunk_count % PROGRESS_EVERY == 0:
+                                    sys.stdout.write(f"\r   📊 {chunk_count} chunks received...")
+                                    sys.stdout.flush()
+                message_count += 1
+                if message_count % YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
+                    if capture_done.is_set():
+                        break
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            print(f"   ⚠️ Receive error: {e}")
-
-    # Build weighted prompts
-    weighted_prompts = [
-        types.WeightedPrompt(text=p["text"], weight=p["weight"]) for p in preset["prompts"]
-    ]
+            print(f"\n   ⚠️ Receive error: {e}")
+        finally:
+            if chunk_count >= PROGRESS_EVERY:
+                sys.stdout.write("\n")
+                sys.stdout.flush()
 
     print("\n▶ Generating instrumental...")
 
+    receive_task = None
+    completed = False
     try:
-        async with client.aio.live.music.connect(model="models/lyria-realtime-exp") as session:
-            print("   ✓ Connected to Lyria")
-
-            # Start receiver task
-            receive_task = asyncio.create_task(receive_audio(session))
-
-            # Configure style
-            await session.set_weighted_prompts(prompts=weighted_prompts)
-            print(f"   ✓ Style configured: {preset['name']}")
-
-            # Configure generation parameters
-            await session.set_music_generation_config(
-                config=types.LiveMusicGenerationConfig(
-                    bpm=preset["bpm"],
-                    temperature=preset["temperature"],
+        os.write(fd, wav_header(0))
+        try:
+            async with client.aio.live.music.connect(model=LYRIA_MODEL) as session:
+                print("   ✓ Connected to Lyria")
+
+                # Start receiver task
+                receive_task = asyncio.create_task(receive_audio(session))
+
+                # Configure style
+                await session.set_weighted_prompts(prompts=preset["_weighted"])
+                print(f"   ✓ Style configured: {preset['name']}")
+
+                # Configure generation parameters
+                await session.set_music_generation_config(
+                    config=types.LiveMusicGenerationConfig(
+                        bpm=preset["bpm"],
+                        temperature=preset["temperature"],
+                    )
                 )
-            )
-            print(f"   ✓ BPM: {preset['bpm']}, Temp: {preset['temperature']}")
+                print(f"   ✓ BPM: {preset['bpm']}, Temp: {preset['temperature']}")
 
-            # Start streaming
-            await session.play()
-            print(f"   🎶 Streaming for {duration}s...")
+                # Start streaming
+                await session.play()
+                print(f"   🎶 Streaming for {duration}s...")
 
-            # Wait for duration
-            await asyncio.sleep(duration)
+                # Wait for duration
+                await asyncio.sleep(duration)
 
-            # Stop cleanly
-            print(f"   ⏸ Stopping ({len(audio_chunks)} chunks)")
-            capture_done.set()
-            await session.stop()
-            receive_task.cancel()
-            try:
-                await receive_task
-            except asyncio.CancelledError:
-                pass
-
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        import traceback
+                # Stop cleanly
+                print(f"   ⏸ Stopping ({chunk_count} chunks)")
+                capture_done.set()
+                await session.stop()
+                receive_task.cancel()
+                try:
+                    await receive_task
+                except asyncio.CancelledError:
+                    pass
 
-        traceback.print_exc()
-        return None
+        except Exception as e:
+            print(f"\n❌ Error: {e}")
+            import traceback
+
+            traceback.print_exc()
+            return None
+
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, wav_header(total_bytes))
+        completed = True
+    finally:
+        # Also runs on Ctrl+C or cancellation; stop the receiver before the
+        # fd is closed so it can't write to a reused descriptor
+        if receive_task is not None:
+            receive_task.cancel()
+        os.close(fd)
+        if not (completed and total_bytes):
+            part_path.unlink(missing_ok=True)
 
-    if not audio_chunks:
+    if not total_bytes:
         print("\n❌ No audio received from Lyria")
         return None
 
-    # Save as WAV (48kHz, 16-bit, stereo - Lyria's output format)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(part_path, cache_path)
 
-    audio_data = b"".join(audio_chunks)
-    with wave.open(str(output_path), "wb") as wav:
-        wav.setnchannels(2)  # Stereo
-        wav.setsampwidth(2)  # 16-bit
-        wav.setframerate(48000)  # 48kHz
-        wav.writeframes(audio_data)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(cache_path, output_path)
+    evict_cache()
 
-    size_mb = len(audio_data) / 1024 / 1024
+    size_mb = total_bytes / 1024 / 1024
 
-    print("\n" + "=" * 55)
+    print("\n" + BANNER)
     print("✅ GENERATED SUCCESSFULLY!")
-    print("=" * 55)
+    print(BANNER)
     print(f"   📁 File: {output_path}")
     print(f"   📊 Size: {size_mb:.2f} MB")
     print(f"   ⏱️  Duration: {duration}s")
@@ -283,13 +395,45 @@ async def generate_music(
 def list_styles():
     """Print available style presets."""
     print("\n🎵 Available Ethiopian Fusion Styles:")
-    print("=" * 60)
+    print(LIST_BANNER)
     for key, preset in STYLE_PRESETS.items():
         print(f"\n   {key}")
         print(f"      {preset['name']}")
         print(f"      {preset['description']}")
         print(f"      BPM: {preset['bpm']}")
-    print("\n" + "=" * 60)
+    print("\n" + LIST_BANNER)
+
+
+async def generate_many(
+    styles: list[str],
+    duration: int = 30,
+    force: bool = False,
+) -> list[Path | None]:
+    """
+    Generate several styles concurrently.
+
+    Each Lyria session mostly waits on its websocket, so running them
+    together takes roughly as long as the longest one. A semaphore caps
+    the number of open sessions to stay within rate limits.
+    """
+    sem = asyncio.Semaphore(int(os.getenv("LYRIA_CONCURRENCY", "2")))
+
+    async def generate_one(style_key: str) -> Path | None:
+        async with sem:
+            return await generate_music(style_key, duration, force)
+
+    results = await asyncio.gather(
+        *(generate_one(style_key) for style_key in styles),
+        return_exceptions=True,
+    )
+
+    paths = []
+    for style_key, result in zip(styles, results):
+        if isinstance(result, Exception):
+            print(f"\n❌ {style_key} failed: {result}")
+            result = None
+        paths.append(result)
+    return paths
 
 
 async def main():
@@ -301,6 +445,7 @@ Examples:
   python examples/lyria_example_ethiopian.py
   python examples/lyria_example_ethiopian.py --style ethio-jazz
   python examples/lyria_example_ethiopian.py --style tizita-blues --duration 45
+  python examples/lyria_example_ethiopian.py --styles ethio-jazz,tizita-blues
   python examples/lyria_example_ethiopian.py --list-styles
   python examples/lyria_example_ethiopian.py --force
         """,
@@ -311,6 +456,11 @@ Examples:
         default="bachata-fusion",
         help="Music style preset (default: bachata-fusion)",
     )
+    parser.add_argument(
+        "--styles",
+        help="Comma-separated presets to generate concurrently "
+        "(limit with LYRIA_CONCURRENCY, default: 2)",
+    )
     parser.add_argument(
         "--duration",
         type=int,
@@ -334,6 +484,14 @@ Examples:
         list_styles()
         return
 
+    if args.styles:
+        styles = [style.strip() for style in args.styles.split(",") if style.strip()]
+        unknown = [style for style in styles if style not in STYLE_PRESETS]
+        if unknown:
+            parser.error(f"unknown styles: {', '.join(unknown)}")
+        await generate_many(styles, args.duration, args.force)
+        return
+
     await generate_music(
         style_key=args.style,
         duration=args.duration,
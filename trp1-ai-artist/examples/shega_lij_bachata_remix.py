@@ -12,17 +12,17 @@ Run:
 """
 
 import asyncio
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from ai_content.pipelines.music import MusicPipeline
 from ai_content.presets.music import BACHATA
 
 # Import providers to register them
 import ai_content.providers  # noqa: F401
 
+BANNER = "=" * 55
+SUBSEP = "-" * 40
+
 
 # Path to lyrics file
 LYRICS_FILE = Path(__file__).parent.parent / "data/zefen/shega_lij_bachata_lyrics.txt"
@@ -32,17 +32,18 @@ async def generate_bachata_remix():
     """Generate bachata-style remix with Amharic lyrics."""
 
     print("🎵 Shega Lij Bachata Remix Generator")
-    print("=" * 55)
+    print(BANNER)
     print(f"   Original: Gosaye Tesfaye - Shega Lij Behasabe")
     print(f"   Style: Dominican Bachata Romántica")
     print(f"   BPM: {BACHATA.bpm}")
     print(f"   Mood: {BACHATA.mood}")
-    print("=" * 55)
+    print(BANNER)
 
     # Load lyrics
     if LYRICS_FILE.exists():
-        lyrics = LYRICS_FILE.read_text()
-        print(f"\n📄 Loaded lyrics: {len(lyrics)} characters")
+        # The pipeline reads the file itself; only its size is shown here
+        size = LYRICS_FILE.stat().st_size
+        print(f"\n📄 Lyrics file: {size} bytes")
     else:
         print(f"\n❌ Lyrics file not found: {LYRICS_FILE}")
         return
@@ -59,10 +60,10 @@ Amharic vocals with emotional bachata delivery
 """
 
     print(f"\n🎸 Prompt Preview:")
-    print("-" * 40)
+    print(SUBSEP)
     for line in custom_prompt.strip().split("\n")[:5]:
         print(f"   {line}")
-    print("-" * 40)
+    print(SUBSEP)
 
     # Generate using MusicPipeline with lyrics-first workflow
     print("\n🎤 Generating bachata remix with vocals...")
@@ -80,16 +81,22 @@ Amharic vocals with emotional bachata delivery
     )
 
     if result.success:
-        print("\n" + "=" * 55)
+        print("\n" + BANNER)
         print("✅ BACHATA REMIX GENERATED SUCCESSFULLY!")
-        print("=" * 55)
-        for key, output in result.outputs.items():
-            if output.file_path:
-                print(f"   📁 File: {output.file_path}")
-            if output.file_size_mb:
-                print(f"   📊 Size: {output.file_size_mb:.2f} MB")
-            if output.duration_seconds:
-                print(f"   ⏱️  Duration: {output.duration_seconds}s")
+        print(BANNER)
+        lines = []
+        for output in result.outputs.values():
+            file_path = output.file_path
+            size_mb = output.file_size_mb
+            duration = output.duration_seconds
+            if file_path:
+                lines.append(f"   📁 File: {file_path}")
+            if size_mb:
+                lines.append(f"   📊 Size: {size_mb:.2f} MB")
+            if duration:
+                lines.append(f"   ⏱️  Duration: {duration}s")
+        if lines:
+            print("\n".join(lines))
         print("\n   🎧 Enjoy your Ethiopian-Dominican fusion!")
     else:
         print(f"\n❌ Generation failed!")
@@ -17,6 +17,7 @@ from rich.logging import RichHandler
 from ai_content import providers  # noqa: F401
 from ai_content.core import ProviderRegistry, GenerationResult
 from ai_content.config import configure, get_settings
+from ai_content.utils.event_loop import install_uvloop
 from ai_content.presets import (
     get_music_preset,
     get_video_preset,
@@ -403,11 +404,9 @@ async def _check_music_status(generation_id: str, output: Optional[Path]):
 
             if audio_url and output:
                 console.print(f"[blue]Downloading to {output}...[/blue]")
-                audio_data = await client.download_file(audio_url)
-                output.parent.mkdir(parents=True, exist_ok=True)
-                output.write_bytes(audio_data)
+                await client.download_to(audio_url, output)
                 console.print(f"[green]✅ Saved to {output}[/green]")
-                console.print(f"   Size: {len(audio_data) / (1024 * 1024):.2f} MB")
+                console.print(f"   Size: {output.stat().st_size / (1024 * 1024):.2f} MB")
                 # Update job tracker
                 tracker.update_status(generation_id, JobStatus.DOWNLOADED, str(output))
             elif audio_url:
@@ -610,9 +609,7 @@ async def _sync_jobs(job_id: str | None, download: bool):
                 if audio_url and download:
                     # Download the file
                     output_path = Path(f"output/{job.content_type}/job_{job.id[:8]}.mp3")
-                    output_path.parent.mkdir(parents=True, exist_ok=True)
-                    audio_data = await client.download_file(audio_url)
-                    output_path.write_bytes(audio_data)
+                    await client.download_to(audio_url, output_path)
                     tracker.update_status(job.id, JobStatus.DOWNLOADED, str(output_path))
                     console.print(f"   [green]Downloaded to {output_path}[/green]")
                 else:
@@ -632,6 +629,7 @@ async def _sync_jobs(job_id: str | None, download: bool):
 
 def cli():
     """Entry point for the CLI."""
+    install_uvloop()
     app()
 
 
@@ -4,10 +4,17 @@ Configuration loader utilities.
 Supports YAML and environment-based configuration.
 """
 
+from collections import deque
 from pathlib import Path
 from typing import Any
 import yaml
 
+try:
+    # libyaml-backed loader, much faster when PyYAML was built with it
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
 
 def load_yaml_config(path: str | Path) -> dict[str, Any]:
     """
@@ -26,8 +33,9 @@ def load_yaml_config(path: str | Path) -> dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
 
-    with open(path, "r") as f:
-        config = yaml.safe_load(f)
+    # Binary mode lets the parser handle decoding itself
+    with open(path, "rb") as f:
+        config = yaml.load(f, Loader=_YAMLLoader)
 
     return _flatten_config(config) if config else {}
 
@@ -42,18 +50,25 @@ def _flatten_config(config: dict, prefix: str = "") -> dict[str, Any]:
         {"google": GoogleSettings(api_key="xxx")}
     """
     result = {}
-
-    for key, value in config.items():
-        if isinstance(value, dict):
-            # Handle nested sections
-            if key in ("google", "aimlapi", "kling"):
-                # Pass as nested settings
-                result[key] = value
+    # Explicit stack of (prefix, items) iterators, walked depth-first
+    stack = [(prefix, iter(config.items()))]
+
+    while stack:
+        current_prefix, items = stack[-1]
+        for key, value in items:
+            if isinstance(value, dict):
+                # Handle nested sections
+                if key in ("google", "aimlapi", "kling"):
+                    # Pass as nested settings
+                    result[key] = value
+                else:
+                    # Flatten other nested dicts
+                    stack.append((f"{key}_", iter(value.items())))
+                    break
             else:
-                # Flatten other nested dicts
-                result.update(_flatten_config(value, f"{key}_"))
+                result[f"{current_prefix}{key}"] = value
         else:
-            result[f"{prefix}{key}"] = value
+            stack.pop()
 
     return result
 
@@ -71,16 +86,20 @@ def merge_configs(*configs: dict[str, Any]) -> dict[str, Any]:
         Merged configuration
     """
     result: dict[str, Any] = {}
-
-    for config in configs:
-        for key, value in config.items():
-            if (
-                key in result
-                and isinstance(result[key], dict)
-                and isinstance(value, dict)
-            ):
-                result[key] = merge_configs(result[key], value)
+    # Dicts created by this merge, which are safe to update in place
+    owned = {id(result)}
+    pending = deque((result, config) for config in configs)
+
+    while pending:
+        target, source = pending.popleft()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                if id(current) not in owned:
+                    current = target[key] = dict(current)
+                    owned.add(id(current))
+                pending.append((current, value))
             else:
-                result[key] = value
+                target[key] = value
 
     return result
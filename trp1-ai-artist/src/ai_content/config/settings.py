@@ -4,13 +4,66 @@ Configuration settings using Pydantic.
 Supports loading from YAML files and environment variables.
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
+from dotenv import dotenv_values
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+ENV_FILE = ".env"
 
-class GoogleSettings(BaseSettings):
+# mtime of the last .env load and the keys it put into os.environ
+_env_file_mtime = 0.0
+_env_file_keys: set[str] = set()
+
+
+def _load_env_file() -> None:
+    """
+    Load .env into os.environ, once per change of the file.
+
+    Variables already set in the real environment take precedence, the
+    same as with pydantic-settings' own env_file handling. Values that
+    came from an earlier load are refreshed when the file changes.
+    """
+    global _env_file_mtime
+
+    mtime = _mtime(ENV_FILE)
+    if mtime == _env_file_mtime:
+        return
+
+    for key, value in dotenv_values(ENV_FILE, encoding="utf-8").items():
+        if value is not None and (key not in os.environ or key in _env_file_keys):
+            os.environ[key] = value
+            _env_file_keys.add(key)
+    _env_file_mtime = mtime
+
+
+class _EnvFileSettings(BaseSettings):
+    """
+    Base for settings that read .env.
+
+    Settings builds three nested settings models, and giving each its own
+    env_file would parse .env four times per construction. Instead the
+    file is loaded into the environment once and only the regular
+    environment source is used.
+    """
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls,
+        init_settings,
+        env_settings,
+        dotenv_settings,
+        file_secret_settings,
+    ):
+        _load_env_file()
+        return init_settings, env_settings, file_secret_settings
+
+
+class GoogleSettings(_EnvFileSettings):
     """Google API configuration."""
 
     api_key: str = Field(default="", alias="GEMINI_API_KEY")
@@ -44,12 +97,11 @@ class GoogleSettings(BaseSettings):
     music_temperature: float = 1.0
 
     model_config = SettingsConfigDict(
-        env_file=".env",
         extra="ignore",
     )
 
 
-class AIMLAPISettings(BaseSettings):
+class AIMLAPISettings(_EnvFileSettings):
     """AIMLAPI configuration."""
 
     api_key: str = Field(default="", alias="AIMLAPI_KEY")
@@ -63,16 +115,16 @@ class AIMLAPISettings(BaseSettings):
 
     # Timeouts (MiniMax music can take 15-30 minutes)
     request_timeout: int = 60
-    poll_interval: int = 10
-    max_poll_attempts: int = 180  # 30 minutes at 10s intervals
+    poll_interval: int = 10  # First poll delay; grows 1.5x per poll
+    max_poll_interval: int = 30
+    max_poll_attempts: int = 180  # Wait budget: 30 minutes at 10s intervals
 
     model_config = SettingsConfigDict(
-        env_file=".env",
         extra="ignore",
     )
 
 
-class KlingSettings(BaseSettings):
+class KlingSettings(_EnvFileSettings):
     """Direct KlingAI API configuration."""
 
     api_key: str = Field(default="", alias="KLINGAI_API_KEY")
@@ -86,8 +138,9 @@ class KlingSettings(BaseSettings):
     mode: str = "std"
 
     # Timeouts (Kling can take 5-14 minutes)
-    poll_interval: int = 30
-    max_poll_attempts: int = 30
+    poll_interval: int = 30  # First poll delay; grows 1.5x per poll
+    max_poll_interval: int = 60
+    max_poll_attempts: int = 30  # Wait budget: 15 minutes at 30s intervals
 
     model_config = SettingsConfigDict(
         env_prefix="KLINGAI_",
@@ -95,7 +148,7 @@ class KlingSettings(BaseSettings):
     )
 
 
-class Settings(BaseSettings):
+class Settings(_EnvFileSettings):
     """
     Main application settings.
 
@@ -134,19 +187,57 @@ class Settings(BaseSettings):
     kling: KlingSettings = Field(default_factory=KlingSettings)
 
     model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
         extra="ignore",
     )
 
     def model_post_init(self, __context) -> None:
         """Create output directory if it doesn't exist."""
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if self.output_dir not in _created_dirs:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            _created_dirs.add(self.output_dir)
 
 
 # Global settings instance (lazy-loaded)
 _settings: Settings | None = None
 
+# Output directories already created by this process
+_created_dirs: set[Path] = set()
+
+
+def _mtime(path: str | Path | None) -> float:
+    """Return the modification time of a file, or 0.0 if it is missing."""
+    if not path:
+        return 0.0
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0.0
+
+
+@lru_cache(maxsize=8)
+def _build_settings(
+    config_path: str | None,
+    overrides: tuple,
+    _config_mtime: float,
+    _env_mtime: float,
+) -> Settings:
+    """
+    Build a Settings instance.
+
+    Cached on the arguments plus the mtimes of the YAML and .env files,
+    so repeated configure() calls with the same inputs skip re-reading
+    and re-validating them until one of the files changes. The mtime
+    arguments are otherwise unused; they only key the cache.
+    """
+    kwargs = {}
+    if config_path:
+        from ai_content.config.loader import load_yaml_config
+
+        kwargs = load_yaml_config(config_path)
+
+    kwargs.update(overrides)
+    return Settings(**kwargs)
+
 
 def get_settings() -> Settings:
     """
@@ -174,12 +265,15 @@ def configure(config_path: str | Path | None = None, **overrides) -> Settings:
     """
     global _settings
 
-    kwargs = {}
-    if config_path:
-        from ai_content.config.loader import load_yaml_config
-
-        kwargs = load_yaml_config(config_path)
-
-    kwargs.update(overrides)
-    _settings = Settings(**kwargs)
+    key = (
+        str(config_path) if config_path else None,
+        tuple(sorted(overrides.items())),
+        _mtime(config_path),
+        _mtime(ENV_FILE),
+    )
+    try:
+        _settings = _build_settings(*key)
+    except TypeError:
+        # Unhashable override values can't be cached
+        _settings = _build_settings.__wrapped__(*key)
     return _settings
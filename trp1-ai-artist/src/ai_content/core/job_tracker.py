@@ -8,16 +8,31 @@ Persistent SQLite-based tracking for generation jobs to:
 - Enable recovery of pending jobs
 """
 
+import atexit
 import hashlib
 import json
+import logging
 import sqlite3
+import sys
+import threading
+import zlib
+from collections import namedtuple
+from collections.abc import Iterable
 from contextlib import contextmanager
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # Optional, from the "perf" extra
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
 
 class JobStatus(str, Enum):
     """Job status states."""
@@ -29,9 +44,222 @@ class JobStatus(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+# Status strings as bound in queries, precomputed once
+_STATUS_VALUES = tuple(status.value for status in JobStatus)
+_PENDING_STATUSES = (JobStatus.QUEUED.value, JobStatus.PROCESSING.value)
+
+
+# Version of the prompt hash. Version 1 was MD5; version 2 is BLAKE2b with a
+# 16-byte digest, the same 32-hex width, so old rows still fit the column.
+HASH_VERSION = 2
+
+
+def _prompt_parts(
+    prompt: str,
+    provider: str,
+    content_type: str,
+    lyrics: str | None,
+    reference_url: str | None,
+) -> str:
+    """Join the fields that identify a generation request."""
+    parts = [prompt, provider, content_type]
+    if lyrics:
+        parts.append(lyrics)
+    if reference_url:
+        parts.append(reference_url)
+    return "|".join(parts)
+
+
+@lru_cache(maxsize=1024)
+def _hash_prompt(
+    prompt: str,
+    provider: str,
+    content_type: str,
+    lyrics: str | None,
+    reference_url: str | None,
+) -> str:
+    """Compute the duplicate-detection hash (memoized, see JobTracker.hash_prompt)."""
+    # Feed the fields to the hasher one at a time rather than joining them
+    # first, which avoids two copies of potentially long lyrics. The byte
+    # stream is the same as hashing "|".join(parts).
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(prompt.encode())
+    for part in (provider, content_type):
+        hasher.update(b"|")
+        hasher.update(part.encode())
+    for part in (lyrics, reference_url):
+        if part:
+            hasher.update(b"|")
+            hasher.update(part.encode())
+    return hasher.hexdigest()
+
+
+def _legacy_hash_prompt(
+    prompt: str,
+    provider: str,
+    content_type: str,
+    lyrics: str | None,
+    reference_url: str | None,
+) -> str:
+    """Compute the version 1 (MD5) hash, used to match rows written before HASH_VERSION 2."""
+    combined = _prompt_parts(prompt, provider, content_type, lyrics, reference_url)
+    return hashlib.md5(combined.encode()).hexdigest()
+
+
+# Timestamps are stored as integer microseconds since the Unix epoch in
+# created_at_us/updated_at_us. The ISO text columns are still written, and
+# are read when a µs column is NULL: rows inserted by older versions after
+# the migration have none until the next open backfills them. Older versions
+# only update the ISO updated_at, so sharing one database with them for
+# writes is not supported.
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_us(dt: datetime) -> int:
+    """Convert an aware datetime to integer Unix microseconds."""
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def _from_us(us: int) -> datetime:
+    """Convert integer Unix microseconds to an aware UTC datetime."""
+    return _EPOCH + timedelta(microseconds=us)
+
+
+def _parse_iso(value: str) -> datetime:
+    """Parse a stored ISO timestamp, treating naive values as UTC."""
+    dt = datetime.fromisoformat(value)
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def _row_time(us: int | None, iso: str) -> datetime:
+    """Timestamp from the µs column, or from the ISO text if it isn't set yet."""
+    return _from_us(us) if us is not None else _parse_iso(iso)
+
+
+# Prompts and commands longer than this (in UTF-8 bytes) are stored
+# zlib-compressed; lyrics-heavy prompts otherwise dominate row size.
+# Bits in the compressed column mark which fields are compressed.
+_COMPRESS_MIN_BYTES = 512
+_PROMPT_COMPRESSED = 1
+_COMMAND_COMPRESSED = 2
+
+
+def _pack_text(text: str) -> tuple[str | bytes, bool]:
+    """Compress long text for storage. Returns (value, compressed)."""
+    encoded = text.encode()
+    if len(encoded) > _COMPRESS_MIN_BYTES:
+        packed = zlib.compress(encoded)
+        if len(packed) < len(encoded):
+            return packed, True
+    return text, False
+
+
+def _unpack_text(value: str | bytes, compressed: bool) -> str:
+    """Reverse _pack_text."""
+    return zlib.decompress(value).decode() if compressed else value
+
+
+# Columns read back into a Job, in SELECT order. Job queries build rows as
+# this namedtuple, which is cheaper to read than sqlite3.Row's name lookup.
+JobRow = namedtuple(
+    "JobRow",
+    "id provider content_type prompt_hash prompt command status "
+    "output_path metadata created_at_us updated_at_us compressed created_at updated_at",
+)
+_JOB_COLUMNS = ", ".join(JobRow._fields)
+
+
+def _job_row(_cursor: sqlite3.Cursor, row: tuple) -> JobRow:
+    """Row factory for job queries."""
+    return JobRow(*row)
+
+
+def _query_jobs(conn: sqlite3.Connection, sql: str, params: Iterable[Any]) -> sqlite3.Cursor:
+    """Run a job query on a cursor that yields JobRow tuples."""
+    cursor = conn.cursor()
+    cursor.row_factory = _job_row
+    return cursor.execute(sql, params)
+
+
+# SQL statements, kept as module constants so every call passes the same
+# string and hits the connection's statement cache
+_SQL_INSERT_JOB = """
+    INSERT INTO jobs (
+        id, provider, content_type, prompt_hash, prompt,
+        command, status, created_at, updated_at, metadata,
+        created_at_us, updated_at_us, compressed
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_GET_JOB = f"SELECT {_JOB_COLUMNS} FROM jobs WHERE id = ?"
+
+# The status filter is a literal so SQLite can match the partial idx_dup index
+_SQL_FIND_DUPLICATE = f"""
+    SELECT {_JOB_COLUMNS} FROM jobs
+    WHERE prompt_hash IN (?, ?) AND status != 'failed'
+    ORDER BY created_at_us DESC
+    LIMIT 1
+"""
+
+_SQL_UPDATE_STATUS = """
+    UPDATE jobs
+    SET status = ?, updated_at = ?, updated_at_us = ?
+    WHERE id = ?
+"""
+
+_SQL_UPDATE_STATUS_WITH_PATH = """
+    UPDATE jobs
+    SET status = ?, updated_at = ?, updated_at_us = ?, output_path = ?
+    WHERE id = ?
+"""
+
+_SQL_PENDING_JOBS = f"""
+    SELECT {_JOB_COLUMNS} FROM jobs
+    WHERE status IN (?, ?)
+    ORDER BY created_at_us DESC
+"""
+
+
+@lru_cache(maxsize=8)
+def _list_jobs_sql(by_status: bool, by_provider: bool, by_content_type: bool) -> str:
+    """Build the list_jobs query for one combination of filters."""
+    query = f"SELECT {_JOB_COLUMNS} FROM jobs WHERE 1=1"
+    if by_status:
+        query += " AND status = ?"
+    if by_provider:
+        query += " AND provider = ?"
+    if by_content_type:
+        query += " AND content_type = ?"
+    return query + " ORDER BY created_at_us DESC LIMIT ?"
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize metadata to JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _loads(data: str) -> Any:
+    """Parse metadata JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Marks Job metadata that hasn't been parsed yet
+_UNPARSED: Any = object()
+
+
+@dataclass(slots=True)
 class Job:
-    """Represents a generation job."""
+    """
+    Represents a generation job.
+
+    Metadata is kept as its stored JSON and only parsed when the metadata
+    property is first read, since most listings never look at it.
+    """
 
     id: str  # generation_id from API
     provider: str
@@ -43,26 +271,57 @@ class Job:
     created_at: datetime
     updated_at: datetime
     output_path: str | None = None
-    metadata: dict[str, Any] | None = None
+    metadata_json: str | None = field(default=None, repr=False)
+    _metadata: Any = field(default=_UNPARSED, init=False, repr=False, compare=False)
+
+    @property
+    def metadata(self) -> dict[str, Any] | None:
+        """Additional metadata (bpm, duration, etc.), parsed on first access."""
+        if self._metadata is _UNPARSED:
+            self._metadata = _loads(self.metadata_json) if self.metadata_json else None
+        return self._metadata
 
     @classmethod
-    def from_row(cls, row: sqlite3.Row) -> "Job":
+    def from_row(cls, row: "JobRow") -> "Job":
         """Create Job from database row."""
         return cls(
-            id=row["id"],
-            provider=row["provider"],
-            content_type=row["content_type"],
-            prompt_hash=row["prompt_hash"],
-            prompt=row["prompt"],
-            command=row["command"],
-            status=JobStatus(row["status"]),
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"]),
-            output_path=row["output_path"],
-            metadata=json.loads(row["metadata"]) if row["metadata"] else None,
+            id=row.id,
+            # Few distinct values, so share one string object per value
+            provider=sys.intern(row.provider),
+            content_type=sys.intern(row.content_type),
+            prompt_hash=row.prompt_hash,
+            prompt=_unpack_text(row.prompt, row.compressed & _PROMPT_COMPRESSED),
+            command=_unpack_text(row.command, row.compressed & _COMMAND_COMPRESSED),
+            status=JobStatus(row.status),
+            created_at=_row_time(row.created_at_us, row.created_at),
+            updated_at=_row_time(row.updated_at_us, row.updated_at),
+            output_path=row.output_path,
+            metadata_json=row.metadata,
         )
 
 
+def _job_params(job: Job) -> tuple:
+    """Parameters for _SQL_INSERT_JOB from a new Job."""
+    prompt, prompt_compressed = _pack_text(job.prompt)
+    command, command_compressed = _pack_text(job.command)
+    return (
+        job.id,
+        job.provider,
+        job.content_type,
+        job.prompt_hash,
+        prompt,
+        command,
+        job.status.value,
+        job.created_at.isoformat(),
+        job.updated_at.isoformat(),
+        job.metadata_json,
+        _to_us(job.created_at),
+        _to_us(job.updated_at),
+        (_PROMPT_COMPRESSED if prompt_compressed else 0)
+        | (_COMMAND_COMPRESSED if command_compressed else 0),
+    )
+
+
 class JobTracker:
     """
     SQLite-based job tracker for AI generation requests.
@@ -93,13 +352,36 @@ class JobTracker:
         created_at TEXT NOT NULL,
         updated_at TEXT NOT NULL,
         output_path TEXT,
-        metadata TEXT
+        metadata TEXT,
+        created_at_us INTEGER,
+        updated_at_us INTEGER,
+        compressed INTEGER NOT NULL DEFAULT 0
     );
+    """
 
-    CREATE INDEX IF NOT EXISTS idx_prompt_hash ON jobs(prompt_hash);
-    CREATE INDEX IF NOT EXISTS idx_status ON jobs(status);
-    CREATE INDEX IF NOT EXISTS idx_provider ON jobs(provider);
-    CREATE INDEX IF NOT EXISTS idx_created_at ON jobs(created_at);
+    # Created after migrating, since older databases lack the *_us columns
+    INDEXES = """
+    DROP INDEX IF EXISTS idx_prompt_hash;
+    DROP INDEX IF EXISTS idx_status;
+    DROP INDEX IF EXISTS idx_provider;
+    DROP INDEX IF EXISTS idx_created_at;
+    DROP INDEX IF EXISTS idx_status_created;
+
+    CREATE INDEX IF NOT EXISTS idx_dup
+        ON jobs(prompt_hash, created_at_us DESC) WHERE status != 'failed';
+    CREATE INDEX IF NOT EXISTS idx_status_created_us ON jobs(status, created_at_us DESC);
+    CREATE INDEX IF NOT EXISTS idx_provider_created_us ON jobs(provider, created_at_us DESC);
+    CREATE INDEX IF NOT EXISTS idx_created_at_us ON jobs(created_at_us);
+    """
+
+    # WAL lets readers run alongside the writer, and NORMAL sync is safe
+    # under WAL while avoiding an fsync on every commit
+    PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA busy_timeout=5000;
+    PRAGMA cache_size=-20000;
+    PRAGMA temp_store=memory;
     """
 
     def __init__(self, db_path: Path | None = None):
@@ -112,24 +394,146 @@ class JobTracker:
         if db_path is None:
             db_path = Path.home() / ".ai-content" / "jobs.db"
         self.db_path = db_path
+        self._lock = threading.Lock()
         self._init_db()
 
+        # Inserts from create_job() are queued and written by a background
+        # thread, so callers don't wait on the commit. Every other operation
+        # writes the queue out first, so reads always see queued jobs.
+        # Rows that fail to insert are kept in _failed and raised by the next
+        # tracker call, so errors like a reused id still reach the caller.
+        self._pending: list[tuple] = []
+        self._failed: list[tuple[str, sqlite3.Error]] = []
+        self._wake = threading.Event()
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._writer_loop,
+            name="job-tracker-writer",
+            daemon=True,
+        )
+        self._writer.start()
+        atexit.register(self.close)
+
     def _init_db(self):
-        """Initialize the database schema."""
+        """Open the shared connection and initialize the database schema."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        with self._get_connection() as conn:
-            conn.executescript(self.SCHEMA)
+        # One long-lived connection in autocommit mode, shared across
+        # threads and serialized by self._lock
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(self.PRAGMAS)
+        self._conn.executescript(self.SCHEMA)
+        self._migrate()
+        self._conn.executescript(self.INDEXES)
+
+    def _migrate(self):
+        """Add columns missing from older databases and backfill timestamps."""
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            if "created_at_us" not in columns:
+                self._conn.execute("ALTER TABLE jobs ADD COLUMN created_at_us INTEGER")
+            if "updated_at_us" not in columns:
+                self._conn.execute("ALTER TABLE jobs ADD COLUMN updated_at_us INTEGER")
+            if "compressed" not in columns:
+                self._conn.execute(
+                    "ALTER TABLE jobs ADD COLUMN compressed INTEGER NOT NULL DEFAULT 0"
+                )
+
+            rows = self._conn.execute(
+                """
+                SELECT id, created_at, updated_at FROM jobs
+                WHERE created_at_us IS NULL OR updated_at_us IS NULL
+                """
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE jobs SET created_at_us = ?, updated_at_us = ? WHERE id = ?",
+                (
+                    (
+                        _to_us(_parse_iso(row["created_at"])),
+                        _to_us(_parse_iso(row["updated_at"])),
+                        row["id"],
+                    )
+                    for row in rows
+                ),
+            )
 
     @contextmanager
     def _get_connection(self):
-        """Get a database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Get the shared database connection, holding the lock."""
+        with self._lock:
+            self._write_pending()
+            self._raise_failed()
+            yield self._conn
+
+    def _writer_loop(self):
+        """Write queued inserts in batches until the tracker is closed."""
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            with self._lock:
+                if self._closed:
+                    return
+                self._write_pending()
+
+    def _write_pending(self):
+        """Insert all queued jobs in one transaction. Caller holds the lock."""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
         try:
-            yield conn
-            conn.commit()
-        finally:
-            conn.close()
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(_SQL_INSERT_JOB, batch)
+        except sqlite3.Error:
+            # One bad row (e.g. a reused id) fails the batch; retry row by row
+            for params in batch:
+                try:
+                    self._conn.execute(_SQL_INSERT_JOB, params)
+                except sqlite3.Error as e:
+                    logger.error(f"❌ Failed to record job {params[0]}: {e}")
+                    self._failed.append((params[0], e))
+
+    def _raise_failed(self):
+        """Raise the first queued insert error, if any. Caller holds the lock."""
+        if not self._failed:
+            return
+        failed, self._failed = self._failed, []
+        error = failed[0][1]
+        error.add_note(f"Failed to record job(s): {', '.join(job_id for job_id, _ in failed)}")
+        raise error
+
+    def flush(self):
+        """
+        Write any queued jobs to the database.
+
+        Raises:
+            sqlite3.Error: If a queued job could not be recorded
+        """
+        with self._get_connection():
+            pass
+
+    def close(self):
+        """
+        Write queued jobs and close the database connection.
+
+        Raises:
+            sqlite3.Error: If a queued job could not be recorded
+        """
+        atexit.unregister(self.close)
+        with self._lock:
+            if self._closed:
+                return
+            self._write_pending()
+            self._closed = True
+            self._conn.close()
+            self._wake.set()
+            self._raise_failed()
 
     @staticmethod
     def hash_prompt(
@@ -143,15 +547,11 @@ class JobTracker:
         Create a hash for duplicate detection.
 
         Combines prompt, provider, content type, and optional lyrics/reference
-        to create a unique fingerprint.
+        to create a unique fingerprint. Results are cached, since callers
+        usually check for a duplicate and then create the job with the
+        same arguments.
         """
-        parts = [prompt, provider, content_type]
-        if lyrics:
-            parts.append(lyrics)
-        if reference_url:
-            parts.append(reference_url)
-        combined = "|".join(parts)
-        return hashlib.md5(combined.encode()).hexdigest()
+        return _hash_prompt(prompt, provider, content_type, lyrics, reference_url)
 
     def create_job(
         self,
@@ -167,6 +567,11 @@ class JobTracker:
         """
         Create a new job record.
 
+        The row is written by a background thread; the returned Job is
+        available immediately and any later tracker call sees it. An error
+        writing the row (such as a reused generation_id) is raised by the
+        next tracker call; call flush() to check right away.
+
         Args:
             generation_id: ID from the API response
             provider: Provider name (minimax, lyria, etc.)
@@ -179,8 +584,133 @@ class JobTracker:
 
         Returns:
             The created Job object
+
+        Raises:
+            sqlite3.Error: If an earlier queued job could not be recorded
+        """
+        job = self._new_job(
+            generation_id,
+            provider,
+            content_type,
+            prompt,
+            command,
+            lyrics,
+            reference_url,
+            metadata,
+        )
+        with self._lock:
+            self._raise_failed()
+            self._pending.append(_job_params(job))
+        self._wake.set()
+        return job
+
+    def get_or_create_job(
+        self,
+        generation_id: str,
+        provider: str,
+        content_type: str,
+        prompt: str,
+        command: str,
+        lyrics: str | None = None,
+        reference_url: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> tuple[Job, bool]:
         """
-        now = datetime.now(timezone.utc).isoformat()
+        Return the existing job for this prompt, or create a new one.
+
+        The duplicate lookup and the insert run in one IMMEDIATE transaction,
+        so two processes registering the same prompt can't both insert it.
+        Failed jobs don't count as duplicates, as in find_duplicate().
+
+        Args:
+            Same as create_job()
+
+        Returns:
+            Tuple of (job, created), where created is False if an existing
+            job was returned
+        """
+        with self._get_connection() as conn, conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = self._find_duplicate_row(
+                conn, prompt, provider, content_type, lyrics, reference_url
+            )
+            if row:
+                return Job.from_row(row), False
+            job = self._insert_job(
+                conn,
+                generation_id,
+                provider,
+                content_type,
+                prompt,
+                command,
+                lyrics,
+                reference_url,
+                metadata,
+            )
+        return job, True
+
+    def create_jobs_bulk(self, jobs: Iterable[dict[str, Any]]) -> list[Job]:
+        """
+        Create many job records in a single transaction.
+
+        Each item holds the keyword arguments of create_job(). Inserting in
+        one transaction commits once instead of once per job; for very large
+        imports, batches of around 1000 jobs per call keep the write lock
+        short.
+
+        Args:
+            jobs: Iterable of create_job() keyword argument dicts
+
+        Returns:
+            The created Job objects, in input order
+        """
+        new_jobs = [self._new_job(**spec) for spec in jobs]
+
+        with self._get_connection() as conn, conn:
+            conn.execute("BEGIN")
+            conn.executemany(_SQL_INSERT_JOB, (_job_params(job) for job in new_jobs))
+
+        return new_jobs
+
+    def _insert_job(
+        self,
+        conn: sqlite3.Connection,
+        generation_id: str,
+        provider: str,
+        content_type: str,
+        prompt: str,
+        command: str,
+        lyrics: str | None,
+        reference_url: str | None,
+        metadata: dict[str, Any] | None,
+    ) -> Job:
+        """Insert a queued job row on an open connection."""
+        job = self._new_job(
+            generation_id,
+            provider,
+            content_type,
+            prompt,
+            command,
+            lyrics,
+            reference_url,
+            metadata,
+        )
+        conn.execute(_SQL_INSERT_JOB, _job_params(job))
+        return job
+
+    def _new_job(
+        self,
+        generation_id: str,
+        provider: str,
+        content_type: str,
+        prompt: str,
+        command: str,
+        lyrics: str | None = None,
+        reference_url: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> Job:
+        """Build a queued Job for insertion."""
+        now = datetime.now(timezone.utc)
         prompt_hash = self.hash_prompt(prompt, provider, content_type, lyrics, reference_url)
 
         # Include lyrics in metadata if provided
@@ -192,28 +722,6 @@ class JobTracker:
         if reference_url:
             metadata["reference_url"] = reference_url
 
-        with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO jobs (
-                    id, provider, content_type, prompt_hash, prompt,
-                    command, status, created_at, updated_at, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    generation_id,
-                    provider,
-                    content_type,
-                    prompt_hash,
-                    prompt,
-                    command,
-                    JobStatus.QUEUED.value,
-                    now,
-                    now,
-                    json.dumps(metadata) if metadata else None,
-                ),
-            )
-
         return Job(
             id=generation_id,
             provider=provider,
@@ -222,15 +730,15 @@ class JobTracker:
             prompt=prompt,
             command=command,
             status=JobStatus.QUEUED,
-            created_at=datetime.fromisoformat(now),
-            updated_at=datetime.fromisoformat(now),
-            metadata=metadata,
+            created_at=now,
+            updated_at=now,
+            metadata_json=_dumps(metadata) if metadata else None,
         )
 
     def get_job(self, job_id: str) -> Job | None:
         """Get a job by ID."""
         with self._get_connection() as conn:
-            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            row = _query_jobs(conn, _SQL_GET_JOB, (job_id,)).fetchone()
             return Job.from_row(row) if row else None
 
     def find_duplicate(
@@ -245,22 +753,34 @@ class JobTracker:
         Find an existing job with the same prompt hash.
 
         Returns the most recent matching job, or None if no duplicate exists.
-        Only returns jobs that are not failed.
+        Only returns jobs that are not failed. Jobs recorded with the older
+        MD5 hash are matched as well.
         """
-        prompt_hash = self.hash_prompt(prompt, provider, content_type, lyrics, reference_url)
-
         with self._get_connection() as conn:
-            row = conn.execute(
-                """
-                SELECT * FROM jobs
-                WHERE prompt_hash = ? AND status != ?
-                ORDER BY created_at DESC
-                LIMIT 1
-                """,
-                (prompt_hash, JobStatus.FAILED.value),
-            ).fetchone()
+            row = self._find_duplicate_row(
+                conn, prompt, provider, content_type, lyrics, reference_url
+            )
             return Job.from_row(row) if row else None
 
+    def _find_duplicate_row(
+        self,
+        conn: sqlite3.Connection,
+        prompt: str,
+        provider: str,
+        content_type: str,
+        lyrics: str | None,
+        reference_url: str | None,
+    ) -> JobRow | None:
+        """Look up the most recent non-failed row for a prompt on an open connection."""
+        prompt_hash = self.hash_prompt(prompt, provider, content_type, lyrics, reference_url)
+        legacy_hash = _legacy_hash_prompt(prompt, provider, content_type, lyrics, reference_url)
+
+        return _query_jobs(
+            conn,
+            _SQL_FIND_DUPLICATE,
+            (prompt_hash, legacy_hash),
+        ).fetchone()
+
     def update_status(
         self,
         job_id: str,
@@ -278,26 +798,18 @@ class JobTracker:
         Returns:
             True if job was found and updated
         """
-        now = datetime.now(timezone.utc).isoformat()
+        now = datetime.now(timezone.utc)
 
         with self._get_connection() as conn:
             if output_path:
                 cursor = conn.execute(
-                    """
-                    UPDATE jobs
-                    SET status = ?, updated_at = ?, output_path = ?
-                    WHERE id = ?
-                    """,
-                    (status.value, now, output_path, job_id),
+                    _SQL_UPDATE_STATUS_WITH_PATH,
+                    (status.value, now.isoformat(), _to_us(now), output_path, job_id),
                 )
             else:
                 cursor = conn.execute(
-                    """
-                    UPDATE jobs
-                    SET status = ?, updated_at = ?
-                    WHERE id = ?
-                    """,
-                    (status.value, now, job_id),
+                    _SQL_UPDATE_STATUS,
+                    (status.value, now.isoformat(), _to_us(now), job_id),
                 )
             return cursor.rowcount > 0
 
@@ -320,24 +832,19 @@ class JobTracker:
         Returns:
             List of matching jobs, most recent first
         """
-        query = "SELECT * FROM jobs WHERE 1=1"
+        query = _list_jobs_sql(bool(status), bool(provider), bool(content_type))
         params: list[Any] = []
 
         if status:
-            query += " AND status = ?"
             params.append(status.value)
         if provider:
-            query += " AND provider = ?"
             params.append(provider)
         if content_type:
-            query += " AND content_type = ?"
             params.append(content_type)
-
-        query += " ORDER BY created_at DESC LIMIT ?"
         params.append(limit)
 
         with self._get_connection() as conn:
-            rows = conn.execute(query, params).fetchall()
+            rows = _query_jobs(conn, query, params).fetchall()
             return [Job.from_row(row) for row in rows]
 
     def get_stats(self) -> dict[str, Any]:
@@ -348,17 +855,19 @@ class JobTracker:
             Dictionary with job counts by status and provider
         """
         with self._get_connection() as conn:
-            # Total count
-            total = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+            # Count by status, in one grouped query
+            status_rows = conn.execute(
+                """
+                SELECT status, COUNT(*) as count
+                FROM jobs
+                GROUP BY status
+                """
+            ).fetchall()
+            status_counts = dict.fromkeys(_STATUS_VALUES, 0)
+            status_counts.update({row["status"]: row["count"] for row in status_rows})
 
-            # Count by status
-            status_counts = {}
-            for status in JobStatus:
-                count = conn.execute(
-                    "SELECT COUNT(*) FROM jobs WHERE status = ?",
-                    (status.value,),
-                ).fetchone()[0]
-                status_counts[status.value] = count
+            # Total count
+            total = sum(status_counts.values())
 
             # Count by provider
             provider_rows = conn.execute(
@@ -383,9 +892,9 @@ class JobTracker:
             type_counts = {row["content_type"]: row["count"] for row in type_rows}
 
             # Recent activity (last 24h)
-            yesterday = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0).isoformat()
+            yesterday = _to_us(datetime.now(timezone.utc).replace(hour=0, minute=0, second=0))
             recent = conn.execute(
-                "SELECT COUNT(*) FROM jobs WHERE created_at >= ?",
+                "SELECT COUNT(*) FROM jobs WHERE created_at_us >= ?",
                 (yesterday,),
             ).fetchone()[0]
 
@@ -398,8 +907,14 @@ class JobTracker:
             }
 
     def get_pending_jobs(self) -> list[Job]:
-        """Get all jobs that are still pending (queued or processing)."""
-        return self.list_jobs(status=JobStatus.QUEUED) + self.list_jobs(status=JobStatus.PROCESSING)
+        """Get all jobs that are still pending (queued or processing), most recent first."""
+        with self._get_connection() as conn:
+            rows = _query_jobs(
+                conn,
+                _SQL_PENDING_JOBS,
+                _PENDING_STATUSES,
+            ).fetchall()
+            return [Job.from_row(row) for row in rows]
 
 
 # Global instance for convenience
@@ -3,10 +3,13 @@ Core provider protocols and abstractions.
 
 This module defines the interfaces that all providers must implement.
 Uses Protocol for structural subtyping (duck typing with type safety).
+
+The protocols are runtime-checkable, but isinstance() against them checks
+every member with hasattr, so do it once (e.g. at registration) rather
+than in hot loops.
 """
 
 from typing import Protocol, runtime_checkable
-from abc import abstractmethod
 
 from ai_content.core.result import GenerationResult
 
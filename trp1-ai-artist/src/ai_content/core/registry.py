@@ -4,6 +4,8 @@ Provider registry for dynamic provider discovery and instantiation.
 Uses decorator-based registration for extensibility.
 """
 
+import importlib
+from functools import cache
 from typing import Type, TypeVar
 import logging
 
@@ -34,11 +36,10 @@ class ProviderRegistry:
     _music_providers: dict[str, Type[MusicProvider]] = {}
     _video_providers: dict[str, Type[VideoProvider]] = {}
     _image_providers: dict[str, Type[ImageProvider]] = {}
+    # kind -> name -> module that registers the provider when imported
+    _lazy_providers: dict[str, dict[str, str]] = {"music": {}, "video": {}, "image": {}}
 
-    # Provider instances (lazy-loaded singletons)
-    _music_instances: dict[str, MusicProvider] = {}
-    _video_instances: dict[str, VideoProvider] = {}
-    _image_instances: dict[str, ImageProvider] = {}
+    # Provider instances are lazy-loaded singletons held by _get_instance's cache
 
     @classmethod
     def register_music(cls, name: str):
@@ -83,6 +84,24 @@ class ProviderRegistry:
 
         return decorator
 
+    @classmethod
+    def register_lazy(cls, kind: str, name: str, module: str) -> None:
+        """
+        Declare a provider whose module is imported on first use.
+
+        The module must register the provider with one of the decorators
+        above; until then, the name is listed but nothing is imported.
+
+        Args:
+            kind: "music", "video", or "image"
+            name: Provider identifier
+            module: Dotted path of the module defining the provider
+
+        Example:
+            >>> ProviderRegistry.register_lazy("video", "veo", "ai_content.providers.google.veo")
+        """
+        cls._lazy_providers[kind][name] = module
+
     @classmethod
     def get_music(cls, name: str) -> MusicProvider:
         """
@@ -97,53 +116,32 @@ class ProviderRegistry:
         Raises:
             KeyError: If provider not registered
         """
-        if name not in cls._music_instances:
-            if name not in cls._music_providers:
-                available = list(cls._music_providers.keys())
-                raise KeyError(
-                    f"Music provider '{name}' not found. Available: {available}"
-                )
-            cls._music_instances[name] = cls._music_providers[name]()
-        return cls._music_instances[name]
+        return _get_instance("music", name)
 
     @classmethod
     def get_video(cls, name: str) -> VideoProvider:
         """Get a video provider instance by name."""
-        if name not in cls._video_instances:
-            if name not in cls._video_providers:
-                available = list(cls._video_providers.keys())
-                raise KeyError(
-                    f"Video provider '{name}' not found. Available: {available}"
-                )
-            cls._video_instances[name] = cls._video_providers[name]()
-        return cls._video_instances[name]
+        return _get_instance("video", name)
 
     @classmethod
     def get_image(cls, name: str) -> ImageProvider:
         """Get an image provider instance by name."""
-        if name not in cls._image_instances:
-            if name not in cls._image_providers:
-                available = list(cls._image_providers.keys())
-                raise KeyError(
-                    f"Image provider '{name}' not found. Available: {available}"
-                )
-            cls._image_instances[name] = cls._image_providers[name]()
-        return cls._image_instances[name]
+        return _get_instance("image", name)
 
     @classmethod
     def list_music_providers(cls) -> list[str]:
         """List all registered music provider names."""
-        return list(cls._music_providers.keys())
+        return list(dict.fromkeys([*cls._music_providers, *cls._lazy_providers["music"]]))
 
     @classmethod
     def list_video_providers(cls) -> list[str]:
         """List all registered video provider names."""
-        return list(cls._video_providers.keys())
+        return list(dict.fromkeys([*cls._video_providers, *cls._lazy_providers["video"]]))
 
     @classmethod
     def list_image_providers(cls) -> list[str]:
         """List all registered image provider names."""
-        return list(cls._image_providers.keys())
+        return list(dict.fromkeys([*cls._image_providers, *cls._lazy_providers["image"]]))
 
     @classmethod
     def clear(cls):
@@ -151,6 +149,27 @@ class ProviderRegistry:
         cls._music_providers.clear()
         cls._video_providers.clear()
         cls._image_providers.clear()
-        cls._music_instances.clear()
-        cls._video_instances.clear()
-        cls._image_instances.clear()
+        for lazy in cls._lazy_providers.values():
+            lazy.clear()
+        _get_instance.cache_clear()
+
+
+@cache
+def _get_instance(kind: str, name: str):
+    """
+    Instantiate a registered provider once per (kind, name).
+
+    A failed lookup raises KeyError and is not cached, so a provider
+    registered later can still be fetched.
+    """
+    providers = getattr(ProviderRegistry, f"_{kind}_providers")
+    module = ProviderRegistry._lazy_providers[kind].get(name)
+    if name not in providers and module:
+        # Importing the module registers the provider via its decorator
+        importlib.import_module(module)
+    if name not in providers:
+        available = getattr(ProviderRegistry, f"list_{kind}_providers")()
+        raise KeyError(
+            f"{kind.capitalize()} provider '{name}' not found. Available: {available}"
+        )
+    return providers[name]()
@@ -47,6 +47,12 @@ class GenerationResult:
     generation_id: str | None = None
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
+    # (file_path, size in bytes) from the last size lookup, so repeated
+    # file_size_mb reads don't stat the file again
+    _size_cache: tuple[Path | None, int | None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def save(self, path: str | Path) -> Path:
         """
         Save content to a file.
@@ -66,7 +72,11 @@ class GenerationResult:
                 import shutil
 
                 dest = Path(path)
-                shutil.copy(self.file_path, dest)
+                if dest.is_dir():
+                    dest = dest / self.file_path.name
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                # copyfile uses the kernel fast path (sendfile/fcopyfile)
+                shutil.copyfile(self.file_path, dest)
                 return dest
             raise ValueError("No data available to save")
 
@@ -74,20 +84,32 @@ class GenerationResult:
         dest.parent.mkdir(parents=True, exist_ok=True)
         dest.write_bytes(self.data)
         self.file_path = dest
+        self._size_cache = (dest, len(self.data))
         return dest
 
     @property
     def file_size_mb(self) -> float | None:
-        """Get file size in megabytes."""
-        if self.file_path and self.file_path.exists():
-            return self.file_path.stat().st_size / (1024 * 1024)
+        """Get file size in megabytes (cached until file_path changes)."""
+        if self._size_cache is None or self._size_cache[0] != self.file_path:
+            self._size_cache = (self.file_path, self._size_bytes())
+        size = self._size_cache[1]
+        return size / (1024 * 1024) if size is not None else None
+
+    def _size_bytes(self) -> int | None:
+        """Size of the saved file, falling back to the in-memory data."""
+        if self.file_path:
+            try:
+                return self.file_path.stat().st_size
+            except OSError:
+                pass
         if self.data:
-            return len(self.data) / (1024 * 1024)
+            return len(self.data)
         return None
 
     def __repr__(self) -> str:
         status = "✅" if self.success else "❌"
-        size = f"{self.file_size_mb:.2f}MB" if self.file_size_mb else "no data"
+        size_mb = self.file_size_mb
+        size = f"{size_mb:.2f}MB" if size_mb else "no data"
         return f"GenerationResult({status} {self.provider}/{self.content_type}, {size})"
 
 
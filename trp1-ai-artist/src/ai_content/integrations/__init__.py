@@ -1,16 +1,36 @@
-"""Integrations module for external services."""
-
-from ai_content.integrations.media import (
-    MediaProcessor,
-    check_ffmpeg_available,
-)
-from ai_content.integrations.archive import (
-    ArchiveOrgSource,
-    SourceMetadata,
-)
-from ai_content.integrations.youtube import (
-    YouTubeUploader,
-)
+"""Integrations module for external services.
+
+Submodules are imported on first attribute access (PEP 562), so using one
+integration doesn't pay the import cost of the others' client libraries.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ai_content.integrations.archive import (
+        ArchiveOrgSource,
+        SourceMetadata,
+    )
+    from ai_content.integrations.media import (
+        MediaProcessor,
+        check_ffmpeg_available,
+    )
+    from ai_content.integrations.youtube import (
+        YouTubeUploader,
+    )
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    # Media processing
+    "MediaProcessor": "ai_content.integrations.media",
+    "check_ffmpeg_available": "ai_content.integrations.media",
+    # Archive.org
+    "ArchiveOrgSource": "ai_content.integrations.archive",
+    "SourceMetadata": "ai_content.integrations.archive",
+    # YouTube
+    "YouTubeUploader": "ai_content.integrations.youtube",
+}
 
 __all__ = [
     # Media processing
@@ -22,3 +42,15 @@ __all__ = [
     # YouTube
     "YouTubeUploader",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value  # Cache so later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
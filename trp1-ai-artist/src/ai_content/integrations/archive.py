@@ -4,16 +4,42 @@ Archive.org integration.
 Search and fetch content from Archive.org for use as source material.
 """
 
+import asyncio
+import json
 import logging
+import time
+import weakref
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
 import httpx
 
+from ai_content.utils.http import HTTP2_AVAILABLE
+
+try:
+    import orjson  # Optional, from the "perf" extra
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_ARCHIVE_URL = "https://archive.org"
+_DETAILS_PREFIX = f"{_ARCHIVE_URL}/details/"
+_THUMBNAIL_PREFIX = f"{_ARCHIVE_URL}/services/img/"
+
+# File suffixes treated as usable media; a tuple so endswith() checks them all at once
+_MEDIA_EXTS = (".mp3", ".mp4", ".wav", ".ogg", ".jpg", ".png")
+
+
+def _parse_json(content: bytes) -> Any:
+    """Parse a response body, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(content)  # Parses bytes directly, no str decode
+    return json.loads(content)
+
 
-@dataclass
+@dataclass(slots=True)
 class SourceMetadata:
     """Metadata about an Archive.org item."""
 
@@ -22,14 +48,18 @@ class SourceMetadata:
     description: str = ""
     creator: str = ""
     date: str = ""
-    thumbnail_url: str = ""
     media_urls: list[str] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
 
     @property
     def archive_url(self) -> str:
         """Direct link to Archive.org page."""
-        return f"https://archive.org/details/{self.identifier}"
+        return f"{_DETAILS_PREFIX}{self.identifier}"
+
+    @property
+    def thumbnail_url(self) -> str:
+        """Thumbnail image URL, built on access rather than stored per item."""
+        return f"{_THUMBNAIL_PREFIX}{self.identifier}"
 
 
 class ArchiveOrgSource:
@@ -45,14 +75,130 @@ class ArchiveOrgSource:
         >>> source = ArchiveOrgSource()
         >>> results = await source.search("1930s jazz")
         >>> metadata = await source.get_metadata(results[0].identifier)
+
+        >>> # Or as a context manager, closing the shared HTTP client on exit
+        >>> async with ArchiveOrgSource() as source:
+        ...     results = await source.search("1930s jazz")
+
+    Responses are cached in-process. Once an entry's TTL expires it is
+    revalidated with a conditional GET (If-None-Match / If-Modified-Since),
+    so unchanged items cost a 304 rather than a full download.
     """
 
-    BASE_URL = "https://archive.org"
+    BASE_URL = _ARCHIVE_URL
     API_URL = "https://archive.org/advancedsearch.php"
     METADATA_URL = "https://archive.org/metadata"
 
-    def __init__(self, timeout: float = 30.0):
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        search_ttl: float = 900.0,
+        metadata_ttl: float = 86400.0,
+    ):
         self.timeout = timeout
+        self.search_ttl = search_ttl
+        self.metadata_ttl = metadata_ttl
+        self._http_client: httpx.AsyncClient | None = None
+        # key -> (expires_at, validator headers, parsed value)
+        self._search_cache: dict[tuple, tuple[float, dict[str, str], list[SourceMetadata]]] = {}
+        self._metadata_cache: dict[str, tuple[float, dict[str, str], SourceMetadata]] = {}
+        # One lock per (url, key) so concurrent identical lookups share a single
+        # request. Weak values: a lock goes away once no task holds or waits on it.
+        self._locks: weakref.WeakValueDictionary[tuple, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+
+    async def __aenter__(self) -> "ArchiveOrgSource":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the HTTP client, shared so connections are reused."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+                # Multiplex concurrent requests on one connection when h2 is installed.
+                # httpx also advertises "br" encoding by itself once brotli is installed.
+                http2=HTTP2_AVAILABLE,
+            )
+        return self._http_client
+
+    async def close(self):
+        """Close the HTTP client."""
+        if self._http_client and not self._http_client.is_closed:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    def clear_cache(self):
+        """Drop all cached search and metadata responses."""
+        self._search_cache.clear()
+        self._metadata_cache.clear()
+
+    async def _cached_get(
+        self,
+        cache: dict,
+        key: Any,
+        ttl: float,
+        url: str,
+        parse: Callable[[dict], Any],
+        params: dict | None = None,
+    ) -> Any:
+        """
+        GET a JSON resource through a TTL cache with conditional revalidation.
+
+        Args:
+            cache: Cache dict to read and update
+            key: Cache key
+            ttl: Seconds a response stays fresh
+            url: Path relative to BASE_URL
+            parse: Turns the response JSON into the value to cache
+            params: Query parameters
+
+        Returns:
+            The parsed (possibly cached) value
+        """
+        entry = cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[2]
+
+        lock = self._locks.get((url, key))
+        if lock is None:
+            lock = self._locks[url, key] = asyncio.Lock()
+        async with lock:
+            # Another task may have refreshed the entry while we waited
+            entry = cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[2]
+
+            headers = {}
+            if entry:
+                validators = entry[1]
+                if "etag" in validators:
+                    headers["If-None-Match"] = validators["etag"]
+                if "last-modified" in validators:
+                    headers["If-Modified-Since"] = validators["last-modified"]
+
+            client = await self._get_client()
+            response = await client.get(url, params=params, headers=headers)
+
+            if entry and response.status_code == 304:
+                logger.debug(f"   Not modified: {url}")
+                cache[key] = (time.monotonic() + ttl, entry[1], entry[2])
+                return entry[2]
+
+            response.raise_for_status()
+            value = parse(_parse_json(response.content))
+            validators = {
+                name: response.headers[name]
+                for name in ("etag", "last-modified")
+                if name in response.headers
+            }
+            cache[key] = (time.monotonic() + ttl, validators, value)
+            return value
 
     async def search(
         self,
@@ -90,29 +236,34 @@ class ArchiveOrgSource:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(self.API_URL, params=params)
-                response.raise_for_status()
-                data = response.json()
+            results = await self._cached_get(
+                self._search_cache,
+                (query, media_type, limit, sort),
+                self.search_ttl,
+                "/advancedsearch.php",
+                self._parse_search,
+                params=params,
+            )
         except Exception as e:
             logger.error(f"Archive.org search failed: {e}")
             return []
 
+        logger.info(f"   Found {len(results)} results")
+        return list(results)  # Callers may mutate; keep the cached list intact
+
+    def _parse_search(self, data: dict) -> list[SourceMetadata]:
+        """Build SourceMetadata entries from an advancedsearch response."""
         results = []
         for doc in data.get("response", {}).get("docs", []):
-            identifier = doc.get("identifier", "")
             results.append(
                 SourceMetadata(
-                    identifier=identifier,
+                    identifier=doc.get("identifier", ""),
                     title=doc.get("title", ""),
                     description=doc.get("description", ""),
                     creator=doc.get("creator", ""),
                     date=doc.get("date", ""),
-                    thumbnail_url=f"{self.BASE_URL}/services/img/{identifier}",
                 )
             )
-
-        logger.info(f"   Found {len(results)} results")
         return results
 
     async def get_metadata(self, identifier: str) -> SourceMetadata | None:
@@ -127,26 +278,30 @@ class ArchiveOrgSource:
         """
         logger.info(f"📦 Fetching metadata: {identifier}")
 
-        url = f"{self.METADATA_URL}/{identifier}"
-
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
+            return await self._cached_get(
+                self._metadata_cache,
+                identifier,
+                self.metadata_ttl,
+                f"/metadata/{identifier}",
+                lambda data: self._parse_metadata(identifier, data),
+            )
         except Exception as e:
             logger.error(f"Metadata fetch failed: {e}")
             return None
 
+    def _parse_metadata(self, identifier: str, data: dict) -> SourceMetadata:
+        """Build SourceMetadata from a /metadata response."""
         metadata = data.get("metadata", {})
         files = data.get("files", [])
 
         # Extract media URLs
-        media_urls = []
-        for f in files:
-            name = f.get("name", "")
-            if any(name.endswith(ext) for ext in [".mp3", ".mp4", ".wav", ".ogg", ".jpg", ".png"]):
-                media_urls.append(f"{self.BASE_URL}/download/{identifier}/{name}")
+        download_base = f"{self.BASE_URL}/download/{identifier}/"
+        media_urls = [
+            download_base + name
+            for f in files
+            if (name := f.get("name", "")).endswith(_MEDIA_EXTS)
+        ]
 
         return SourceMetadata(
             identifier=identifier,
@@ -154,14 +309,47 @@ class ArchiveOrgSource:
             description=metadata.get("description", ""),
             creator=metadata.get("creator", ""),
             date=metadata.get("date", ""),
-            thumbnail_url=f"{self.BASE_URL}/services/img/{identifier}",
             media_urls=media_urls,
             metadata=metadata,
         )
 
+    async def get_metadata_many(
+        self,
+        identifiers: list[str],
+        concurrency: int = 8,
+    ) -> list[SourceMetadata | None]:
+        """
+        Get metadata for several items concurrently.
+
+        Args:
+            identifiers: Archive.org item identifiers
+            concurrency: Maximum requests in flight, to respect rate limits
+
+        Returns:
+            SourceMetadata (or None if the fetch failed) per identifier, in order
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def fetch(identifier: str) -> SourceMetadata | None:
+            async with sem:
+                return await self.get_metadata(identifier)
+
+        results = await asyncio.gather(
+            *(fetch(identifier) for identifier in identifiers),
+            return_exceptions=True,
+        )
+
+        metadata = []
+        for identifier, result in zip(identifiers, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Metadata fetch failed for {identifier}: {result}")
+                result = None
+            metadata.append(result)
+        return metadata
+
     async def get_thumbnail_url(self, identifier: str) -> str:
         """Get thumbnail URL for an item."""
-        return f"{self.BASE_URL}/services/img/{identifier}"
+        return f"{_THUMBNAIL_PREFIX}{identifier}"
 
     async def get_download_url(
         self,
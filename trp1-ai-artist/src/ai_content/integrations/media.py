@@ -8,9 +8,15 @@ Audio/video processing with FFmpeg for:
 """
 
 import asyncio
+import contextlib
 import logging
+import os
+import re
 import shutil
+import struct
 import subprocess
+import wave
+from collections import OrderedDict, deque
 from pathlib import Path
 from typing import Optional
 
@@ -18,12 +24,113 @@ from ai_content.core.exceptions import ProviderError
 
 logger = logging.getLogger(__name__)
 
+# (path, mtime_ns, size) -> duration in seconds, least recently used first
+_DURATION_CACHE_SIZE = 256
+_duration_cache: OrderedDict[tuple[str, int, int], float] = OrderedDict()
+
+_MP4_SUFFIXES = {".mp4", ".m4a", ".m4v", ".mov"}
+
+# Audio codecs MP4/MOV can hold as-is, so merging can copy them
+_MP4_AUDIO_CODECS = {"aac", "mp3", "alac", "ac3", "eac3", "opus"}
+# Video encoders that take an x264-style speed/quality -preset
+_PRESET_ENCODERS = {"libx264", "libx265"}
+
+# Lines of stderr kept for error messages; the rest is discarded as it streams
+_STDERR_TAIL_LINES = 200
+
+# Global options so FFmpeg reports machine-readable progress instead of stats
+_PROGRESS_ARGS = ["-progress", "pipe:2", "-nostats"]
+_PROGRESS_LINE = re.compile(rb"^(\w+)=(\S*)$")
+
 
 def check_ffmpeg_available() -> bool:
     """Check if FFmpeg is available on the system."""
     return shutil.which("ffmpeg") is not None
 
 
+def _header_duration(path: Path) -> float | None:
+    """Read duration from a WAV or MP4 header, or None if not possible."""
+    suffix = path.suffix.lower()
+    try:
+        if suffix == ".wav":
+            with wave.open(str(path), "rb") as wav:
+                return wav.getnframes() / wav.getframerate()
+        if suffix in _MP4_SUFFIXES:
+            return _mp4_duration(path)
+    except (OSError, EOFError, wave.Error, struct.error, ZeroDivisionError):
+        pass
+    return None
+
+
+def _iter_boxes(f, end: int):
+    """Yield (type, payload_start, payload_end) for MP4 boxes up to end."""
+    pos = f.tell()
+    while pos + 8 <= end:
+        size, box_type = struct.unpack(">I4s", f.read(8))
+        header = 8
+        if size == 1:
+            size = struct.unpack(">Q", f.read(8))[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header:
+            return
+        yield box_type, pos + header, pos + size
+        pos += size
+        f.seek(pos)
+
+
+def _mp4_duration(path: Path) -> float | None:
+    """Read the movie duration from the moov/mvhd box of an MP4/MOV file."""
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        f.seek(0)
+        for box_type, start, box_end in _iter_boxes(f, end):
+            if box_type != b"moov":
+                continue
+            f.seek(start)
+            for child, child_start, _ in _iter_boxes(f, box_end):
+                if child != b"mvhd":
+                    continue
+                f.seek(child_start)
+                if not (version := f.read(1)):
+                    return None  # Truncated file: mvhd header at EOF
+                if version[0] == 1:
+                    timescale, duration = struct.unpack(">19xIQ", f.read(31))
+                else:
+                    timescale, duration = struct.unpack(">11xII", f.read(19))
+                return duration / timescale if timescale else None
+    return None
+
+
+async def _drain_stderr(stream: asyncio.StreamReader, tail: deque) -> None:
+    """Consume stderr, logging progress and keeping only the last lines."""
+    async for line in stream:
+        match = _PROGRESS_LINE.match(line.strip())
+        if match:
+            if match.group(1) == b"out_time":
+                logger.debug(f"   ffmpeg progress: {match.group(2).decode()}")
+        else:
+            tail.append(line)
+
+
+async def _communicate(process: asyncio.subprocess.Process) -> tuple[bytes, bytes]:
+    """
+    Wait for a process, reading stdout fully but only the tail of stderr.
+
+    Unlike communicate(), memory stays bounded no matter how much
+    progress output a long encode writes.
+    """
+    tail: deque[bytes] = deque(maxlen=_STDERR_TAIL_LINES)
+    tasks = [_drain_stderr(process.stderr, tail)]
+    if process.stdout is not None:
+        tasks.append(process.stdout.read())
+    results = await asyncio.gather(*tasks)
+    await process.wait()
+    stdout = results[1] if len(results) > 1 else b""
+    return stdout, b"".join(tail)
+
+
 class MediaProcessor:
     """
     Media processing using FFmpeg.
@@ -43,8 +150,10 @@ class MediaProcessor:
         ... )
     """
 
-    def __init__(self, ffmpeg_path: str | None = None):
+    def __init__(self, ffmpeg_path: str | None = None, max_workers: int | None = None):
         self.ffmpeg_path = ffmpeg_path or shutil.which("ffmpeg") or "ffmpeg"
+        # Caps concurrent FFmpeg processes so batches don't oversubscribe the CPU
+        self._workers = asyncio.Semaphore(max_workers or os.cpu_count() or 1)
 
         if not check_ffmpeg_available():
             logger.warning("⚠️ FFmpeg not found. Media processing will fail.")
@@ -58,6 +167,8 @@ class MediaProcessor:
         audio_codec: str = "aac",
         video_codec: str = "copy",
         overwrite: bool = True,
+        remux_only: bool = True,
+        encoder_preset: str = "veryfast",
     ) -> Path:
         """
         Merge audio and video into a single file.
@@ -69,6 +180,61 @@ class MediaProcessor:
             audio_codec: Audio codec (default: aac)
             video_codec: Video codec (default: copy = no re-encoding)
             overwrite: Overwrite existing output
+            remux_only: Copy the audio stream instead of encoding to
+                audio_codec when the output container supports it as-is
+            encoder_preset: x264/x265 speed preset, used when video_codec
+                re-encodes (default: veryfast)
+
+        Returns:
+            Path to merged file
+
+        Raises:
+            ProviderError: If merge fails
+        """
+        return await self.merge_and_trim(
+            audio_path,
+            video_path,
+            output_path,
+            audio_codec=audio_codec,
+            video_codec=video_codec,
+            overwrite=overwrite,
+            remux_only=remux_only,
+            encoder_preset=encoder_preset,
+        )
+
+    async def merge_and_trim(
+        self,
+        audio_path: Path | str,
+        video_path: Path | str,
+        output_path: Path | str,
+        *,
+        start_seconds: float = 0,
+        duration_seconds: float | None = None,
+        audio_codec: str = "aac",
+        video_codec: str = "copy",
+        overwrite: bool = True,
+        remux_only: bool = True,
+        encoder_preset: str = "veryfast",
+    ) -> Path:
+        """
+        Trim and merge audio and video in a single FFmpeg run.
+
+        Equivalent to trimming both inputs and then merging them, without
+        the intermediate files or the second process.
+
+        Args:
+            audio_path: Path to audio file
+            video_path: Path to video file
+            output_path: Output file path
+            start_seconds: Start time in seconds, applied to both inputs
+            duration_seconds: Duration to keep (default: until shortest ends)
+            audio_codec: Audio codec (default: aac)
+            video_codec: Video codec (default: copy = no re-encoding)
+            overwrite: Overwrite existing output
+            remux_only: Copy the audio stream instead of encoding to
+                audio_codec when the output container supports it as-is
+            encoder_preset: x264/x265 speed preset, used when video_codec
+                re-encodes (default: veryfast)
 
         Returns:
             Path to merged file
@@ -87,44 +253,57 @@ class MediaProcessor:
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        mp4_output = output_path.suffix.lower() in _MP4_SUFFIXES
+        if remux_only and mp4_output and audio_codec != "copy":
+            # Remuxing takes well under a second; re-encoding is realtime-bound
+            if await self._probe_codec(audio_path, "a:0") in _MP4_AUDIO_CODECS:
+                audio_codec = "copy"
+
+        seek = ["-ss", str(start_seconds)] if start_seconds else []
         cmd = [
             self.ffmpeg_path,
+            *_PROGRESS_ARGS,
             "-y" if overwrite else "-n",
+            *seek,
             "-i",
             str(video_path),
+            *seek,
             "-i",
             str(audio_path),
-            "-c:v",
-            video_codec,
-            "-c:a",
-            audio_codec,
-            "-shortest",  # End when shortest stream ends
-            "-map",
-            "0:v:0",  # Video from first input
-            "-map",
-            "1:a:0",  # Audio from second input
-            str(output_path),
         ]
+        if duration_seconds:
+            cmd.extend(["-t", str(duration_seconds)])
+        cmd.extend(["-c:v", video_codec])
+        if video_codec != "copy":
+            # Use every core; the output is a finished file, so no latency tuning
+            cmd.extend(["-threads", "0"])
+            if video_codec in _PRESET_ENCODERS:
+                cmd.extend(["-preset", encoder_preset])
+        cmd.extend(
+            [
+                "-c:a",
+                audio_codec,
+                "-shortest",  # End when shortest stream ends
+                "-map",
+                "0:v:0",  # Video from first input
+                "-map",
+                "1:a:0",  # Audio from second input
+            ]
+        )
+        if mp4_output:
+            # Index at the front so playback can start before the download ends
+            cmd.extend(["-movflags", "+faststart"])
+        cmd.append(str(output_path))
 
         logger.info(f"🔀 Merging: {video_path.name} + {audio_path.name}")
 
-        try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, stderr = await process.communicate()
-
-            if process.returncode != 0:
-                error_msg = stderr.decode() if stderr else "Unknown error"
-                raise ProviderError("ffmpeg", f"Merge failed: {error_msg}")
-
-            logger.info(f"   ✅ Output: {output_path}")
-            return output_path
+        returncode, _, stderr = await self._run(cmd)
+        if returncode != 0:
+            error_msg = stderr.decode() if stderr else "Unknown error"
+            raise ProviderError("ffmpeg", f"Merge failed: {error_msg}")
 
-        except FileNotFoundError:
-            raise ProviderError("ffmpeg", "FFmpeg not found. Please install FFmpeg.")
+        logger.info(f"   ✅ Output: {output_path}")
+        return output_path
 
     async def convert_format(
         self,
@@ -157,6 +336,7 @@ class MediaProcessor:
 
         cmd = [
             self.ffmpeg_path,
+            *_PROGRESS_ARGS,
             "-y" if overwrite else "-n",
             "-i",
             str(input_path),
@@ -165,14 +345,8 @@ class MediaProcessor:
 
         logger.info(f"🔄 Converting: {input_path.name} → {output_path.suffix}")
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await process.communicate()
-
-        if process.returncode != 0:
+        returncode, _, stderr = await self._run(cmd)
+        if returncode != 0:
             error_msg = stderr.decode() if stderr else "Unknown error"
             raise ProviderError("ffmpeg", f"Conversion failed: {error_msg}")
 
@@ -206,6 +380,7 @@ class MediaProcessor:
 
         cmd = [
             self.ffmpeg_path,
+            *_PROGRESS_ARGS,
             "-y",
             "-ss",
             str(start_seconds),
@@ -220,39 +395,211 @@ class MediaProcessor:
 
         cmd.extend(["-c", "copy", str(output_path)])
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        await process.communicate()
-
-        if process.returncode != 0:
+        returncode, _, _ = await self._run(cmd)
+        if returncode != 0:
             raise ProviderError("ffmpeg", "Trim failed")
 
         return output_path
 
+    async def pipeline(
+        self,
+        input_path: Path | str,
+        stages: list[list[str]],
+        output_path: Path | str,
+        *,
+        container: str = "matroska",
+        overwrite: bool = True,
+    ) -> Path:
+        """
+        Run several FFmpeg stages connected by pipes.
+
+        Each stage is a list of FFmpeg options placed between its input and
+        output (e.g. ``["-ss", "5", "-t", "30", "-c", "copy"]``). Stages pass
+        data to each other in a streamable container over OS pipes, so no
+        intermediate files are written. Only the first stage reads a real
+        file, so put stages that need to seek in their input first.
+
+        Args:
+            input_path: Input file for the first stage
+            stages: FFmpeg options per stage, in order
+            output_path: Output file written by the last stage
+            container: Container format used between stages
+            overwrite: Overwrite existing output
+
+        Returns:
+            Path to the output file
+
+        Raises:
+            ProviderError: If any stage fails
+        """
+        if not stages:
+            raise ValueError("pipeline() needs at least one stage")
+
+        input_path = Path(input_path)
+        output_path = Path(output_path)
+        if not input_path.exists():
+            raise ProviderError("ffmpeg", f"Input file not found: {input_path}")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        last = len(stages) - 1
+        commands = []
+        for i, options in enumerate(stages):
+            cmd = [self.ffmpeg_path, *_PROGRESS_ARGS, "-y" if overwrite else "-n"]
+            cmd += ["-i", str(input_path) if i == 0 else "pipe:0", *options]
+            cmd += [str(output_path)] if i == last else ["-f", container, "pipe:1"]
+            commands.append(cmd)
+
+        logger.info(f"🔗 Piping {input_path.name} through {len(stages)} FFmpeg stages")
+
+        # The stages stream into each other and finish together, so the whole
+        # pipeline counts as one job against max_workers. Taking a permit per
+        # stage could deadlock once a pipeline has more stages than permits.
+        async with self._workers:
+            processes = []
+            stdin = None
+            try:
+                for i, cmd in enumerate(commands):
+                    read_fd, write_fd = os.pipe() if i < last else (None, None)
+                    try:
+                        process = await asyncio.create_subprocess_exec(
+                            *cmd,
+                            stdin=stdin if stdin is not None else asyncio.subprocess.DEVNULL,
+                            stdout=write_fd if write_fd is not None else asyncio.subprocess.PIPE,
+                            stderr=asyncio.subprocess.PIPE,
+                        )
+                    except BaseException:
+                        if read_fd is not None:
+                            os.close(read_fd)
+                        raise
+                    finally:
+                        # The children hold their own copies of the pipe ends
+                        if stdin is not None:
+                            os.close(stdin)
+                        if write_fd is not None:
+                            os.close(write_fd)
+                    stdin = read_fd
+                    processes.append(process)
+
+                outputs = await asyncio.gather(*(_communicate(p) for p in processes))
+            except BaseException as e:
+                # Don't leave stages running (or unreaped) on failure or cancellation
+                for process in processes:
+                    with contextlib.suppress(ProcessLookupError):
+                        process.kill()
+                await asyncio.gather(*(p.wait() for p in processes), return_exceptions=True)
+                if isinstance(e, FileNotFoundError):
+                    raise ProviderError("ffmpeg", "FFmpeg not found. Please install FFmpeg.") from e
+                raise
+
+        for i, (process, (_, stderr)) in enumerate(zip(processes, outputs)):
+            if process.returncode != 0:
+                error_msg = stderr.decode() if stderr else "Unknown error"
+                raise ProviderError("ffmpeg", f"Pipeline stage {i + 1} failed: {error_msg}")
+
+        logger.info(f"   ✅ Output: {output_path}")
+        return output_path
+
     async def get_duration(self, file_path: Path | str) -> float:
-        """Get duration of media file in seconds."""
+        """
+        Get duration of media file in seconds.
+
+        WAV and MP4/MOV durations are read straight from the container
+        header; other formats fall back to ffprobe. Results are cached
+        per (path, mtime, size), so re-querying an unchanged file is free.
+        """
+        path = Path(file_path)
+        try:
+            st = path.stat()
+        except OSError:
+            return 0.0
+
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        if key in _duration_cache:
+            _duration_cache.move_to_end(key)
+            return _duration_cache[key]
+
+        duration = await asyncio.to_thread(_header_duration, path)
+        if duration is None:
+            duration = await self._probe_duration(path)
+
+        if duration > 0:
+            _duration_cache[key] = duration
+            if len(_duration_cache) > _DURATION_CACHE_SIZE:
+                _duration_cache.popitem(last=False)
+        return duration
+
+    async def _probe_codec(self, file_path: Path, stream: str) -> str | None:
+        """Get the codec name of a stream (e.g. "a:0") with ffprobe."""
         cmd = [
             "ffprobe",
             "-v",
             "error",
+            "-select_streams",
+            stream,
             "-show_entries",
-            "format=duration",
+            "stream=codec_name",
             "-of",
             "default=noprint_wrappers=1:nokey=1",
             str(file_path),
         ]
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, _ = await process.communicate()
+        try:
+            returncode, stdout, _ = await self._run(cmd, capture_stdout=True)
+        except ProviderError:
+            return None
+        codec = stdout.decode().strip()
+        return codec if returncode == 0 and codec else None
+
+    async def _probe_duration(self, file_path: Path) -> float:
+        """Get duration with ffprobe."""
+        cmd = [
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "default=noprint_wrappers=1:nokey=1",
+            str(file_path),
+        ]
 
         try:
+            _, stdout, _ = await self._run(cmd, capture_stdout=True)
             return float(stdout.decode().strip())
-        except ValueError:
+        except (ProviderError, ValueError):
             return 0.0
+
+    async def _run(
+        self,
+        cmd: list[str],
+        *,
+        capture_stdout: bool = False,
+    ) -> tuple[int, bytes, bytes]:
+        """
+        Run an FFmpeg/ffprobe command without blocking the event loop.
+
+        Bounded by the worker limit. stdin is closed so FFmpeg never waits
+        on (or swallows) terminal input.
+
+        Args:
+            cmd: Command and arguments
+            capture_stdout: Collect stdout (ffprobe); otherwise it's discarded
+
+        Returns:
+            (returncode, stdout, stderr)
+
+        Raises:
+            ProviderError: If the executable is not installed
+        """
+        async with self._workers:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=asyncio.subprocess.DEVNULL,
+                    stdout=asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            except FileNotFoundError as e:
+                raise ProviderError("ffmpeg", "FFmpeg not found. Please install FFmpeg.") from e
+            stdout, stderr = await _communicate(process)
+        return process.returncode, stdout, stderr
@@ -4,13 +4,34 @@ YouTube upload integration.
 Upload generated videos to YouTube using OAuth2 authentication.
 """
 
+import asyncio
 import json
 import logging
+import mimetypes
 from pathlib import Path
 from typing import Any, Optional
 
+import httpx
+
+from ai_content.utils.retry import RetryConfig, retry_async
+
 logger = logging.getLogger(__name__)
 
+# Upload failures worth retrying: rate limiting and server-side errors
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class _RetryableUploadError(Exception):
+    """A transient failure while starting an upload session."""
+
+
+_RETRY = RetryConfig(
+    max_attempts=5,
+    base_delay=1.0,
+    max_delay=60.0,
+    retryable_exceptions=(httpx.TransportError, _RetryableUploadError),
+)
+
 
 class YouTubeUploader:
     """
@@ -39,6 +60,8 @@ class YouTubeUploader:
     """
 
     SCOPES = ["https://www.googleapis.com/auth/youtube.upload"]
+    UPLOAD_URL = "https://www.googleapis.com/upload/youtube/v3/videos"
+    CHUNK_SIZE = 8 * 1024 * 1024  # Resumable upload chunk; must be a multiple of 256 KiB
 
     def __init__(
         self,
@@ -48,17 +71,36 @@ class YouTubeUploader:
         self.credentials_path = Path(credentials_path)
         self.token_path = Path(token_path)
         self.youtube = None
+        self._creds = None
         self._authenticated = False
+        self._http_client: httpx.AsyncClient | None = None
+        self._refresh_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "YouTubeUploader":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
 
     async def authenticate(self) -> bool:
         """
         Authenticate with YouTube API.
 
-        Opens browser for OAuth consent if no saved token.
+        Opens browser for OAuth consent if no saved token. The API client
+        and credentials are kept, so later calls only refresh an expired token.
 
         Returns:
             True if authentication successful
         """
+        if self._authenticated and self.youtube and self._creds and self._creds.valid:
+            return True
+
+        # Token refresh, the browser consent flow, the token file write and
+        # the client build all block; run them off the event loop
+        return await asyncio.to_thread(self._authenticate_blocking)
+
+    def _authenticate_blocking(self) -> bool:
+        """Load, refresh or obtain credentials and build the API client."""
         try:
             from google_auth_oauthlib.flow import InstalledAppFlow
             from googleapiclient.discovery import build
@@ -70,10 +112,10 @@ class YouTubeUploader:
             )
             return False
 
-        creds = None
+        creds = self._creds
 
         # Load existing token
-        if self.token_path.exists():
+        if creds is None and self.token_path.exists():
             try:
                 creds = Credentials.from_authorized_user_file(str(self.token_path), self.SCOPES)
             except Exception:
@@ -102,7 +144,11 @@ class YouTubeUploader:
             with open(self.token_path, "w") as f:
                 f.write(creds.to_json())
 
-        self.youtube = build("youtube", "v3", credentials=creds)
+        if self.youtube is None or creds is not self._creds:
+            # Use the discovery document bundled with the client library
+            # instead of fetching it over the network
+            self.youtube = build("youtube", "v3", credentials=creds, static_discovery=True)
+        self._creds = creds
         self._authenticated = True
         logger.info("✅ YouTube authenticated")
         return True
@@ -133,6 +179,8 @@ class YouTubeUploader:
 
         Raises:
             RuntimeError: If not authenticated or upload fails
+            FileNotFoundError: If the video file does not exist
+            ValueError: If the video file is empty
         """
         if not self._authenticated:
             success = await self.authenticate()
@@ -142,11 +190,9 @@ class YouTubeUploader:
         video_path = Path(video_path)
         if not video_path.exists():
             raise FileNotFoundError(f"Video not found: {video_path}")
-
-        try:
-            from googleapiclient.http import MediaFileUpload
-        except ImportError:
-            raise RuntimeError("google-api-python-client not installed")
+        total = video_path.stat().st_size
+        if total == 0:
+            raise ValueError(f"Video file is empty: {video_path}")
 
         logger.info(f"📤 Uploading to YouTube: {video_path.name}")
 
@@ -164,28 +210,159 @@ class YouTubeUploader:
         if tags:
             body["snippet"]["tags"] = tags
 
-        media = MediaFileUpload(
-            str(video_path),
-            chunksize=-1,
-            resumable=True,
+        session_url = await retry_async(self._start_session, video_path, body, total, config=_RETRY)
+        video_id = await self._send_chunks(session_url, video_path, total)
+
+        logger.info(f"✅ Uploaded: https://youtube.com/watch?v={video_id}")
+        return video_id
+
+    async def _start_session(self, video_path: Path, body: dict[str, Any], total: int) -> str:
+        """Open a resumable upload session and return its URL."""
+        client = await self._get_client()
+        response = await client.post(
+            self.UPLOAD_URL,
+            params={"uploadType": "resumable", "part": "snippet,status"},
+            json=body,
+            headers={
+                **await self._auth_headers(),
+                "X-Upload-Content-Type": mimetypes.guess_type(video_path.name)[0] or "video/*",
+                "X-Upload-Content-Length": str(total),
+            },
         )
+        if response.status_code in _RETRY_STATUSES:
+            raise _RetryableUploadError(f"HTTP {response.status_code}")
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"YouTube upload failed: {response.status_code} {response.text}"
+            )
+        return response.headers["Location"]
 
-        # This is synchronous, but we're wrapping it
-        import asyncio
+    async def _send_chunks(self, session_url: str, video_path: Path, total: int) -> str:
+        """
+        PUT the file to an upload session in CHUNK_SIZE pieces.
+
+        After a transient failure (network error, 429 or 5xx) the session
+        is asked how much it received, and the upload resumes from there.
 
-        def do_upload():
-            request = self.youtube.videos().insert(
-                part="snippet,status",
-                body=body,
-                media_body=media,
+        Returns:
+            YouTube video ID
+        """
+        client = await self._get_client()
+        offset = 0
+        retries = 0
+        resync = False
+
+        with open(video_path, "rb") as f:
+
+            def read_chunk(start: int) -> bytes:
+                f.seek(start)
+                return f.read(self.CHUNK_SIZE)
+
+            while True:
+                if resync:
+                    content = b""
+                    content_range = f"bytes */{total}"
+                else:
+                    content = await asyncio.to_thread(read_chunk, offset)
+                    content_range = f"bytes {offset}-{offset + len(content) - 1}/{total}"
+
+                try:
+                    response = await client.put(
+                        session_url,
+                        content=content,
+                        headers={**await self._auth_headers(), "Content-Range": content_range},
+                    )
+                    status_code = response.status_code
+                except httpx.TransportError as e:
+                    response, status_code = None, None
+                    error = str(e)
+
+                if status_code in (200, 201):
+                    return response.json()["id"]
+
+                if status_code == 308:  # Resume Incomplete: server reports what it has
+                    received = response.headers.get("Range")
+                    offset = int(received.rsplit("-", 1)[1]) + 1 if received else 0
+                    resync = False
+                    retries = 0
+                    logger.info(f"   {video_path.name}: {offset * 100 // total}%")
+                    continue
+
+                if response is None or status_code in _RETRY_STATUSES:
+                    retries += 1
+                    if response is not None:
+                        error = f"HTTP {status_code}"
+                    if retries > _RETRY.max_attempts:
+                        raise RuntimeError(f"YouTube upload failed after {retries} retries: {error}")
+                    delay = min(_RETRY.base_delay * _RETRY.exponential_base**retries, _RETRY.max_delay)
+                    logger.warning(f"   Upload interrupted ({error}), resuming in {delay:.0f}s...")
+                    await asyncio.sleep(delay)
+                    resync = True
+                    continue
+
+                raise RuntimeError(f"YouTube upload failed: {status_code} {response.text}")
+
+    async def _auth_headers(self) -> dict[str, str]:
+        """Bearer token header, refreshing the access token when it expires."""
+        if not self._creds.valid:
+            async with self._refresh_lock:
+                if not self._creds.valid:
+                    from google.auth.transport.requests import Request
+
+                    await asyncio.to_thread(self._creds.refresh, Request())
+        return {"Authorization": f"Bearer {self._creds.token}"}
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the HTTP client, shared by all uploads."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(60.0, connect=10.0),
+                limits=httpx.Limits(max_connections=4),
             )
-            response = request.execute()
-            return response.get("id")
+        return self._http_client
 
-        video_id = await asyncio.get_event_loop().run_in_executor(None, do_upload)
+    async def close(self):
+        """Close the HTTP client."""
+        if self._http_client and not self._http_client.is_closed:
+            await self._http_client.aclose()
+            self._http_client = None
 
-        logger.info(f"✅ Uploaded: https://youtube.com/watch?v={video_id}")
-        return video_id
+    async def upload_many(
+        self,
+        videos: list[dict[str, Any]],
+        concurrency: int = 2,
+    ) -> list[str | None]:
+        """
+        Upload several videos concurrently.
+
+        Args:
+            videos: Keyword arguments for upload(), one dict per video
+            concurrency: Maximum uploads in flight
+
+        Returns:
+            Video ID per entry, in order (None if that upload failed)
+        """
+        if not self._authenticated and not await self.authenticate():
+            raise RuntimeError("YouTube authentication failed")
+
+        sem = asyncio.Semaphore(concurrency)
+
+        async def upload_one(kwargs: dict[str, Any]) -> str:
+            async with sem:
+                return await self.upload(**kwargs)
+
+        results = await asyncio.gather(
+            *(upload_one(kwargs) for kwargs in videos),
+            return_exceptions=True,
+        )
+
+        video_ids = []
+        for kwargs, result in zip(videos, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Upload failed for {kwargs.get('video_path')}: {result}")
+                result = None
+            video_ids.append(result)
+        return video_ids
 
     def get_video_url(self, video_id: str) -> str:
         """Get YouTube video URL from ID."""
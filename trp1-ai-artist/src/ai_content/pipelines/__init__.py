@@ -3,15 +3,18 @@
 from ai_content.pipelines.base import (
     PipelineResult,
     PipelineConfig,
+    ConcurrencyLimiter,
 )
-from ai_content.pipelines.music import MusicPipeline
+from ai_content.pipelines.music import MusicPipeline, WorkflowSpec
 from ai_content.pipelines.video import VideoPipeline
 from ai_content.pipelines.full import FullContentPipeline
 
 __all__ = [
     "PipelineResult",
     "PipelineConfig",
+    "ConcurrencyLimiter",
     "MusicPipeline",
+    "WorkflowSpec",
     "VideoPipeline",
     "FullContentPipeline",
 ]
@@ -2,6 +2,10 @@
 Base pipeline abstractions.
 """
 
+import asyncio
+import json
+import os
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -9,8 +13,22 @@ from typing import Any
 
 from ai_content.core.result import GenerationResult
 
+try:
+    import orjson  # Optional, from the "perf" extra
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _json_default(value: Any) -> Any:
+    """Serialize values JSON doesn't handle natively (paths, datetimes)."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+@dataclass(slots=True)
 class PipelineResult:
     """
     Result of a pipeline execution.
@@ -24,22 +42,35 @@ class PipelineResult:
     started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     completed_at: datetime | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Monotonic timing; started_at/completed_at are wall-clock for display
+    _start_ns: int = field(
+        default_factory=time.perf_counter_ns, init=False, repr=False, compare=False
+    )
+    _duration: float | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def duration_seconds(self) -> float:
-        """Calculate pipeline duration."""
-        if self.completed_at is None:
-            return 0.0
-        return (self.completed_at - self.started_at).total_seconds()
+        """Pipeline duration, or time elapsed so far if still running."""
+        if self._duration is not None:
+            return self._duration
+        return (time.perf_counter_ns() - self._start_ns) / 1e9
 
     @property
     def output_files(self) -> list[Path]:
         """Get all output file paths."""
-        return [
-            output.file_path
-            for output in self.outputs.values()
-            if output.file_path and output.file_path.exists()
-        ]
+        paths = [output.file_path for output in self.outputs.values() if output.file_path]
+
+        # One directory listing per parent instead of one stat per file;
+        # outputs usually share a single directory
+        existing: dict[Path, set[str]] = {}
+        for parent in {path.parent for path in paths}:
+            try:
+                with os.scandir(parent) as entries:
+                    existing[parent] = {entry.name for entry in entries}
+            except OSError:
+                existing[parent] = set()
+
+        return [path for path in paths if path.name in existing[path.parent]]
 
     def add_output(self, key: str, result: GenerationResult) -> None:
         """Add an output result."""
@@ -50,6 +81,7 @@ class PipelineResult:
     def complete(self, success: bool | None = None) -> "PipelineResult":
         """Mark pipeline as completed."""
         self.completed_at = datetime.now(timezone.utc)
+        self._duration = (time.perf_counter_ns() - self._start_ns) / 1e9
         if success is not None:
             self.success = success
         elif self.success and self.errors:
@@ -74,8 +106,51 @@ class PipelineResult:
             "metadata": self.metadata,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to UTF-8 JSON, using orjson when installed."""
+        data = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(data, default=_json_default).encode()
+
+
+class ConcurrencyLimiter:
+    """
+    Async context manager capping concurrent calls and, optionally, their rate.
+
+    Example:
+        >>> limiter = ConcurrencyLimiter(max_concurrency=4, max_per_second=2)
+        >>> async with limiter:
+        ...     await provider.generate(prompt="...")
+    """
+
+    def __init__(self, max_concurrency: int, max_per_second: float | None = None):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._interval = 1.0 / max_per_second if max_per_second else 0.0
+        self._rate_lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def __aenter__(self) -> "ConcurrencyLimiter":
+        await self._semaphore.acquire()
+        if self._interval:
+            try:
+                # Space call starts evenly instead of bursting up to the cap
+                async with self._rate_lock:
+                    loop = asyncio.get_running_loop()
+                    delay = self._next_start - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    self._next_start = max(loop.time(), self._next_start) + self._interval
+            except BaseException:
+                self._semaphore.release()
+                raise
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._semaphore.release()
 
-@dataclass
+
+@dataclass(slots=True)
 class PipelineConfig:
     """
     Configuration for pipeline execution.
@@ -85,7 +160,35 @@ class PipelineConfig:
     parallel: bool = True
     stop_on_error: bool = False
     cleanup_on_failure: bool = True
+    copy_streams: bool = True  # Remux instead of re-encoding when merging, if possible
+    ffmpeg_preset: str = "veryfast"  # x264 speed preset when a merge re-encodes
+    cache_music: bool = True  # Reuse music generated earlier from identical inputs
+    max_concurrency: int = 8
+    max_per_second: float | None = None
+    _limiter: tuple[asyncio.AbstractEventLoop, ConcurrencyLimiter] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _dir_ready: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         self.output_dir = Path(self.output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def ensure_output_dir(self) -> Path:
+        """Create the output directory on first use and return it."""
+        if not self._dir_ready:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+        return self.output_dir
+
+    def limiter(self) -> ConcurrencyLimiter:
+        """
+        Get the provider-call limiter for the running event loop.
+
+        Shared by every pipeline using this config, so providers with a
+        common vendor quota are limited together. A new limiter is made
+        when the loop changes, since asyncio primitives can't cross loops.
+        """
+        loop = asyncio.get_running_loop()
+        if self._limiter is None or self._limiter[0] is not loop:
+            self._limiter = (loop, ConcurrencyLimiter(self.max_concurrency, self.max_per_second))
+        return self._limiter[1]
@@ -6,7 +6,13 @@ Supports local-first output with optional upload to destinations.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
+import os
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Any
 
@@ -17,11 +23,56 @@ from ai_content.pipelines.music import MusicPipeline
 from ai_content.pipelines.video import VideoPipeline
 from ai_content.presets.music import get_preset as get_music_preset
 from ai_content.presets.video import get_preset as get_video_preset
+from ai_content.utils.event_loop import install_uvloop
 from ai_content.utils.file_handlers import generate_output_path
 
 logger = logging.getLogger(__name__)
 
 
+def _cache_key(*parts: Any) -> str:
+    """Cache key for a generated output, from the inputs that determine it."""
+    data = "|".join(str(part) for part in parts).encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedMusicPreset:
+    """Music preset settings with fallbacks applied."""
+
+    prompt: str
+    bpm: int
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedVideoPreset:
+    """Video preset settings with fallbacks applied."""
+
+    prompt: str  # Text-to-video and keyframe image prompt
+    motion_prompt: str  # Image-to-video prompt
+    aspect_ratio: str
+
+
+@lru_cache(maxsize=32)
+def _resolve_music(style: str) -> ResolvedMusicPreset:
+    """Resolve a music style to its prompt and tempo."""
+    preset = get_music_preset(style)
+    return ResolvedMusicPreset(
+        prompt=preset.prompt if preset else f"[{style}] Instrumental",
+        bpm=preset.bpm if preset else 120,
+    )
+
+
+@lru_cache(maxsize=32)
+def _resolve_video(style: str) -> ResolvedVideoPreset:
+    """Resolve a video style to its prompts and aspect ratio."""
+    preset = get_video_preset(style)
+    return ResolvedVideoPreset(
+        prompt=preset.prompt if preset else "Cinematic scene",
+        motion_prompt=preset.prompt if preset else "Cinematic motion",
+        aspect_ratio=preset.aspect_ratio if preset else "16:9",
+    )
+
+
 class FullContentPipeline:
     """
     End-to-end content generation pipeline.
@@ -50,6 +101,7 @@ class FullContentPipeline:
         video_provider: str = "veo",
         image_provider: str = "imagen",
     ):
+        install_uvloop()
         self.config = config or PipelineConfig()
         self.music_provider = music_provider
         self.video_provider = video_provider
@@ -58,6 +110,13 @@ class FullContentPipeline:
         self.music_pipeline = MusicPipeline(config, music_provider)
         self.video_pipeline = VideoPipeline(config, video_provider)
 
+        # Generated output cache key -> file path, persisted under output_dir
+        self._output_cache: dict[str, str] | None = None
+        # Guards _output_cache and index.json; music and keyframe lookups run
+        # in worker threads at the same time
+        self._index_lock = threading.Lock()
+        self._cache_locks: dict[str, asyncio.Lock] = {}
+
     async def generate_music_video(
         self,
         music_style: str = "jazz",
@@ -76,7 +135,7 @@ class FullContentPipeline:
 
         Pipeline steps:
         1. Generate music and keyframe image (parallel)
-        2. Generate video from keyframe
+        2. Generate video from keyframe (as soon as it's ready, while music runs)
         3. Merge audio and video
         4. Export locally
         5. Optionally upload
@@ -86,7 +145,7 @@ class FullContentPipeline:
             video_style: Video preset name
             music_provider: Override music provider
             video_provider: Override video provider
-            parallel_generation: Run music/image in parallel
+            parallel_generation: Run music alongside image/video generation
             generate_keyframe: Generate keyframe with Imagen
             keyframe_image: Use existing image instead of generating
             merge_audio_video: Merge audio and video with FFmpeg
@@ -95,35 +154,58 @@ class FullContentPipeline:
         Returns:
             PipelineResult with all outputs
         """
+        # Resolve provider overrides once for every phase
+        music_provider = music_provider or self.music_provider
+        video_provider = video_provider or self.video_provider
+
         result = PipelineResult(success=True)
         result.metadata["workflow"] = "full-music-video"
         result.metadata["music_style"] = music_style
         result.metadata["video_style"] = video_style
+        result.metadata["music_provider"] = music_provider
+        result.metadata["video_provider"] = video_provider
 
         logger.info("=" * 60)
         logger.info("🎬 Full Content Pipeline: Music Video")
         logger.info("=" * 60)
-        logger.info(f"   Music: {music_style} ({music_provider or self.music_provider})")
-        logger.info(f"   Video: {video_style} ({video_provider or self.video_provider})")
+        logger.info("   Music: %s (%s)", music_style, music_provider)
+        logger.info("   Video: %s (%s)", video_style, video_provider)
 
         # Get presets
-        music_preset = get_music_preset(music_style)
-        video_preset = get_video_preset(video_style)
+        music_preset = _resolve_music(music_style)
+        video_preset = _resolve_video(video_style)
 
-        # Phase 1: Generate music and keyframe (parallel)
+        # Phase 1: Generate music and keyframe (parallel), then video
         logger.info("\n📍 Phase 1: Content Generation")
 
         tasks = []
 
         # Music generation task
         async def generate_music():
-            logger.info("   🎵 Generating music...")
-            provider = ProviderRegistry.get_music(music_provider or self.music_provider)
-            return await provider.generate(
-                prompt=music_preset.prompt if music_preset else f"[{music_style}] Instrumental",
-                bpm=music_preset.bpm if music_preset else 120,
-                duration_seconds=30,
-            )
+            prompt = music_preset.prompt
+            bpm = music_preset.bpm
+            duration = 30
+
+            if not self.config.cache_music:
+                logger.info("   🎵 Generating music...")
+                provider = ProviderRegistry.get_music(music_provider)
+                return await provider.generate(prompt=prompt, bpm=bpm, duration_seconds=duration)
+
+            key = _cache_key("music", music_provider, prompt, bpm, duration)
+            async with self._cache_locks.setdefault(key, asyncio.Lock()):
+                cached = await asyncio.to_thread(
+                    self._cached_output, key, music_provider, "music"
+                )
+                if cached:
+                    logger.info("   🎵 Reusing cached music: %s", cached.file_path)
+                    return cached
+
+                logger.info("   🎵 Generating music...")
+                provider = ProviderRegistry.get_music(music_provider)
+                music = await provider.generate(prompt=prompt, bpm=bpm, duration_seconds=duration)
+                if music.success and music.file_path:
+                    await asyncio.to_thread(self._store_output, key, music.file_path)
+                return music
 
         tasks.append(generate_music())
 
@@ -133,18 +215,35 @@ class FullContentPipeline:
         if generate_keyframe and not keyframe_image:
 
             async def generate_image():
-                logger.info("   🖼️  Generating keyframe image...")
+                # Create prompt from video style
+                image_prompt = f"Still frame, {video_preset.prompt.split(',')[0]}, photorealistic"
+                aspect_ratio = video_preset.aspect_ratio
+
+                key = _cache_key(
+                    "image", self.image_provider, video_style, aspect_ratio, image_prompt
+                )
                 try:
-                    provider = ProviderRegistry.get_image(self.image_provider)
-                    # Create prompt from video style
-                    image_prompt = video_preset.prompt if video_preset else "Cinematic scene"
-                    image_prompt = f"Still frame, {image_prompt.split(',')[0]}, photorealistic"
-                    return await provider.generate(
-                        prompt=image_prompt,
-                        aspect_ratio=video_preset.aspect_ratio if video_preset else "16:9",
-                    )
+                    # Concurrent runs for the same keyframe wait for one generation.
+                    # Index and file checks touch the disk; keep them off the loop
+                    async with self._cache_locks.setdefault(key, asyncio.Lock()):
+                        cached = await asyncio.to_thread(
+                            self._cached_output, key, self.image_provider, "image"
+                        )
+                        if cached:
+                            logger.info("   🖼️  Reusing cached keyframe: %s", cached.file_path)
+                            return cached
+
+                        logger.info("   🖼️  Generating keyframe image...")
+                        provider = ProviderRegistry.get_image(self.image_provider)
+                        image = await provider.generate(
+                            prompt=image_prompt,
+                            aspect_ratio=aspect_ratio,
+                        )
+                        if image.success and image.file_path:
+                            await asyncio.to_thread(self._store_output, key, image.file_path)
+                        return image
                 except Exception as e:
-                    logger.warning(f"   ⚠️ Image generation skipped: {e}")
+                    logger.warning("   ⚠️ Image generation skipped: %s", e)
                     return GenerationResult(
                         success=False,
                         provider=self.image_provider,
@@ -154,22 +253,55 @@ class FullContentPipeline:
 
             tasks.append(generate_image())
 
-        if parallel_generation and len(tasks) > 1:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            music_result = results[0] if not isinstance(results[0], Exception) else None
-            image_result = (
-                results[1] if len(results) > 1 and not isinstance(results[1], Exception) else None
-            )
+        if parallel_generation:
+            # Music runs alongside keyframe *and* video generation; video
+            # starts as soon as the keyframe is ready. The task group cancels
+            # whatever is still running if the pipeline fails or is cancelled.
+            async def music_or_none() -> GenerationResult | None:
+                try:
+                    return await tasks[0]
+                except Exception as e:
+                    # Don't let a music failure cancel video generation
+                    logger.error(f"   ❌ Music failed: {e}")
+                    result.errors.append(f"Music: {e}")
+                    return None
+
+            async def keyframe_then_video():
+                nonlocal image_result
+                if len(tasks) > 1:
+                    image_result = await tasks[1]
+                return await self._generate_video(
+                    video_preset,
+                    video_provider,
+                    self._keyframe_source(keyframe_image, image_result),
+                )
+
+            music_result, video_result, video_error = None, None, None
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    music_task = tg.create_task(music_or_none())
+                    video_task = tg.create_task(keyframe_then_video())
+                music_result = music_task.result()
+                video_result, video_error = video_task.result()
+            except* Exception as eg:
+                for error in eg.exceptions:
+                    logger.error(f"   ❌ Generation failed: {error}")
+                    result.errors.append(f"Generation: {error}")
         else:
             music_result = await tasks[0]
             if len(tasks) > 1:
                 image_result = await tasks[1]
+            video_result, video_error = await self._generate_video(
+                video_preset,
+                video_provider,
+                self._keyframe_source(keyframe_image, image_result),
+            )
 
         # Handle music result
         if music_result and isinstance(music_result, GenerationResult):
             result.add_output("music", music_result)
             if music_result.success:
-                logger.info(f"   ✅ Music: {music_result.file_path}")
+                logger.info("   ✅ Music: %s", music_result.file_path)
             else:
                 logger.error(f"   ❌ Music failed: {music_result.error}")
 
@@ -177,50 +309,17 @@ class FullContentPipeline:
         if image_result and isinstance(image_result, GenerationResult):
             result.add_output("keyframe", image_result)
             if image_result.success:
-                logger.info(f"   ✅ Keyframe: {image_result.file_path}")
+                logger.info("   ✅ Keyframe: %s", image_result.file_path)
 
-        # Determine keyframe source
-        keyframe_source = keyframe_image
-        if not keyframe_source and image_result and image_result.success:
-            keyframe_source = image_result.file_path
-
-        # Phase 2: Generate video
-        logger.info("\n📍 Phase 2: Video Generation")
-
-        if keyframe_source:
-            logger.info(f"   🎬 Generating video from keyframe...")
-            try:
-                provider = ProviderRegistry.get_video(video_provider or self.video_provider)
-                video_result = await provider.generate(
-                    prompt=video_preset.prompt if video_preset else "Cinematic motion",
-                    first_frame=str(keyframe_source),
-                    aspect_ratio=video_preset.aspect_ratio if video_preset else "16:9",
-                    duration_seconds=5,
-                )
-                result.add_output("video", video_result)
-
-                if video_result.success:
-                    logger.info(f"   ✅ Video: {video_result.file_path}")
-            except Exception as e:
-                logger.error(f"   ❌ Video generation failed: {e}")
-                result.errors.append(f"Video: {e}")
-        else:
-            # Text-to-video fallback
-            logger.info("   🎬 Generating video from text (no keyframe)...")
-            try:
-                provider = ProviderRegistry.get_video(video_provider or self.video_provider)
-                video_result = await provider.generate(
-                    prompt=video_preset.prompt if video_preset else "Cinematic scene",
-                    aspect_ratio=video_preset.aspect_ratio if video_preset else "16:9",
-                    duration_seconds=5,
-                )
-                result.add_output("video", video_result)
+        # Handle video result
+        if video_result:
+            result.add_output("video", video_result)
+        if video_error:
+            result.errors.append(f"Video: {video_error}")
 
-                if video_result.success:
-                    logger.info(f"   ✅ Video: {video_result.file_path}")
-            except Exception as e:
-                logger.error(f"   ❌ Video generation failed: {e}")
-                result.errors.append(f"Video: {e}")
+        # Authenticate the uploader while the merge runs, so the upload can
+        # start the moment the merged file exists
+        uploader, auth_task = self._start_upload_auth(upload_to)
 
         # Phase 3: Merge audio and video
         if merge_audio_video:
@@ -228,21 +327,122 @@ class FullContentPipeline:
 
         # Phase 4: Upload (if requested)
         if upload_to:
-            await self._upload_output(result, upload_to)
+            if auth_task:
+                try:
+                    await auth_task
+                except Exception as e:
+                    # upload() authenticates again and reports the failure
+                    logger.warning("   ⚠️ Upload authentication failed: %s", e)
+            await self._upload_output(result, upload_to, uploader=uploader)
 
         # Finalize
-        result.success = bool(
-            result.outputs.get("music", {}).success or result.outputs.get("video", {}).success
-        )
+        music = result.outputs.get("music")
+        video = result.outputs.get("video")
+        result.success = bool((music and music.success) or (video and video.success))
 
         logger.info("\n" + "=" * 60)
-        logger.info(f"🏁 Pipeline Complete: {'✅ Success' if result.success else '❌ Failed'}")
-        logger.info(f"   Duration: {result.duration_seconds:.1f}s")
-        logger.info(f"   Outputs: {len(result.output_files)} files")
+        logger.info("🏁 Pipeline Complete: %s", "✅ Success" if result.success else "❌ Failed")
+        logger.info("   Duration: %.1fs", result.duration_seconds)
+        logger.info("   Outputs: %s files", len(result.output_files))
         logger.info("=" * 60)
 
         return result.complete()
 
+    @property
+    def _cache_index(self) -> Path:
+        return self.config.output_dir / ".generation_cache" / "index.json"
+
+    def _load_output_cache(self) -> dict[str, str]:
+        """Load the output cache index from disk on first use. Caller holds _index_lock."""
+        if self._output_cache is None:
+            try:
+                self._output_cache = json.loads(self._cache_index.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._output_cache = {}
+        return self._output_cache
+
+    def _cached_output(self, key: str, provider: str, content_type: str) -> GenerationResult | None:
+        """Get a previously generated output, if its file still exists."""
+        with self._index_lock:
+            path = self._load_output_cache().get(key)
+        if not path or not Path(path).is_file():
+            return None
+        return GenerationResult(
+            success=True,
+            provider=provider,
+            content_type=content_type,
+            file_path=Path(path),
+            metadata={"cached": True},
+        )
+
+    def _store_output(self, key: str, path: Path) -> None:
+        """Record a generated output in the cache index."""
+        index = self._cache_index
+        # Write to a temp file and swap it in, so readers never see a torn index
+        tmp = index.with_suffix(f".{os.getpid()}.tmp")
+        with self._index_lock:
+            cache = self._load_output_cache()
+            cache[key] = str(path)
+            try:
+                index.parent.mkdir(parents=True, exist_ok=True)
+                tmp.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+                os.replace(tmp, index)
+            except OSError as e:
+                tmp.unlink(missing_ok=True)
+                logger.warning("   ⚠️ Could not save generation cache: %s", e)
+
+    @staticmethod
+    def _keyframe_source(
+        keyframe_image: str | Path | None,
+        image_result: GenerationResult | None,
+    ) -> str | Path | None:
+        """Pick the keyframe: explicit image first, then a generated one."""
+        if keyframe_image:
+            return keyframe_image
+        if image_result and image_result.success:
+            return image_result.file_path
+        return None
+
+    async def _generate_video(
+        self,
+        video_preset: ResolvedVideoPreset,
+        provider_name: str,
+        keyframe_source: str | Path | None,
+    ) -> tuple[GenerationResult | None, Exception | None]:
+        """
+        Generate the video, from the keyframe if there is one.
+
+        Returns:
+            (video result, error) - one of them is None
+        """
+        logger.info("\n📍 Phase 2: Video Generation")
+
+        kwargs: dict[str, Any] = {}
+        if keyframe_source:
+            logger.info("   🎬 Generating video from keyframe...")
+            prompt = video_preset.motion_prompt
+            kwargs["first_frame_url"] = str(keyframe_source)
+        else:
+            # Text-to-video fallback
+            logger.info("   🎬 Generating video from text (no keyframe)...")
+            prompt = video_preset.prompt
+
+        try:
+            provider = ProviderRegistry.get_video(provider_name)
+            video_result = await provider.generate(
+                prompt=prompt,
+                aspect_ratio=video_preset.aspect_ratio,
+                duration_seconds=5,
+                **kwargs,
+            )
+        except Exception as e:
+            logger.error(f"   ❌ Video generation failed: {e}")
+            return None, e
+
+        if video_result.success:
+            logger.info("   ✅ Video: %s", video_result.file_path)
+        return video_result, None
+
     async def _merge_audio_video(self, result: PipelineResult) -> None:
         """Merge audio and video using FFmpeg."""
         logger.info("\n📍 Phase 3: Media Merge")
@@ -260,7 +460,7 @@ class FullContentPipeline:
 
             processor = MediaProcessor()
             merged_path = generate_output_path(
-                self.config.output_dir,
+                self.config.ensure_output_dir(),
                 "music_video",
                 "mp4",
             )
@@ -270,6 +470,8 @@ class FullContentPipeline:
                 audio_path=music.file_path,
                 video_path=video.file_path,
                 output_path=merged_path,
+                remux_only=self.config.copy_streams,
+                encoder_preset=self.config.ffmpeg_preset,
             )
 
             result.add_output(
@@ -281,7 +483,7 @@ class FullContentPipeline:
                     file_path=merged_path,
                 ),
             )
-            logger.info(f"   ✅ Merged: {merged_path}")
+            logger.info("   ✅ Merged: %s", merged_path)
 
         except ImportError:
             logger.warning("   ⚠️ FFmpeg not available, skipping merge")
@@ -289,9 +491,26 @@ class FullContentPipeline:
             logger.error(f"   ❌ Merge failed: {e}")
             result.errors.append(f"Merge: {e}")
 
-    async def _upload_output(self, result: PipelineResult, destination: str) -> None:
-        """Upload output to destination."""
-        logger.info(f"\n📍 Phase 4: Upload to {destination}")
+    def _start_upload_auth(self, destination: str | None) -> tuple[Any, asyncio.Task | None]:
+        """Create the uploader for a destination and start authenticating it."""
+        if destination != "youtube":
+            return None, None
+        try:
+            from ai_content.integrations.youtube import YouTubeUploader
+        except ImportError:
+            return None, None
+        uploader = YouTubeUploader()
+        return uploader, asyncio.create_task(uploader.authenticate())
+
+    async def _upload_output(
+        self,
+        result: PipelineResult,
+        destination: str,
+        *,
+        uploader: Any = None,
+    ) -> None:
+        """Upload output to destination, using a pre-authenticated uploader if given."""
+        logger.info("\n📍 Phase 4: Upload to %s", destination)
 
         # Get best output file
         output_file = None
@@ -309,17 +528,16 @@ class FullContentPipeline:
             try:
                 from ai_content.integrations.youtube import YouTubeUploader
 
-                uploader = YouTubeUploader()
-
                 title = f"AI Generated: {result.metadata.get('music_style', 'Music')} Video"
-                video_id = await uploader.upload(
-                    video_path=output_file,
-                    title=title,
-                    description="Generated with ai-content package",
-                )
+                async with uploader or YouTubeUploader() as uploader:
+                    video_id = await uploader.upload(
+                        video_path=output_file,
+                        title=title,
+                        description="Generated with ai-content package",
+                    )
 
                 result.metadata["youtube_id"] = video_id
-                logger.info(f"   ✅ Uploaded to YouTube: {video_id}")
+                logger.info("   ✅ Uploaded to YouTube: %s", video_id)
 
             except ImportError:
                 logger.warning("   ⚠️ YouTube integration not available")
@@ -332,4 +550,4 @@ class FullContentPipeline:
             result.metadata["note"] = "S3 upload pending implementation"
 
         else:
-            logger.info(f"   ✅ Local export complete: {output_file}")
+            logger.info("   ✅ Local export complete: %s", output_file)
@@ -7,19 +7,59 @@ Provides orchestrated workflows for music generation including:
 - Reference-Based: Style transfer from reference audio
 """
 
+import asyncio
 import logging
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Literal, Optional
 
 from ai_content.core.registry import ProviderRegistry
 from ai_content.core.result import GenerationResult
 from ai_content.pipelines.base import PipelineResult, PipelineConfig
 from ai_content.presets.music import get_preset as get_music_preset, MUSIC_PRESETS
+from ai_content.utils.async_utils import bounded_as_completed
+from ai_content.utils.event_loop import install_uvloop
 from ai_content.utils.lyrics_parser import parse_lyrics_with_structure
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _performance_prompt(style: str, body: str) -> str:
+    """Performance-First prompt for a style; built once per (style, preset)."""
+    return f"""[{style.title()} Style]
+[Instrumental, No Vocals]
+{body}
+Let the music breathe with natural feel"""
+
+
+def _is_lyrics_file(lyrics: str | Path) -> bool:
+    """Whether lyrics names an existing file rather than holding the text."""
+    if isinstance(lyrics, str) and ("\n" in lyrics or len(lyrics) >= 260):
+        # Multi-line or long input is lyrics text, not a path; skip the stat
+        return False
+    try:
+        return Path(lyrics).is_file()
+    except (OSError, ValueError):  # Invalid path characters for this OS
+        return False
+
+
+@dataclass
+class WorkflowSpec:
+    """
+    One MusicPipeline workflow to run as part of a batch.
+
+    Attributes:
+        kind: Workflow name ("performance", "lyrics", or "reference")
+        kwargs: Arguments for the workflow method
+    """
+
+    kind: Literal["performance", "lyrics", "reference"]
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+
 class MusicPipeline:
     """
     Music generation pipeline with multiple workflow strategies.
@@ -37,6 +77,7 @@ class MusicPipeline:
     ):
         self.config = config or PipelineConfig()
         self.default_provider = default_provider
+        install_uvloop()
 
     async def performance_first(
         self,
@@ -65,7 +106,7 @@ class MusicPipeline:
         result.metadata["workflow"] = "performance-first"
         result.metadata["style"] = style
 
-        logger.info(f"🎵 Performance-First Workflow: {style}")
+        logger.info("🎵 Performance-First Workflow: %s", style)
         logger.info("   Strategy: Generate instrumental, let AI find the groove")
 
         # Get preset
@@ -74,10 +115,7 @@ class MusicPipeline:
             preset = MUSIC_PRESETS.get("jazz")
 
         # Build prompt emphasizing instrumental/no lyrics
-        prompt = f"""[{style.title()} Style]
-[Instrumental, No Vocals]
-{preset.prompt if preset else "Smooth jazz fusion"}
-Let the music breathe with natural feel"""
+        prompt = _performance_prompt(style, preset.prompt if preset else "Smooth jazz fusion")
 
         provider_name = provider or self.default_provider
 
@@ -93,7 +131,7 @@ Let the music breathe with natural feel"""
             result.add_output("music", gen_result)
 
             if gen_result.success:
-                logger.info(f"✅ Music generated: {gen_result.file_path}")
+                logger.info("✅ Music generated: %s", gen_result.file_path)
             else:
                 logger.error(f"❌ Generation failed: {gen_result.error}")
                 result.success = False
@@ -132,13 +170,13 @@ Let the music breathe with natural feel"""
         result.metadata["workflow"] = "lyrics-first"
         result.metadata["style"] = style
 
-        logger.info(f"🎵 Lyrics-First Workflow: {style}")
+        logger.info("🎵 Lyrics-First Workflow: %s", style)
 
         # Load lyrics if path
         lyrics_content = lyrics
-        if Path(lyrics).exists():
-            lyrics_content = Path(lyrics).read_text()
-            logger.info(f"   Loaded lyrics from: {lyrics}")
+        if _is_lyrics_file(lyrics):
+            lyrics_content = await asyncio.to_thread(Path(lyrics).read_text, encoding="utf-8")
+            logger.info("   Loaded lyrics from: %s", lyrics)
 
         # Parse and structure lyrics
         structured = parse_lyrics_with_structure(
@@ -147,7 +185,7 @@ Let the music breathe with natural feel"""
             auto_detect_structure=auto_structure,
         )
 
-        logger.info(f"   Verses: {structured.verse_count}, Choruses: {structured.chorus_count}")
+        logger.info("   Verses: %s, Choruses: %s", structured.verse_count, structured.chorus_count)
         result.metadata["lyrics_stats"] = {
             "verses": structured.verse_count,
             "choruses": structured.chorus_count,
@@ -168,7 +206,7 @@ Let the music breathe with natural feel"""
             music_provider = ProviderRegistry.get_music(provider)
 
             if not music_provider.supports_vocals:
-                logger.warning(f"⚠️ {provider} may not support vocals well. Consider 'minimax'.")
+                logger.warning("⚠️ %s may not support vocals well. Consider 'minimax'.", provider)
 
             gen_result = await music_provider.generate(
                 prompt=prompt,
@@ -179,7 +217,7 @@ Let the music breathe with natural feel"""
             result.add_output("music", gen_result)
 
             if gen_result.success:
-                logger.info(f"✅ Music with vocals generated: {gen_result.file_path}")
+                logger.info("✅ Music with vocals generated: %s", gen_result.file_path)
             else:
                 result.success = False
 
@@ -216,8 +254,8 @@ Let the music breathe with natural feel"""
         result.metadata["reference_url"] = reference_url
 
         logger.info("🎵 Reference-Based Workflow")
-        logger.info(f"   Reference: {reference_url[:50]}...")
-        logger.info(f"   Transform: {transformation_prompt[:50]}...")
+        logger.info("   Reference: %s...", reference_url[:50])
+        logger.info("   Transform: %s...", transformation_prompt[:50])
 
         try:
             music_provider = ProviderRegistry.get_music(provider)
@@ -230,7 +268,7 @@ Let the music breathe with natural feel"""
             result.add_output("music", gen_result)
 
             if gen_result.success:
-                logger.info(f"✅ Transformed music generated: {gen_result.file_path}")
+                logger.info("✅ Transformed music generated: %s", gen_result.file_path)
             else:
                 result.success = False
 
@@ -266,17 +304,17 @@ Let the music breathe with natural feel"""
         result.metadata["style"] = style
 
         if providers is None:
-            providers = list(ProviderRegistry.list_music())
+            providers = ProviderRegistry.list_music_providers()
 
-        logger.info(f"🔬 Provider Comparison: {style}")
-        logger.info(f"   Providers: {', '.join(providers)}")
+        logger.info("🔬 Provider Comparison: %s", style)
+        logger.info("   Providers: %s", ", ".join(providers))
 
         preset = get_music_preset(style)
         prompt = preset.prompt if preset else f"[{style.title()}] Instrumental music"
         bpm = preset.bpm if preset else 120
 
-        for provider_name in providers:
-            logger.info(f"\n   Testing: {provider_name}...")
+        async def run_provider(provider_name: str) -> tuple[str, GenerationResult]:
+            logger.info("\n   Testing: %s...", provider_name)
 
             try:
                 provider = ProviderRegistry.get_music(provider_name)
@@ -286,26 +324,73 @@ Let the music breathe with natural feel"""
                     duration_seconds=duration,
                 )
 
-                result.add_output(f"music_{provider_name}", gen_result)
-
                 if gen_result.success:
-                    logger.info(f"   ✅ {provider_name} succeeded")
+                    logger.info("   ✅ %s succeeded", provider_name)
                 else:
-                    logger.warning(f"   ❌ {provider_name} failed: {gen_result.error}")
+                    logger.warning("   ❌ %s failed: %s", provider_name, gen_result.error)
+                return provider_name, gen_result
 
             except Exception as e:
                 logger.error(f"   ❌ {provider_name} error: {e}")
-                result.add_output(
-                    f"music_{provider_name}",
-                    GenerationResult(
-                        success=False,
-                        provider=provider_name,
-                        content_type="music",
-                        error=str(e),
-                    ),
+                return provider_name, GenerationResult(
+                    success=False,
+                    provider=provider_name,
+                    content_type="music",
+                    error=str(e),
                 )
 
+        # Providers are independent, so run them concurrently (capped at
+        # max_concurrency), taking results as they finish; outputs are then
+        # recorded in provider order
+        gen_results = {}
+        async with aclosing(
+            bounded_as_completed(
+                (run_provider(name) for name in providers),
+                self.config.max_concurrency,
+            )
+        ) as completed:
+            async for provider_name, gen_result in completed:
+                gen_results[provider_name] = gen_result
+        for provider_name in providers:
+            result.add_output(f"music_{provider_name}", gen_results[provider_name])
+
         # Success if at least one provider succeeded
         result.success = any(output.success for output in result.outputs.values())
 
         return result.complete()
+
+    async def run_all(self, specs: list[WorkflowSpec]) -> list[PipelineResult]:
+        """
+        Run several workflows concurrently.
+
+        Useful for A/B experiments, e.g. performance-first vs. lyrics-first.
+        Workflows share the config's limiter, so provider calls stay within
+        max_concurrency.
+
+        Args:
+            specs: Workflows to run
+
+        Returns:
+            PipelineResults in the same order as specs
+
+        Raises:
+            ValueError: If a spec has an unknown kind
+        """
+        workflows = {
+            "performance": self.performance_first,
+            "lyrics": self.lyrics_first,
+            "reference": self.reference_based,
+        }
+        for spec in specs:
+            if spec.kind not in workflows:
+                raise ValueError(
+                    f"Unknown workflow '{spec.kind}'. Available: {list(workflows)}"
+                )
+
+        async def run(spec: WorkflowSpec) -> PipelineResult:
+            async with self.config.limiter():
+                return await workflows[spec.kind](**spec.kwargs)
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(run(spec)) for spec in specs]
+        return [task.result() for task in tasks]
@@ -6,6 +6,7 @@ Provides orchestrated workflows for video generation including:
 - Image-to-Video: Animate a keyframe image
 """
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Optional
@@ -79,8 +80,8 @@ class VideoPipeline:
         result.metadata["aspect_ratio"] = final_aspect_ratio
 
         logger.info("🎬 Text-to-Video Pipeline")
-        logger.info(f"   Prompt: {final_prompt[:60]}...")
-        logger.info(f"   Aspect: {final_aspect_ratio}, Duration: {duration}s")
+        logger.info("   Prompt: %.60s...", final_prompt)
+        logger.info("   Aspect: %s, Duration: %ss", final_aspect_ratio, duration)
 
         provider_name = provider or self.default_provider
 
@@ -96,7 +97,7 @@ class VideoPipeline:
             result.add_output("video", gen_result)
 
             if gen_result.success:
-                logger.info(f"✅ Video generated: {gen_result.file_path}")
+                logger.info("✅ Video generated: %s", gen_result.file_path)
             else:
                 logger.error(f"❌ Generation failed: {gen_result.error}")
                 result.success = False
@@ -136,8 +137,8 @@ class VideoPipeline:
         result.metadata["image_source"] = str(image_source)
 
         logger.info("🎬 Image-to-Video Pipeline")
-        logger.info(f"   Image: {str(image_source)[:50]}...")
-        logger.info(f"   Prompt: {prompt[:60]}...")
+        logger.info("   Image: %.50s...", image_source)
+        logger.info("   Prompt: %.60s...", prompt)
 
         provider_name = provider or self.default_provider
 
@@ -146,14 +147,14 @@ class VideoPipeline:
 
             gen_result = await video_provider.generate(
                 prompt=prompt,
-                first_frame=str(image_source),
+                first_frame_url=str(image_source),
                 duration_seconds=duration,
             )
 
             result.add_output("video", gen_result)
 
             if gen_result.success:
-                logger.info(f"✅ Video animated: {gen_result.file_path}")
+                logger.info("✅ Video animated: %s", gen_result.file_path)
             else:
                 result.success = False
 
@@ -187,43 +188,48 @@ class VideoPipeline:
         result.metadata["style"] = style
 
         if providers is None:
-            providers = list(ProviderRegistry.list_video())
+            providers = ProviderRegistry.list_video_providers()
 
-        logger.info(f"🔬 Video Provider Comparison: {style}")
-        logger.info(f"   Providers: {', '.join(providers)}")
+        logger.info("🔬 Video Provider Comparison: %s", style)
+        logger.info("   Providers: %s", ", ".join(providers))
 
         preset = get_video_preset(style)
         final_prompt = prompt or (preset.prompt if preset else "Cinematic nature scene")
+        aspect_ratio = preset.aspect_ratio if preset else "16:9"
 
-        for provider_name in providers:
-            logger.info(f"\n   Testing: {provider_name}...")
+        async def run_provider(provider_name: str) -> tuple[str, GenerationResult]:
+            logger.info("\n   Testing: %s...", provider_name)
 
             try:
                 provider = ProviderRegistry.get_video(provider_name)
-                gen_result = await provider.generate(
-                    prompt=final_prompt,
-                    aspect_ratio=preset.aspect_ratio if preset else "16:9",
-                )
-
-                result.add_output(f"video_{provider_name}", gen_result)
+                # Caps concurrent calls so wide comparisons don't trip rate limits
+                async with self.config.limiter():
+                    gen_result = await provider.generate(
+                        prompt=final_prompt,
+                        aspect_ratio=aspect_ratio,
+                    )
 
                 if gen_result.success:
-                    logger.info(f"   ✅ {provider_name} succeeded")
+                    logger.info("   ✅ %s succeeded", provider_name)
                 else:
-                    logger.warning(f"   ❌ {provider_name} failed")
+                    logger.warning("   ❌ %s failed", provider_name)
+                return provider_name, gen_result
 
             except Exception as e:
                 logger.error(f"   ❌ {provider_name} error: {e}")
-                result.add_output(
-                    f"video_{provider_name}",
-                    GenerationResult(
-                        success=False,
-                        provider=provider_name,
-                        content_type="video",
-                        error=str(e),
-                    ),
+                return provider_name, GenerationResult(
+                    success=False,
+                    provider=provider_name,
+                    content_type="video",
+                    error=str(e),
                 )
 
+        # Providers are independent, so run them concurrently (up to the
+        # config's max_concurrency); wall time is the slowest provider
+        gen_results = await asyncio.gather(*(run_provider(name) for name in providers))
+        for provider_name, gen_result in gen_results:
+            result.add_output(f"video_{provider_name}", gen_result)
+
         result.success = any(output.success for output in result.outputs.values())
 
         return result.complete()
@@ -4,10 +4,12 @@ Music style presets.
 Pre-configured prompt templates and settings for common music styles.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MusicPreset:
     """
     Music generation preset.
@@ -24,7 +26,7 @@ class MusicPreset:
     prompt: str
     bpm: int
     mood: str
-    tags: list[str]
+    tags: tuple[str, ...]
 
 
 # === Music Style Presets ===
@@ -37,7 +39,7 @@ JAZZ = MusicPreset(
 Late night radio feel, nostalgic and contemplative""",
     bpm=95,
     mood="nostalgic",
-    tags=["smooth", "fusion", "sophisticated"],
+    tags=("smooth", "fusion", "sophisticated"),
 )
 
 BLUES = MusicPreset(
@@ -48,7 +50,7 @@ BLUES = MusicPreset(
 Raw emotional delivery, soulful and authentic""",
     bpm=72,
     mood="soulful",
-    tags=["delta", "raw", "authentic"],
+    tags=("delta", "raw", "authentic"),
 )
 
 ETHIOPIAN_JAZZ = MusicPreset(
@@ -60,7 +62,7 @@ ETHIOPIAN_JAZZ = MusicPreset(
 Mulatu Astatke inspired, 1970s Addis Ababa sound""",
     bpm=85,
     mood="mystical",
-    tags=["ethio-jazz", "modal", "african"],
+    tags=("ethio-jazz", "modal", "african"),
 )
 
 CINEMATIC = MusicPreset(
@@ -72,7 +74,7 @@ CINEMATIC = MusicPreset(
 Hans Zimmer inspired, triumphant and emotional""",
     bpm=100,
     mood="epic",
-    tags=["orchestral", "film-score", "triumphant"],
+    tags=("orchestral", "film-score", "triumphant"),
 )
 
 ELECTRONIC = MusicPreset(
@@ -84,7 +86,7 @@ ELECTRONIC = MusicPreset(
 Festival anthem energy, euphoric drops""",
     bpm=128,
     mood="euphoric",
-    tags=["house", "edm", "festival"],
+    tags=("house", "edm", "festival"),
 )
 
 AMBIENT = MusicPreset(
@@ -96,7 +98,7 @@ AMBIENT = MusicPreset(
 Brian Eno inspired, meditative and peaceful""",
     bpm=60,
     mood="peaceful",
-    tags=["ambient", "meditative", "eno"],
+    tags=("ambient", "meditative", "eno"),
 )
 
 LOFI = MusicPreset(
@@ -108,7 +110,7 @@ LOFI = MusicPreset(
 Study beats, relaxing and nostalgic""",
     bpm=85,
     mood="relaxed",
-    tags=["lofi", "chill", "study"],
+    tags=("lofi", "chill", "study"),
 )
 
 RNB = MusicPreset(
@@ -120,7 +122,7 @@ RNB = MusicPreset(
 Modern R&B production, emotional and smooth""",
     bpm=90,
     mood="sultry",
-    tags=["rnb", "neo-soul", "modern"],
+    tags=("rnb", "neo-soul", "modern"),
 )
 
 SALSA = MusicPreset(
@@ -133,7 +135,7 @@ SALSA = MusicPreset(
 Fania Records inspired, fiery and danceable""",
     bpm=180,
     mood="fiery",
-    tags=["salsa", "latin", "cuban"],
+    tags=("salsa", "latin", "cuban"),
 )
 
 BACHATA = MusicPreset(
@@ -146,7 +148,7 @@ BACHATA = MusicPreset(
 Romeo Santos inspired, passionate and romantic""",
     bpm=130,
     mood="romantic",
-    tags=["bachata", "latin", "dominican"],
+    tags=("bachata", "latin", "dominican"),
 )
 
 KIZOMBA = MusicPreset(
@@ -159,27 +161,27 @@ KIZOMBA = MusicPreset(
 Lusophone African sound, sensual and hypnotic""",
     bpm=95,
     mood="sensual",
-    tags=["kizomba", "zouk", "african"],
+    tags=("kizomba", "zouk", "african"),
 )
 
 
-# Registry of all presets
-MUSIC_PRESETS: dict[str, MusicPreset] = {
-    preset.name: preset
-    for preset in [
-        JAZZ,
-        BLUES,
-        ETHIOPIAN_JAZZ,
-        CINEMATIC,
-        ELECTRONIC,
-        AMBIENT,
-        LOFI,
-        RNB,
-        SALSA,
-        BACHATA,
-        KIZOMBA,
-    ]
-}
+# Registry of all presets (read-only)
+_ALL_PRESETS = (
+    JAZZ,
+    BLUES,
+    ETHIOPIAN_JAZZ,
+    CINEMATIC,
+    ELECTRONIC,
+    AMBIENT,
+    LOFI,
+    RNB,
+    SALSA,
+    BACHATA,
+    KIZOMBA,
+)
+MUSIC_PRESETS: Mapping[str, MusicPreset] = MappingProxyType(
+    {preset.name: preset for preset in _ALL_PRESETS}
+)
 
 
 def get_preset(name: str) -> MusicPreset:
@@ -195,10 +197,11 @@ def get_preset(name: str) -> MusicPreset:
     Raises:
         KeyError: If preset not found
     """
-    if name not in MUSIC_PRESETS:
+    try:
+        return MUSIC_PRESETS[name]
+    except KeyError:
         available = list(MUSIC_PRESETS.keys())
-        raise KeyError(f"Music preset '{name}' not found. Available: {available}")
-    return MUSIC_PRESETS[name]
+        raise KeyError(f"Music preset '{name}' not found. Available: {available}") from None
 
 
 def list_presets() -> list[str]:
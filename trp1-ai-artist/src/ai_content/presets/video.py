@@ -4,10 +4,12 @@ Video style presets.
 Pre-configured prompt templates for common video styles.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VideoPreset:
     """
     Video generation preset.
@@ -24,7 +26,7 @@ class VideoPreset:
     prompt: str
     aspect_ratio: str
     duration: int
-    style_keywords: list[str]
+    style_keywords: tuple[str, ...]
 
 
 # === Video Style Presets ===
@@ -38,7 +40,7 @@ nature documentary style, 8K resolution, shallow depth of field,
 professional color grading, David Attenborough aesthetic""",
     aspect_ratio="16:9",
     duration=5,
-    style_keywords=["documentary", "wildlife", "golden-hour"],
+    style_keywords=("documentary", "wildlife", "golden-hour"),
 )
 
 URBAN = VideoPreset(
@@ -50,7 +52,7 @@ Blade Runner inspired, moody and atmospheric,
 4K cinematic, anamorphic lens flares""",
     aspect_ratio="21:9",
     duration=5,
-    style_keywords=["cyberpunk", "urban", "neon"],
+    style_keywords=("cyberpunk", "urban", "neon"),
 )
 
 SPACE = VideoPreset(
@@ -63,7 +65,7 @@ Interstellar inspired, emotional and contemplative,
 4K film grain, anamorphic lens""",
     aspect_ratio="16:9",
     duration=5,
-    style_keywords=["sci-fi", "space", "contemplative"],
+    style_keywords=("sci-fi", "space", "contemplative"),
 )
 
 ABSTRACT = VideoPreset(
@@ -75,7 +77,7 @@ satisfying abstract art, high-end commercial quality,
 8K resolution, pristine studio lighting""",
     aspect_ratio="1:1",
     duration=5,
-    style_keywords=["abstract", "commercial", "satisfying"],
+    style_keywords=("abstract", "commercial", "satisfying"),
 )
 
 OCEAN = VideoPreset(
@@ -87,7 +89,7 @@ slow motion wave break, pristine beach paradise,
 4K underwater cinematography, vibrant colors""",
     aspect_ratio="16:9",
     duration=5,
-    style_keywords=["ocean", "underwater", "paradise"],
+    style_keywords=("ocean", "underwater", "paradise"),
 )
 
 FANTASY = VideoPreset(
@@ -99,7 +101,7 @@ high fantasy aesthetic, Lord of the Rings inspired,
 8K cinematic, volumetric fog and god rays""",
     aspect_ratio="21:9",
     duration=5,
-    style_keywords=["fantasy", "dragon", "epic"],
+    style_keywords=("fantasy", "dragon", "epic"),
 )
 
 PORTRAIT = VideoPreset(
@@ -111,23 +113,23 @@ fashion photography aesthetic, high-end commercial,
 4K beauty cinematography, flawless skin detail""",
     aspect_ratio="9:16",
     duration=5,
-    style_keywords=["portrait", "fashion", "beauty"],
+    style_keywords=("portrait", "fashion", "beauty"),
 )
 
 
-# Registry of all presets
-VIDEO_PRESETS: dict[str, VideoPreset] = {
-    preset.name: preset
-    for preset in [
-        NATURE,
-        URBAN,
-        SPACE,
-        ABSTRACT,
-        OCEAN,
-        FANTASY,
-        PORTRAIT,
-    ]
-}
+# Registry of all presets (read-only)
+_ALL_PRESETS = (
+    NATURE,
+    URBAN,
+    SPACE,
+    ABSTRACT,
+    OCEAN,
+    FANTASY,
+    PORTRAIT,
+)
+VIDEO_PRESETS: Mapping[str, VideoPreset] = MappingProxyType(
+    {preset.name: preset for preset in _ALL_PRESETS}
+)
 
 
 def get_preset(name: str) -> VideoPreset:
@@ -143,10 +145,11 @@ def get_preset(name: str) -> VideoPreset:
     Raises:
         KeyError: If preset not found
     """
-    if name not in VIDEO_PRESETS:
+    try:
+        return VIDEO_PRESETS[name]
+    except KeyError:
         available = list(VIDEO_PRESETS.keys())
-        raise KeyError(f"Video preset '{name}' not found. Available: {available}")
-    return VIDEO_PRESETS[name]
+        raise KeyError(f"Video preset '{name}' not found. Available: {available}") from None
 
 
 def list_presets() -> list[str]:
@@ -1,27 +1,76 @@
 """
 Providers module.
 
-Import this module to register all available providers.
+Import this module to register all available providers. Provider modules
+(and the SDKs they pull in) are only imported when a provider is first
+requested from the registry or one of the classes below is accessed.
 """
 
-# Import provider modules to trigger registration
-from ai_content.providers import google
-from ai_content.providers import aimlapi
-from ai_content.providers import kling
-
-# Re-export providers
-from ai_content.providers.google import (
-    GoogleLyriaProvider,
-    GoogleVeoProvider,
-    GoogleImagenProvider,
-)
-from ai_content.providers.aimlapi import (
-    AIMLAPIClient,
-    MiniMaxMusicProvider,
-)
-from ai_content.providers.kling import (
-    KlingDirectProvider,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+from ai_content.core.registry import ProviderRegistry
+
+if TYPE_CHECKING:
+    from ai_content.providers.google import (
+        GoogleLyriaProvider,
+        GoogleVeoProvider,
+        GoogleImagenProvider,
+    )
+    from ai_content.providers.aimlapi import (
+        AIMLAPIClient,
+        MiniMaxMusicProvider,
+    )
+    from ai_content.providers.kling import (
+        KlingDirectProvider,
+    )
+
+# kind -> registered name -> module that defines the provider
+_PROVIDER_MODULES = {
+    "music": {
+        "lyria": "ai_content.providers.google.lyria",
+        "minimax": "ai_content.providers.aimlapi.minimax",
+    },
+    "video": {
+        "veo": "ai_content.providers.google.veo",
+        "kling": "ai_content.providers.kling.direct",
+    },
+    "image": {
+        "imagen": "ai_content.providers.google.imagen",
+    },
+}
+
+# Re-exported name -> defining module
+_LAZY = {
+    # Google
+    "GoogleLyriaProvider": "ai_content.providers.google.lyria",
+    "GoogleVeoProvider": "ai_content.providers.google.veo",
+    "GoogleImagenProvider": "ai_content.providers.google.imagen",
+    # AIMLAPI
+    "AIMLAPIClient": "ai_content.providers.aimlapi.client",
+    "MiniMaxMusicProvider": "ai_content.providers.aimlapi.minimax",
+    # Kling
+    "KlingDirectProvider": "ai_content.providers.kling.direct",
+}
+
+
+def register_all() -> None:
+    """Declare the built-in providers with the registry, without importing them."""
+    for kind, modules in _PROVIDER_MODULES.items():
+        for name, module in modules.items():
+            ProviderRegistry.register_lazy(kind, name, module)
+
+
+register_all()
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value  # Later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Google
@@ -5,7 +5,11 @@ Shared HTTP client for all AIMLAPI-based providers.
 """
 
 import asyncio
+import json
 import logging
+import random
+import time
+from pathlib import Path
 from typing import Any
 
 import httpx
@@ -16,11 +20,35 @@ from ai_content.core.exceptions import (
     AuthenticationError,
 )
 from ai_content.config import get_settings
+from ai_content.utils.http import HTTP2_AVAILABLE
+
+try:
+    import orjson  # Optional, from the "perf" extra
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 APPLICATION_JSON = "application/json"
 
+_COMPLETE_STATES = frozenset({"completed", "done", "success"})
+_FAILED_STATES = frozenset({"failed", "error"})
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a request body, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def _loads(content: bytes) -> Any:
+    """Parse a response body, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 
 class AIMLAPIClient:
     """
@@ -43,16 +71,22 @@ class AIMLAPIClient:
     def __init__(self):
         self.settings = get_settings().aimlapi
         self._http_client: httpx.AsyncClient | None = None
+        self._download_client: httpx.AsyncClient | None = None
+        self._headers: dict[str, str] | None = None
+        # generation_id -> (ETag, status) of the last poll response
+        self._poll_cache: dict[str, tuple[str, dict[str, Any]]] = {}
 
     @property
     def headers(self) -> dict[str, str]:
-        """Get authorization headers."""
-        if not self.settings.api_key:
-            raise AuthenticationError("aimlapi")
-        return {
-            "Authorization": f"Bearer {self.settings.api_key}",
-            "Content-Type": APPLICATION_JSON,
-        }
+        """Get authorization headers (built once; a missing key raises on each access)."""
+        if self._headers is None:
+            if not self.settings.api_key:
+                raise AuthenticationError("aimlapi")
+            self._headers = {
+                "Authorization": f"Bearer {self.settings.api_key}",
+                "Content-Type": APPLICATION_JSON,
+            }
+        return self._headers
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -61,14 +95,40 @@ class AIMLAPIClient:
                 base_url=self.settings.base_url,
                 timeout=float(self.settings.request_timeout),
                 headers=self.headers,
+                # Keep connections warm between polls; submit/poll/download
+                # share one multiplexed connection when HTTP/2 is available
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=60.0,
+                ),
+                http2=HTTP2_AVAILABLE,
             )
         return self._http_client
 
+    async def _get_download_client(self) -> httpx.AsyncClient:
+        """
+        Get or create the client for downloading generated media.
+
+        Kept separate from the API client: media URLs are usually pre-signed
+        CDN links, which must not receive the API key.
+        """
+        if self._download_client is None or self._download_client.is_closed:
+            self._download_client = httpx.AsyncClient(
+                timeout=120.0,
+                limits=httpx.Limits(max_keepalive_connections=20),
+                http2=HTTP2_AVAILABLE,
+            )
+        return self._download_client
+
     async def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP clients."""
         if self._http_client and not self._http_client.is_closed:
             await self._http_client.aclose()
             self._http_client = None
+        if self._download_client and not self._download_client.is_closed:
+            await self._download_client.aclose()
+            self._download_client = None
 
     async def submit_generation(
         self,
@@ -88,9 +148,10 @@ class AIMLAPIClient:
         client = await self._get_client()
 
         try:
-            response = await client.post(endpoint, json=payload)
+            # Content-Type is set on the client
+            response = await client.post(endpoint, content=_dumps(payload))
             self._handle_error(response)
-            return response.json()
+            return _loads(response.content)
         except httpx.HTTPStatusError as e:
             self._handle_error(e.response)
             raise
@@ -103,6 +164,9 @@ class AIMLAPIClient:
         """
         Poll for generation status.
 
+        Repeat polls are conditional (If-None-Match) when the API sent an
+        ETag, so an unchanged status costs a bodiless 304.
+
         Args:
             endpoint: API endpoint
             generation_id: ID from submit_generation
@@ -112,12 +176,25 @@ class AIMLAPIClient:
         """
         client = await self._get_client()
 
+        cached = self._poll_cache.get(generation_id)
         response = await client.get(
             endpoint,
             params={"generation_id": generation_id},
+            headers={"If-None-Match": cached[0]} if cached else None,
         )
+        if response.status_code == 304 and cached:
+            return cached[1]
         self._handle_error(response)
-        return response.json()
+        status = _loads(response.content)
+
+        if etag := response.headers.get("ETag"):
+            if generation_id not in self._poll_cache and len(self._poll_cache) >= 64:
+                # Drop the oldest generation; finished ones are never polled again
+                del self._poll_cache[next(iter(self._poll_cache))]
+            self._poll_cache[generation_id] = (etag, status)
+        else:
+            self._poll_cache.pop(generation_id, None)
+        return status
 
     async def wait_for_completion(
         self,
@@ -128,6 +205,11 @@ class AIMLAPIClient:
         """
         Poll until generation is complete.
 
+        The delay between polls starts at poll_interval and backs off to
+        max_poll_interval (with jitter), so long generations cost fewer
+        requests. The total wait is bounded by the same budget as fixed
+        interval polling: max_poll_attempts * poll_interval.
+
         Args:
             endpoint: API endpoint for status checks
             generation_id: ID from submit_generation
@@ -136,20 +218,36 @@ class AIMLAPIClient:
         Returns:
             Final status response
         """
-        logger.info(f"   Polling for completion (ID: {generation_id[:8]}...)")
+        logger.info("   Polling for completion (ID: %.8s...)", generation_id)
 
-        for attempt in range(self.settings.max_poll_attempts):
-            status = await self.poll_status(endpoint, generation_id)
+        settings = self.settings
+        budget = settings.max_poll_attempts * settings.poll_interval
+        deadline = time.monotonic() + budget
+        delay = float(settings.poll_interval)
+        max_delay = settings.max_poll_interval
+        attempt = 0
+
+        while True:
+            attempt += 1
+            try:
+                status = await self.poll_status(endpoint, generation_id)
+            except RateLimitError as e:
+                # Throttled status checks aren't fatal; wait as long as asked
+                wait = e.retry_after or delay
+                if time.monotonic() + wait > deadline:
+                    break
+                logger.debug("   Poll %s rate limited, waiting %ss", attempt, wait)
+                await asyncio.sleep(wait)
+                continue
 
             # Default completion check
             if check_complete:
                 is_complete = check_complete(status)
             else:
-                state = status.get("status") or status.get("state", "")
-                is_complete = state.lower() in ("completed", "done", "success")
-                is_failed = state.lower() in ("failed", "error")
+                state = (status.get("status") or status.get("state", "")).lower()
+                is_complete = state in _COMPLETE_STATES
 
-                if is_failed:
+                if state in _FAILED_STATES:
                     error = (
                         status.get("error")
                         or status.get("message")
@@ -158,23 +256,53 @@ class AIMLAPIClient:
                     raise ProviderError("aimlapi", error)
 
             if is_complete:
-                logger.info(f"   Completed after {attempt + 1} polls")
+                logger.info("   Completed after %s polls", attempt)
                 return status
 
-            logger.debug(f"   Poll {attempt + 1}/{self.settings.max_poll_attempts}")
-            await asyncio.sleep(self.settings.poll_interval)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            logger.debug("   Poll %s, next in %.1fs", attempt, delay)
+            await asyncio.sleep(min(delay + random.uniform(0, delay * 0.1), remaining))
+            delay = min(delay * 1.5, max_delay)
 
         raise ProviderError(
             "aimlapi",
-            f"Generation timed out after {self.settings.max_poll_attempts} polls",
+            f"Generation timed out after {budget}s ({attempt} polls)",
         )
 
     async def download_file(self, url: str) -> bytes:
-        """Download file from URL."""
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.get(url)
+        """Download a small file from URL into memory."""
+        client = await self._get_download_client()
+        response = await client.get(url)
+        response.raise_for_status()
+        return response.content
+
+    async def download_to(self, url: str, path: Path | str, chunk_size: int = 65536) -> Path:
+        """
+        Stream a file from URL to disk.
+
+        Use this for generated audio/video: memory stays at one chunk
+        regardless of the file size.
+
+        Args:
+            url: Source URL
+            path: Destination path (parent directories are created)
+            chunk_size: Bytes per read
+
+        Returns:
+            Path to the downloaded file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        client = await self._get_download_client()
+        async with client.stream("GET", url) as response:
             response.raise_for_status()
-            return response.content
+            with open(path, "wb") as f:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    f.write(chunk)
+        return path
 
     def _handle_error(self, response: httpx.Response):
         """Handle HTTP errors."""
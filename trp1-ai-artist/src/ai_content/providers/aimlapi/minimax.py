@@ -115,10 +115,7 @@ class MiniMaxMusicProvider:
                     generation_id=generation_id,
                 )
 
-            # Download audio
-            audio_data = await self.client.download_file(audio_url)
-
-            # Save
+            # Stream audio straight to disk
             if output_path:
                 file_path = Path(output_path)
             else:
@@ -126,8 +123,7 @@ class MiniMaxMusicProvider:
                 timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
                 file_path = output_dir / f"minimax_{timestamp}.mp3"
 
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_bytes(audio_data)
+            await self.client.download_to(audio_url, file_path)
 
             logger.info(f"✅ MiniMax: Saved to {file_path}")
 
@@ -136,7 +132,6 @@ class MiniMaxMusicProvider:
                 provider=self.name,
                 content_type="music",
                 file_path=file_path,
-                data=audio_data,
                 generation_id=generation_id,
                 metadata={
                     "prompt": prompt,
@@ -1,9 +1,28 @@
 """Google providers module."""
 
-# Import providers to trigger registration
-from ai_content.providers.google.lyria import GoogleLyriaProvider
-from ai_content.providers.google.veo import GoogleVeoProvider
-from ai_content.providers.google.imagen import GoogleImagenProvider
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ai_content.providers.google.lyria import GoogleLyriaProvider
+    from ai_content.providers.google.veo import GoogleVeoProvider
+    from ai_content.providers.google.imagen import GoogleImagenProvider
+
+# Imported on first access, so using one Google provider doesn't load the others
+_LAZY = {
+    "GoogleLyriaProvider": "ai_content.providers.google.lyria",
+    "GoogleVeoProvider": "ai_content.providers.google.veo",
+    "GoogleImagenProvider": "ai_content.providers.google.imagen",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "GoogleLyriaProvider",
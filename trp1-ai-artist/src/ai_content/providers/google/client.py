@@ -0,0 +1,32 @@
+"""
+Shared Google GenAI client.
+
+Imagen and Veo (and Lyria, on its own API version) would otherwise each
+create a genai.Client with its own HTTP connection pool. Sharing one
+client per (API key, API version) lets parallel pipeline calls reuse
+TCP/TLS connections to the Gemini API host.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8)
+def get_genai_client(api_key: str, api_version: str | None = None):
+    """
+    Get the shared genai.Client for an API key and version.
+
+    Args:
+        api_key: Google API key
+        api_version: API version override (e.g. "v1alpha" for Lyria)
+
+    Returns:
+        google.genai.Client
+
+    Raises:
+        ImportError: If google-genai is not installed
+    """
+    from google import genai
+
+    if api_version:
+        return genai.Client(api_key=api_key, http_options={"api_version": api_version})
+    return genai.Client(api_key=api_key)
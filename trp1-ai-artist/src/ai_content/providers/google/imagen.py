@@ -15,6 +15,7 @@ from ai_content.core.exceptions import (
     AuthenticationError,
 )
 from ai_content.config import get_settings
+from ai_content.providers.google.client import get_genai_client
 
 logger = logging.getLogger(__name__)
 
@@ -47,12 +48,10 @@ class GoogleImagenProvider:
         """Lazy-load the Google GenAI client."""
         if self._client is None:
             try:
-                from google import genai
-
                 api_key = self.settings.api_key
                 if not api_key:
                     raise AuthenticationError("imagen")
-                self._client = genai.Client(api_key=api_key)
+                self._client = get_genai_client(api_key)
             except ImportError:
                 raise ProviderError(
                     "imagen",
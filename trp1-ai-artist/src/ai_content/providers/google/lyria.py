@@ -17,6 +17,7 @@ from ai_content.core.exceptions import (
     GenerationError,
 )
 from ai_content.config import get_settings
+from ai_content.providers.google.client import get_genai_client
 
 logger = logging.getLogger(__name__)
 
@@ -54,17 +55,12 @@ class GoogleLyriaProvider:
         """Lazy-load the Google GenAI client."""
         if self._client is None:
             try:
-                from google import genai
-
                 api_key = self.settings.api_key
                 if not api_key:
                     raise AuthenticationError("lyria")
                 # Lyria RealTime requires v1alpha API version
                 # https://ai.google.dev/gemini-api/docs/music-generation
-                self._client = genai.Client(
-                    api_key=api_key,
-                    http_options={"api_version": "v1alpha"},
-                )
+                self._client = get_genai_client(api_key, api_version="v1alpha")
             except ImportError:
                 raise ProviderError(
                     "lyria",
@@ -100,7 +96,9 @@ class GoogleLyriaProvider:
         if lyrics:
             logger.warning("Lyria does not support vocals/lyrics. Ignoring lyrics parameter.")
 
-        audio_chunks: list[bytes] = []
+        # Accumulate into one growing buffer rather than a list of chunks
+        # joined at the end, which would copy every byte a second time
+        audio_data = bytearray()
         capture_done = asyncio.Event()
         chunk_count = 0
 
@@ -113,7 +111,7 @@ class GoogleLyriaProvider:
                         if hasattr(message.server_content, "audio_chunks"):
                             for chunk in message.server_content.audio_chunks:
                                 if hasattr(chunk, "data") and chunk.data:
-                                    audio_chunks.append(chunk.data)
+                                    audio_data.extend(chunk.data)
                                     chunk_count += 1
                     await asyncio.sleep(0)  # Yield control
                     if capture_done.is_set():
@@ -171,7 +169,7 @@ class GoogleLyriaProvider:
                 error=str(e),
             )
 
-        if not audio_chunks:
+        if not audio_data:
             return GenerationResult(
                 success=False,
                 provider=self.name,
@@ -179,9 +177,6 @@ class GoogleLyriaProvider:
                 error="No audio data received",
             )
 
-        # Combine audio chunks
-        audio_data = b"".join(audio_chunks)
-
         # Save if output path provided
         file_path = None
         if output_path:
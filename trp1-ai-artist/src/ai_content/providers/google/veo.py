@@ -17,6 +17,8 @@ from ai_content.core.exceptions import (
     TimeoutError,
 )
 from ai_content.config import get_settings
+from ai_content.providers.google.client import get_genai_client
+from ai_content.utils.http import get_shared_client
 
 logger = logging.getLogger(__name__)
 
@@ -52,12 +54,10 @@ class GoogleVeoProvider:
         """Lazy-load the Google GenAI client."""
         if self._client is None:
             try:
-                from google import genai
-
                 api_key = self.settings.api_key
                 if not api_key:
                     raise AuthenticationError("veo")
-                self._client = genai.Client(api_key=api_key)
+                self._client = get_genai_client(api_key)
             except ImportError:
                 raise ProviderError(
                     "veo",
@@ -83,7 +83,7 @@ class GoogleVeoProvider:
             prompt: Scene description
             aspect_ratio: "16:9", "9:16", or "1:1"
             duration_seconds: Currently ignored (model determines)
-            first_frame_url: Optional image URL to animate
+            first_frame_url: Optional image URL or local path to animate
             output_path: Where to save the video
             use_fast_model: Use faster but lower quality model
             person_generation: "allow_adult" or "dont_allow"
@@ -176,10 +176,10 @@ class GoogleVeoProvider:
             )
 
     async def _fetch_image(self, url: str) -> bytes:
-        """Fetch image data from URL."""
-        import httpx
+        """Fetch image data from a URL or local file (e.g. a generated keyframe)."""
+        if not url.startswith(("http://", "https://")):
+            return await asyncio.to_thread(Path(url).read_bytes)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            return response.content
+        response = await get_shared_client().get(url)
+        response.raise_for_status()
+        return response.content
@@ -6,8 +6,8 @@ Uses JWT authentication for the KlingAI API.
 
 import asyncio
 import logging
+import random
 import time
-from datetime import datetime, timezone
 from pathlib import Path
 
 import httpx
@@ -20,9 +20,17 @@ from ai_content.core.exceptions import (
     AuthenticationError,
 )
 from ai_content.config import get_settings
+from ai_content.utils.file_handlers import ensure_dir_cached
+from ai_content.utils.http import HTTP2_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+# Consecutive poll failures after which _poll_for_completion gives up
+_MAX_POLL_ERRORS = 5
+
+# task_id -> future for the video URL (None on failure), set by handle_callback()
+_callbacks: dict[str, asyncio.Future] = {}
+
 
 @ProviderRegistry.register_video("kling")
 class KlingDirectProvider:
@@ -49,19 +57,55 @@ class KlingDirectProvider:
 
     def __init__(self):
         self.settings = get_settings().kling
+        self._http_client: httpx.AsyncClient | None = None
+        self._token: str | None = None
+        self._token_exp = 0
+
+    async def __aenter__(self) -> "KlingDirectProvider":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get or create the HTTP client, shared by submit, polls and download.
+
+        Auth headers are added per request, since the JWT expires.
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                base_url=self.settings.base_url,
+                timeout=httpx.Timeout(60.0, connect=10.0),
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+                http2=HTTP2_AVAILABLE,
+            )
+        return self._http_client
+
+    async def close(self):
+        """Close the HTTP client."""
+        if self._http_client and not self._http_client.is_closed:
+            await self._http_client.aclose()
+            self._http_client = None
 
     def _generate_token(self) -> str:
-        """Generate JWT token for authentication."""
+        """Generate JWT token for authentication, reusing it until a minute before expiry."""
+        now = int(time.time())
+        if self._token and now < self._token_exp - 60:
+            return self._token
+
         if not self.settings.api_key or not self.settings.secret_key:
             raise AuthenticationError("kling")
 
         payload = {
             "iss": self.settings.api_key,
-            "exp": int(time.time()) + 1800,  # 30 minutes
-            "nbf": int(time.time()) - 5,
+            "exp": now + 1800,  # 30 minutes
+            "nbf": now - 5,
         }
 
-        return jwt.encode(payload, self.settings.secret_key, algorithm="HS256")
+        self._token = jwt.encode(payload, self.settings.secret_key, algorithm="HS256")
+        self._token_exp = payload["exp"]
+        return self._token
 
     @property
     def headers(self) -> dict[str, str]:
@@ -80,6 +124,7 @@ class KlingDirectProvider:
         first_frame_url: str | None = None,
         output_path: str | None = None,
         mode: str = "std",
+        callback_url: str | None = None,
     ) -> GenerationResult:
         """
         Generate video using KlingAI v2.1-master.
@@ -91,6 +136,10 @@ class KlingDirectProvider:
             first_frame_url: Optional image URL for image-to-video
             output_path: Where to save the video
             mode: "std" (standard) or "pro"
+            callback_url: URL Kling notifies when the task finishes; its
+                handler must pass the request body to handle_callback().
+                Replaces polling, which is only used if no callback arrives
+                within the wait budget.
         """
         logger.info(f"🎬 KlingAI: Generating video (5-14 min expected)")
         logger.debug(f"   Prompt: {prompt[:50]}...")
@@ -98,9 +147,9 @@ class KlingDirectProvider:
         try:
             # Determine endpoint
             if first_frame_url:
-                endpoint = f"{self.settings.base_url}/v1/videos/image2video"
+                endpoint = "/v1/videos/image2video"
             else:
-                endpoint = f"{self.settings.base_url}/v1/videos/text2video"
+                endpoint = "/v1/videos/text2video"
 
             # Build payload
             payload = {
@@ -113,16 +162,18 @@ class KlingDirectProvider:
 
             if first_frame_url:
                 payload["image_url"] = first_frame_url
+            if callback_url:
+                payload["callback_url"] = callback_url
 
             # Submit generation
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    endpoint,
-                    json=payload,
-                    headers=self.headers,
-                )
-                response.raise_for_status()
-                result = response.json()
+            client = await self._get_client()
+            response = await client.post(
+                endpoint,
+                json=payload,
+                headers=self.headers,
+            )
+            response.raise_for_status()
+            result = response.json()
 
             task_id = result.get("data", {}).get("task_id")
             if not task_id:
@@ -135,8 +186,10 @@ class KlingDirectProvider:
 
             logger.info(f"   Task ID: {task_id}")
 
-            # Poll for completion
-            video_url = await self._poll_for_completion(task_id)
+            if callback_url:
+                video_url = await self._wait_for_callback(task_id)
+            else:
+                video_url = await self._poll_for_completion(task_id)
 
             if not video_url:
                 return GenerationResult(
@@ -147,22 +200,20 @@ class KlingDirectProvider:
                     generation_id=task_id,
                 )
 
-            # Download video
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.get(video_url)
-                response.raise_for_status()
-                video_data = response.content
-
-            # Save
             if output_path:
                 file_path = Path(output_path)
             else:
                 output_dir = get_settings().output_dir
-                timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+                timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
                 file_path = output_dir / f"kling_{timestamp}.mp4"
+            ensure_dir_cached(file_path.parent)
 
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_bytes(video_data)
+            # Stream the video to disk (absolute URL, so base_url doesn't apply)
+            async with client.stream("GET", video_url, timeout=120.0) as response:
+                response.raise_for_status()
+                with open(file_path, "wb") as f:
+                    async for chunk in response.aiter_bytes(1 << 16):
+                        f.write(chunk)
 
             logger.info(f"✅ KlingAI: Saved to {file_path}")
 
@@ -171,7 +222,6 @@ class KlingDirectProvider:
                 provider=self.name,
                 content_type="video",
                 file_path=file_path,
-                data=video_data,
                 generation_id=task_id,
                 metadata={
                     "aspect_ratio": aspect_ratio,
@@ -189,19 +239,79 @@ class KlingDirectProvider:
                 error=str(e),
             )
 
+    @staticmethod
+    def handle_callback(body: dict) -> bool:
+        """
+        Deliver a Kling task callback to the generate() call waiting on it.
+
+        Call this from the web handler behind callback_url, in the same
+        event loop as generate().
+
+        Args:
+            body: Parsed JSON body of the callback request
+
+        Returns:
+            Whether a waiting generation was resolved
+        """
+        data = body.get("data", body)
+        task_status = data.get("task_status")
+        future = _callbacks.get(data.get("task_id"))
+        if future is None or future.done() or task_status not in ("succeed", "failed"):
+            return False
+
+        videos = data.get("task_result", {}).get("videos", [])
+        future.set_result(videos[0].get("url") if task_status == "succeed" and videos else None)
+        return True
+
+    async def _wait_for_callback(self, task_id: str) -> str | None:
+        """Wait for handle_callback() to report the task, falling back to polling."""
+        budget = self.settings.max_poll_attempts * self.settings.poll_interval
+        future = _callbacks[task_id] = asyncio.get_running_loop().create_future()
+        logger.info("   Waiting for callback (up to %ss)", budget)
+        try:
+            return await asyncio.wait_for(future, budget)
+        except TimeoutError:
+            logger.warning("   ⚠️ No callback received, polling instead")
+            return await self._poll_for_completion(task_id)
+        finally:
+            _callbacks.pop(task_id, None)
+
     async def _poll_for_completion(self, task_id: str) -> str | None:
-        """Poll until video is ready."""
-        status_url = f"{self.settings.base_url}/v1/videos/text2video/{task_id}"
+        """
+        Poll until video is ready.
+
+        The delay between polls starts at poll_interval and backs off to
+        max_poll_interval (with jitter); a 429's Retry-After takes
+        precedence. The total wait is bounded by the same budget as fixed
+        interval polling: max_poll_attempts * poll_interval.
 
-        for attempt in range(self.settings.max_poll_attempts):
+        Errors are handled by kind: a 401/403 re-signs the token and retries
+        at once, a 5xx retries after poll_interval, and polling gives up
+        after _MAX_POLL_ERRORS consecutive errors.
+        """
+        status_url = f"/v1/videos/text2video/{task_id}"
+        client = await self._get_client()
+
+        settings = self.settings
+        deadline = time.monotonic() + settings.max_poll_attempts * settings.poll_interval
+        delay = float(settings.poll_interval)
+        attempt = 0
+        errors = 0
+        token_refreshed = False
+
+        while True:
+            attempt += 1
+            wait = None
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.get(
-                        status_url,
-                        headers=self.headers,
-                    )
-                    response.raise_for_status()
-                    status = response.json()
+                response = await client.get(
+                    status_url,
+                    headers=self.headers,
+                    timeout=30.0,
+                )
+                response.raise_for_status()
+                status = response.json()
+                errors = 0
+                token_refreshed = False
 
                 data = status.get("data", {})
                 task_status = data.get("task_status", "")
@@ -216,13 +326,33 @@ class KlingDirectProvider:
                     error = data.get("task_status_msg", "Unknown error")
                     raise ProviderError("kling", error)
 
-                logger.debug(
-                    f"   Poll {attempt + 1}/{self.settings.max_poll_attempts}: {task_status}"
-                )
+                logger.debug("   Poll %s: %s, next in %.0fs", attempt, task_status, delay)
 
             except httpx.HTTPError as e:
-                logger.warning(f"   Poll error: {e}")
-
-            await asyncio.sleep(self.settings.poll_interval)
+                errors += 1
+                logger.warning(f"   Poll error ({errors}/{_MAX_POLL_ERRORS}): {e}")
+                if errors >= _MAX_POLL_ERRORS:
+                    return None
 
-        return None
+                code = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None
+                if code in (401, 403):
+                    if token_refreshed:
+                        # A fresh token was rejected too; waiting won't help
+                        raise AuthenticationError("kling") from e
+                    # Token expired or revoked: re-sign on the next request
+                    self._token = None
+                    token_refreshed = True
+                    wait = 0.0
+                elif code == 429:
+                    retry_after = e.response.headers.get("Retry-After", "")
+                    wait = float(retry_after) if retry_after.isdigit() else None
+                elif code is not None and code >= 500:
+                    wait = float(settings.poll_interval)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            if wait is None:
+                wait = delay + random.uniform(0, delay * 0.1)
+                delay = min(delay * 1.5, settings.max_poll_interval)
+            await asyncio.sleep(min(wait, remaining))
@@ -18,11 +18,17 @@ from ai_content.utils.file_handlers import (
     download_to_bytes,
     generate_output_path,
     ensure_dir,
+    ensure_dir_cached,
     copy_file,
+    acopy_file,
     get_file_size_mb,
     cleanup_files,
+    acleanup_files,
     TempFileManager,
 )
+from ai_content.utils.event_loop import install_uvloop
+from ai_content.utils.async_utils import bounded_as_completed
+from ai_content.utils.http import HTTP2_AVAILABLE, get_shared_client
 
 __all__ = [
     # Retry
@@ -41,8 +47,18 @@ __all__ = [
     "download_to_bytes",
     "generate_output_path",
     "ensure_dir",
+    "ensure_dir_cached",
     "copy_file",
+    "acopy_file",
     "get_file_size_mb",
     "cleanup_files",
+    "acleanup_files",
     "TempFileManager",
+    # Event loop
+    "install_uvloop",
+    # Async
+    "bounded_as_completed",
+    # HTTP
+    "HTTP2_AVAILABLE",
+    "get_shared_client",
 ]
@@ -0,0 +1,52 @@
+"""
+Async helpers.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Iterable
+from itertools import islice
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+async def bounded_as_completed(
+    aws: Iterable[Awaitable[T]],
+    limit: int,
+) -> AsyncIterator[T]:
+    """
+    Run awaitables with at most ``limit`` in flight, yielding results as they finish.
+
+    Awaitables are pulled from ``aws`` lazily, so memory stays bounded by
+    ``limit`` even for very long (or generated) inputs. If one raises, the
+    exception propagates from the iteration and the remaining tasks are
+    cancelled.
+
+    Tasks are only cancelled when the generator is closed. A consumer that
+    may stop early (``break``, an exception, cancellation) should wrap it in
+    ``contextlib.aclosing`` so in-flight work stops right away instead of
+    whenever the generator is garbage-collected.
+
+    Example:
+        >>> async with aclosing(bounded_as_completed((fetch(u) for u in urls), 8)) as results:
+        ...     async for result in results:
+        ...         print(result)
+    """
+    it = iter(aws)
+    pending = {asyncio.ensure_future(aw) for aw in islice(it, limit)}
+    done: set[asyncio.Future[T]] = set()
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # Refill the freed slots before handing results back
+            pending.update(asyncio.ensure_future(aw) for aw in islice(it, len(done)))
+            while done:
+                yield done.pop().result()
+    finally:
+        for task in pending:
+            task.cancel()
+        # Finished tasks that were never yielded (after a failure or an early
+        # stop): retrieve their exceptions so asyncio doesn't log them
+        for task in done:
+            if not task.cancelled():
+                task.exception()
@@ -0,0 +1,44 @@
+"""
+Event loop setup.
+
+Uses uvloop, a libuv-based event loop, when it is installed.
+"""
+
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+_installed = False
+
+
+def install_uvloop() -> bool:
+    """
+    Make uvloop the event loop for subsequent ``asyncio.run`` calls.
+
+    Safe to call repeatedly. Does nothing when uvloop isn't installed or
+    when called from inside a running loop (notebooks, ASGI servers),
+    since the host already owns its loop.
+
+    Returns:
+        True if uvloop is (now) the event loop policy
+    """
+    global _installed
+    if _installed:
+        return True
+
+    try:
+        asyncio.get_running_loop()
+        return False
+    except RuntimeError:
+        pass
+
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    _installed = True
+    logger.debug("Using uvloop event loop")
+    return True
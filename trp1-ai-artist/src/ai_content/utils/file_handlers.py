@@ -7,23 +7,28 @@ Download, upload, and manage content files.
 import asyncio
 import logging
 import shutil
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 from typing import BinaryIO
 
 import httpx
 
 from ai_content.core.exceptions import ProviderError
+from ai_content.utils.http import get_shared_client
 
 logger = logging.getLogger(__name__)
 
+# Directories already created by ensure_dir_cached() in this process
+_ensured_dirs: set[Path] = set()
+
 
 async def download_file(
     url: str,
     output_path: Path | str,
     *,
     timeout: float = 120.0,
-    chunk_size: int = 8192,
+    chunk_size: int = 65536,
+    client: httpx.AsyncClient | None = None,
 ) -> Path:
     """
     Download a file from URL.
@@ -33,6 +38,7 @@ async def download_file(
         output_path: Destination path
         timeout: Request timeout in seconds
         chunk_size: Download chunk size
+        client: HTTP client to use (default: a shared pooled client)
 
     Returns:
         Path to downloaded file
@@ -41,18 +47,23 @@ async def download_file(
         ProviderError: If download fails
     """
     output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_dir_cached(output_path.parent)
 
     logger.info(f"📥 Downloading: {url[:50]}...")
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            async with client.stream("GET", url) as response:
-                response.raise_for_status()
+        client = client or get_shared_client()
+        async with client.stream("GET", url, timeout=timeout) as response:
+            response.raise_for_status()
 
-                with open(output_path, "wb") as f:
-                    async for chunk in response.aiter_bytes(chunk_size):
-                        f.write(chunk)
+            # Writes go to a worker thread so concurrent downloads don't
+            # block the event loop on disk I/O
+            f = await asyncio.to_thread(open, output_path, "wb")
+            try:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    await asyncio.to_thread(f.write, chunk)
+            finally:
+                await asyncio.to_thread(f.close)
 
         size_mb = output_path.stat().st_size / (1024 * 1024)
         logger.info(f"   Downloaded: {output_path.name} ({size_mb:.2f} MB)")
@@ -66,6 +77,7 @@ async def download_to_bytes(
     url: str,
     *,
     timeout: float = 120.0,
+    client: httpx.AsyncClient | None = None,
 ) -> bytes:
     """
     Download a file to memory.
@@ -73,14 +85,15 @@ async def download_to_bytes(
     Args:
         url: Source URL
         timeout: Request timeout
+        client: HTTP client to use (default: a shared pooled client)
 
     Returns:
         File contents as bytes
     """
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.get(url)
-        response.raise_for_status()
-        return response.content
+    client = client or get_shared_client()
+    response = await client.get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.content
 
 
 def generate_output_path(
@@ -102,14 +115,13 @@ def generate_output_path(
     Returns:
         Generated path
     """
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    output_dir = ensure_dir_cached(Path(output_dir))
 
     if not extension.startswith("."):
         extension = f".{extension}"
 
     if timestamp:
-        ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        ts = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
         filename = f"{prefix}_{ts}{extension}"
     else:
         filename = f"{prefix}{extension}"
@@ -124,15 +136,35 @@ def ensure_dir(path: Path | str) -> Path:
     return path
 
 
+def ensure_dir_cached(path: Path) -> Path:
+    """
+    Create directory once per process.
+
+    Skips the mkdir call for directories already created here, which
+    saves a syscall per file when writing many outputs to one directory.
+    A directory removed after it was cached is not recreated; use
+    ensure_dir() for paths that may be deleted (e.g. temp dirs).
+    """
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+    return path
+
+
 def copy_file(src: Path | str, dst: Path | str) -> Path:
     """Copy a file, creating destination directory if needed."""
     src = Path(src)
     dst = Path(dst)
-    dst.parent.mkdir(parents=True, exist_ok=True)
+    ensure_dir_cached(dst.parent)
     shutil.copy2(src, dst)
     return dst
 
 
+async def acopy_file(src: Path | str, dst: Path | str) -> Path:
+    """Async copy_file; the copy runs in a worker thread so large files don't block the loop."""
+    return await asyncio.to_thread(copy_file, src, dst)
+
+
 def get_file_size_mb(path: Path | str) -> float:
     """Get file size in megabytes."""
     return Path(path).stat().st_size / (1024 * 1024)
@@ -154,6 +186,11 @@ def cleanup_files(*paths: Path | str) -> None:
             logger.warning(f"Failed to cleanup {path}: {e}")
 
 
+async def acleanup_files(*paths: Path | str) -> None:
+    """Async cleanup_files; deletes the files concurrently in worker threads."""
+    await asyncio.gather(*(asyncio.to_thread(cleanup_files, path) for path in paths))
+
+
 class TempFileManager:
     """
     Context manager for temporary files.
@@ -185,15 +222,9 @@ class TempFileManager:
         return self
 
     async def __aexit__(self, *args) -> None:
-        for path in self.files:
-            try:
-                if path.exists():
-                    path.unlink()
-            except Exception:
-                pass
-
-        try:
-            if self.base_dir.exists():
-                shutil.rmtree(self.base_dir)
-        except Exception:
-            pass
+        # Created files live under base_dir, so one tree removal covers them
+        await asyncio.to_thread(shutil.rmtree, self.base_dir, ignore_errors=True)
+        # Forget removed dirs so a reused base_dir is created again
+        _ensured_dirs.difference_update(
+            [p for p in _ensured_dirs if p == self.base_dir or self.base_dir in p.parents]
+        )
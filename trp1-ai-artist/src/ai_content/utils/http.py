@@ -0,0 +1,37 @@
+"""
+Shared HTTP client helpers.
+"""
+
+import asyncio
+import importlib.util
+
+import httpx
+
+# httpx only speaks HTTP/2 with the optional h2 package (the "perf" extra)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Clients can't cross event loops, so the shared one is tied to the loop that made it
+_shared_client: tuple[asyncio.AbstractEventLoop, httpx.AsyncClient] | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """
+    Get the pooled HTTP client for the running event loop.
+
+    For unauthenticated requests such as media downloads; clients that
+    need a base URL or auth headers should keep their own.
+
+    Example:
+        >>> client = get_shared_client()
+        >>> response = await client.get(url, timeout=120.0)
+    """
+    global _shared_client
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client[0] is not loop or _shared_client[1].is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(300.0, connect=10.0),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            http2=HTTP2_AVAILABLE,
+        )
+        _shared_client = (loop, client)
+    return _shared_client[1]
@@ -7,12 +7,14 @@ following AI music generation best practices.
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class StructuredLyrics:
-    """Parsed lyrics with structure."""
+    """Parsed lyrics with structure (frozen, since parse results are cached)."""
 
     raw: str
     structured: str
@@ -36,6 +38,9 @@ STYLE_HEADERS = {
     "folk": "[Folk, Intimate Vocal, Acoustic Warmth]",
 }
 
+# Section kind named in a tag line such as "[Verse 2]" or "[Pre-Chorus]"
+_TAG_KIND = re.compile(r"verse|chorus|bridge", re.IGNORECASE)
+
 
 def parse_lyrics_with_structure(
     raw_lyrics: str,
@@ -63,101 +68,82 @@ def parse_lyrics_with_structure(
         ... ''', style="pop")
         >>> print(lyrics.structured)
     """
-    lines = raw_lyrics.strip().split("\n")
-    structured = []
+    return _parse_lyrics(raw_lyrics, style, auto_detect_structure)
+
 
+@lru_cache(maxsize=128)
+def _parse_lyrics(
+    raw_lyrics: str,
+    style: str,
+    auto_detect_structure: bool,
+) -> StructuredLyrics:
+    """parse_lyrics_with_structure; cached, so retries and previews don't re-parse."""
     # Add style header
     style_header = STYLE_HEADERS.get(style.lower(), STYLE_HEADERS["pop"])
-    structured.append(style_header)
-    structured.append("")
+    # One pre-joined string per section; sections are separated by blank lines
+    structured = [style_header]
 
     verse_count = 0
     chorus_count = 0
     has_bridge = False
 
-    # Track seen lines for chorus detection
+    # Track seen lines (lowercased, substantial ones only) for chorus detection
     seen_lines: set[str] = set()
-    line_groups: list[list[str]] = []
-    current_group: list[str] = []
-
-    # First pass: group lines by blank line separators
-    for line in lines:
-        line = line.strip()
-        if not line:
-            if current_group:
-                line_groups.append(current_group)
-                current_group = []
-        else:
-            current_group.append(line)
-
-    if current_group:
-        line_groups.append(current_group)
+    group: list[str] = []
 
-    # Second pass: classify groups and add structure tags
-    for group in line_groups:
+    # Single pass: collect lines into a group until a blank line, then tag the
+    # group and flush it. The trailing "" flushes the last group.
+    for line in chain((line.strip() for line in raw_lyrics.split("\n")), ("",)):
+        if line:
+            group.append(line)
+            continue
         if not group:
             continue
 
         # Check if group already has structure tags
+        tag = None
         first_line = group[0]
         if first_line.startswith("[") and first_line.endswith("]"):
-            # Already has a tag, keep as-is
-            structured.extend(group)
-            structured.append("")
-
-            # Count for stats
-            tag_lower = first_line.lower()
-            if "verse" in tag_lower:
+            # Already has a tag, keep as-is; count for stats
+            match = _TAG_KIND.search(first_line)
+            kind = match.group(0).lower() if match else None
+            if kind == "verse":
                 verse_count += 1
-            elif "chorus" in tag_lower:
+            elif kind == "chorus":
                 chorus_count += 1
-            elif "bridge" in tag_lower:
+            elif kind == "bridge":
                 has_bridge = True
-            continue
-
-        if auto_detect_structure:
-            # Check if this group matches any previous lines (likely chorus)
+        elif auto_detect_structure:
+            # Check if this group contains any previous line (likely chorus);
+            # a substring match, so "Oh <line> baby" still counts as a repeat
             group_text = " ".join(group).lower()
-            is_repeat = any(
-                line.lower() in group_text
-                for line in seen_lines
-                if len(line) > 10  # Only check substantial lines
-            )
+            is_repeat = any(line in group_text for line in seen_lines)
 
             if is_repeat and chorus_count == 0:
                 # First repeat is likely chorus
                 chorus_count += 1
-                structured.append(f"[Chorus]")
+                tag = "[Chorus]"
             elif is_repeat:
                 chorus_count += 1
-                structured.append(f"[Chorus {chorus_count}]")
+                tag = f"[Chorus {chorus_count}]"
             else:
                 verse_count += 1
-                if verse_count == 1:
-                    structured.append("[Verse 1]")
-                else:
-                    structured.append(f"[Verse {verse_count}]")
+                tag = f"[Verse {verse_count}]"
 
             # Add lines to seen set
-            for line in group:
-                if len(line) > 5:
-                    seen_lines.add(line)
+            seen_lines.update(line.lower() for line in group if len(line) > 10)
         else:
             # No auto-detection, just add verse tags
             verse_count += 1
-            structured.append(f"[Verse {verse_count}]")
+            tag = f"[Verse {verse_count}]"
 
-        structured.extend(group)
-        structured.append("")
-
-    # Add outro hint if needed
-    if len(line_groups) > 4 and not has_bridge:
-        # Could add bridge detection here
-        pass
+        body = "\n".join(group)
+        structured.append(f"{tag}\n{body}" if tag else body)
+        group = []
 
     return StructuredLyrics(
         raw=raw_lyrics,
-        structured="\n".join(structured),
+        structured="\n\n".join(structured) + "\n",
         style_header=style_header,
         verse_count=verse_count,
         chorus_count=chorus_count,
@@ -182,17 +168,20 @@ def add_vocal_directions(
         ...     "Chorus": "(powerful, belt)",
         ... })
     """
-    if directions is None:
+    if not directions:
         return lyrics
 
-    result = lyrics
-    for section, direction in directions.items():
-        # Find section tag and add direction after it
-        pattern = rf"(\[{re.escape(section)}\])"
-        replacement = rf"\1\n{direction}"
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-
-    return result
+    # One pass over the text for all sections: match any section tag and
+    # add its direction after it
+    by_section = {section.lower(): direction for section, direction in directions.items()}
+    pattern = re.compile(
+        r"\[(" + "|".join(map(re.escape, directions)) + r")\]",
+        re.IGNORECASE,
+    )
+    return pattern.sub(
+        lambda match: f"{match.group(0)}\n{by_section[match.group(1).lower()]}",
+        lyrics,
+    )
 
 
 def extract_lyrics_sections(lyrics: str) -> dict[str, list[str]]:
@@ -4,16 +4,38 @@ Retry utilities with exponential backoff.
 
 import asyncio
 import logging
+import random
 from functools import wraps
 from typing import TypeVar, Callable, Any
 
+import httpx
+
+from ai_content.core.exceptions import RateLimitError
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
 
+# Transient failures: connection problems, timeouts, HTTP errors (filtered
+# by status below), and rate limiting
+_TRANSIENT_EXCEPTIONS: tuple[type[Exception], ...] = (
+    httpx.TransportError,
+    httpx.HTTPStatusError,
+    asyncio.TimeoutError,
+    RateLimitError,
+)
+
+
 class RetryConfig:
-    """Configuration for retry behavior."""
+    """
+    Configuration for retry behavior.
+
+    Exceptions carrying an HTTP response (e.g. httpx.HTTPStatusError) are
+    only retried when the status is in retry_on_status, so client errors
+    like 400/401 fail immediately. Delays are randomized by +/- jitter
+    (a fraction of the delay) so concurrent callers don't retry in step.
+    """
 
     def __init__(
         self,
@@ -21,18 +43,67 @@ class RetryConfig:
         base_delay: float = 1.0,
         max_delay: float = 60.0,
         exponential_base: float = 2.0,
-        retryable_exceptions: tuple[type[Exception], ...] = (Exception,),
+        retryable_exceptions: tuple[type[Exception], ...] = _TRANSIENT_EXCEPTIONS,
+        retry_on_status: tuple[int, ...] = (429, 502, 503, 504),
+        jitter: float = 0.5,
     ):
         self.max_attempts = max_attempts
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.retryable_exceptions = retryable_exceptions
+        self.retry_on_status = retry_on_status
+        self.jitter = jitter
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Whether a caught retryable exception should actually be retried."""
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+        return status is None or status in self.retry_on_status
 
 
 DEFAULT_RETRY_CONFIG = RetryConfig()
 
 
+def _compute_delay(config: RetryConfig, attempt: int, error: Exception) -> float:
+    """Delay before the next attempt: exponential backoff, spread by jitter."""
+    delay = min(
+        config.base_delay * (config.exponential_base ** (attempt - 1)),
+        config.max_delay,
+    )
+    delay *= 1 + random.uniform(-config.jitter, config.jitter)
+    if isinstance(error, RateLimitError) and error.retry_after:
+        delay = max(delay, error.retry_after)
+    return delay
+
+
+async def _call_with_retry(
+    func: Callable[..., T],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    config: RetryConfig,
+) -> T:
+    """Retry loop shared by with_retry and retry_async."""
+    for attempt in range(1, config.max_attempts + 1):
+        try:
+            return await func(*args, **kwargs)
+        except config.retryable_exceptions as e:
+            if not config.is_retryable(e):
+                raise
+
+            name = getattr(func, "__name__", repr(func))
+            if attempt == config.max_attempts:
+                logger.error(f"{name} failed after {attempt} attempts: {e}")
+                raise
+
+            delay = _compute_delay(config, attempt, e)
+            logger.warning(f"{name} attempt {attempt} failed: {e}. Retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+
+    # Only reached when max_attempts < 1
+    raise RuntimeError("Retry loop exited unexpectedly")
+
+
 def with_retry(
     config: RetryConfig | None = None,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
@@ -50,34 +121,7 @@ def with_retry(
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
-            last_exception: Exception | None = None
-
-            for attempt in range(1, config.max_attempts + 1):
-                try:
-                    return await func(*args, **kwargs)
-                except config.retryable_exceptions as e:
-                    last_exception = e
-
-                    if attempt == config.max_attempts:
-                        logger.error(f"{func.__name__} failed after {attempt} attempts: {e}")
-                        raise
-
-                    # Calculate delay with exponential backoff
-                    delay = min(
-                        config.base_delay * (config.exponential_base ** (attempt - 1)),
-                        config.max_delay,
-                    )
-
-                    logger.warning(
-                        f"{func.__name__} attempt {attempt} failed: {e}. "
-                        f"Retrying in {delay:.1f}s..."
-                    )
-                    await asyncio.sleep(delay)
-
-            # Should never reach here, but for type safety
-            if last_exception:
-                raise last_exception
-            raise RuntimeError("Retry loop exited unexpectedly")
+            return await _call_with_retry(func, args, kwargs, config)
 
         return wrapper
 
@@ -96,11 +140,4 @@ async def retry_async(
     Example:
         >>> result = await retry_async(fetch_data, url, config=RetryConfig(max_attempts=5))
     """
-    if config is None:
-        config = DEFAULT_RETRY_CONFIG
-
-    @with_retry(config)
-    async def wrapped() -> T:
-        return await func(*args, **kwargs)
-
-    return await wrapped()
+    return await _call_with_retry(func, args, kwargs, config or DEFAULT_RETRY_CONFIG)
@@ -0,0 +1,76 @@
+"""Tests for JobTracker's queued inserts."""
+
+import sqlite3
+
+import pytest
+
+from ai_content.core.job_tracker import JobStatus, JobTracker
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = JobTracker(tmp_path / "jobs.db")
+    yield tracker
+    tracker.close()
+
+
+def _create(tracker, job_id="gen-1", prompt="smooth jazz"):
+    return tracker.create_job(
+        generation_id=job_id,
+        provider="minimax",
+        content_type="music",
+        prompt=prompt,
+        command="ai-content music",
+    )
+
+
+def test_created_job_is_readable_immediately(tracker):
+    job = _create(tracker)
+
+    stored = tracker.get_job(job.id)
+
+    assert stored is not None
+    assert stored.prompt == "smooth jazz"
+    assert stored.status == JobStatus.QUEUED
+
+
+def test_duplicate_id_raises_on_next_call(tracker):
+    _create(tracker)
+    _create(tracker, prompt="different prompt")
+
+    with pytest.raises(sqlite3.IntegrityError):
+        tracker.flush()
+
+    # The error is reported once; the first job is kept
+    assert tracker.get_job("gen-1").prompt == "smooth jazz"
+
+
+def test_close_writes_queued_jobs_and_is_idempotent(tmp_path):
+    db_path = tmp_path / "jobs.db"
+    tracker = JobTracker(db_path)
+    _create(tracker)
+
+    tracker.close()
+    tracker.close()
+
+    reopened = JobTracker(db_path)
+    try:
+        assert reopened.get_job("gen-1") is not None
+    finally:
+        reopened.close()
+
+
+def test_get_or_create_sees_queued_insert(tracker):
+    queued = _create(tracker)
+
+    job, created = tracker.get_or_create_job(
+        generation_id="gen-2",
+        provider="minimax",
+        content_type="music",
+        prompt="smooth jazz",
+        command="ai-content music",
+    )
+
+    assert not created
+    assert job.id == queued.id
+    assert tracker.get_job("gen-2") is None
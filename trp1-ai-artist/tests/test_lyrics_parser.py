@@ -0,0 +1,23 @@
+"""Tests for lyrics structure detection."""
+
+from ai_content.utils.lyrics_parser import parse_lyrics_with_structure
+
+
+def test_repeat_detected_when_earlier_line_is_substring():
+    lyrics = "Thinking of you all night long\n\nOh thinking of you all night long baby"
+
+    result = parse_lyrics_with_structure(lyrics, style="pop")
+
+    assert result.verse_count == 1
+    assert result.chorus_count == 1
+    assert "[Verse 1]\nThinking of you all night long" in result.structured
+    assert "[Chorus]\nOh thinking of you all night long baby" in result.structured
+
+
+def test_short_lines_do_not_mark_repeats():
+    lyrics = "la la la\n\nla la la"
+
+    result = parse_lyrics_with_structure(lyrics, style="pop")
+
+    assert result.verse_count == 2
+    assert result.chorus_count == 0